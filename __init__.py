@@ -66,9 +66,16 @@ class DKS_RUV_OT_open_export_directory(bpy.types.Operator):
                 export_dir = _ui_export_directory()
                 try:
                         export_dir.mkdir(parents=True, exist_ok=True)
-                except OSError as exc:
-                        self.report({'ERROR'}, f"Unable to prepare the export folder: {exc}")
-                        return {'CANCELLED'}
+                except OSError:
+                        invalidate = getattr(dks_ruv, "invalidate_export_directory", None)
+                        if callable(invalidate):
+                                invalidate()
+                        export_dir = _ui_export_directory()
+                        try:
+                                export_dir.mkdir(parents=True, exist_ok=True)
+                        except OSError as exc:
+                                self.report({'ERROR'}, f"Unable to prepare the export folder: {exc}")
+                                return {'CANCELLED'}
 
                 try:
                         resolved_path = export_dir.resolve()
@@ -93,6 +100,100 @@ class dks_ruv_addon_prefs(bpy.types.AddonPreferences):
                 default=r"C:\Program Files\Rizom Lab\RizomUV 2025.0\rizomuv.exe",
         )
 
+        option_export_engine : bpy.props.EnumProperty(
+                name="Export Engine",
+                description="How meshes are written for RizomUV",
+                items=(
+                        ('LEAN', "Lean FBX", "Write only geometry, edge smoothing and UV maps with the bridge's own FBX writer (no UV seams)"),
+                        ('BLENDER', "Blender FBX", "Use Blender's full FBX exporter"),
+                ),
+                default='BLENDER',
+        )
+
+        option_fbx_compression : bpy.props.IntProperty(
+                name="FBX Compression",
+                description="Zlib compression level of the lean FBX writer (0 disables compression)",
+                default=1,
+                min=0,
+                max=9,
+        )
+
+        option_background_export : bpy.props.BoolProperty(
+                name="Write in Background",
+                description=(
+                        "Write the FBX file on a worker thread and send it to RizomUV when it is done, "
+                        "so Blender stays responsive during large exports (Lean engine only)"
+                ),
+                default=False,
+        )
+
+        option_dedupe_geometry : bpy.props.BoolProperty(
+                name="Merge Identical Meshes",
+                description=(
+                        "Send only one mesh per group of meshes with identical topology and vertex positions, "
+                        "and copy the resulting UVs to every member on import"
+                ),
+                default=False,
+        )
+
+        option_export_cache_mb : bpy.props.IntProperty(
+                name="Export Cache (MB)",
+                description="Disk budget for reusing exports of unchanged meshes (0 disables the cache)",
+                default=512,
+                min=0,
+                soft_max=8192,
+        )
+
+        option_result_cache : bpy.props.BoolProperty(
+                name="Reuse Known Unwraps",
+                description=(
+                        "Apply UVs returned by RizomUV earlier to meshes with identical geometry "
+                        "instead of sending them to RizomUV again"
+                ),
+                default=False,
+        )
+
+        option_result_cache_mb : bpy.props.IntProperty(
+                name="Result Cache (MB)",
+                description="Disk budget for stored RizomUV unwraps",
+                default=1024,
+                min=1,
+                soft_max=16384,
+        )
+
+        option_batch_workers : bpy.props.IntProperty(
+                name="Batch Workers",
+                description="Number of RizomUV instances started for batch unwrapping from scripts",
+                default=2,
+                min=1,
+                soft_max=16,
+        )
+
+        option_auto_import : bpy.props.BoolProperty(
+                name="Import Automatically",
+                description="Import the UVs as soon as RizomUV saves over the exported file",
+                default=False,
+                update=lambda self, context: dks_ruv.set_auto_import(self.option_auto_import),
+        )
+
+        option_transfer_by_position : bpy.props.BoolProperty(
+                name="Transfer UVs by Position",
+                description=(
+                        "When the mesh returned by RizomUV has a different topology than the original object, "
+                        "for example because modifiers were applied on export, match loops by position instead of "
+                        "cancelling the import"
+                ),
+                default=False,
+        )
+
+        option_import_threads : bpy.props.IntProperty(
+                name="Import Threads",
+                description="Number of threads used to decompress the UV data of RizomUV results",
+                default=4,
+                min=1,
+                max=64,
+        )
+
         # NOTE: Blender may still reference this deprecated property when
         # loading stored preferences from previous versions of the add-on.
         # Keeping the definition avoids attribute errors during registration.
@@ -107,6 +208,57 @@ class dks_ruv_addon_prefs(bpy.types.AddonPreferences):
 
                 box = layout.box()
                 box.prop(self, 'option_ruv_exe')
+                box.prop(self, 'option_export_engine')
+                row = box.row()
+                row.enabled = self.option_export_engine == 'LEAN'
+                row.prop(self, 'option_fbx_compression')
+                row = box.row()
+                row.enabled = self.option_export_engine == 'LEAN'
+                row.prop(self, 'option_background_export')
+                box.prop(self, 'option_dedupe_geometry')
+                box.prop(self, 'option_export_cache_mb')
+                box.prop(self, 'option_import_threads')
+                box.prop(self, 'option_auto_import')
+                box.prop(self, 'option_batch_workers')
+                box.prop(self, 'option_transfer_by_position')
+
+                box = layout.box()
+                box.prop(self, 'option_result_cache')
+                row = box.row(align=True)
+                column = row.column(align=True)
+                column.enabled = self.option_result_cache
+                column.prop(self, 'option_result_cache_mb')
+                row.operator("dks_ruv.clear_result_cache", icon='TRASH')
+                result_store = getattr(dks_ruv, "_result_store", None)
+                if result_store is not None:
+                        box.label(text=f"This session: {result_store.hits} hits, {result_store.misses} misses")
+
+                state_store = getattr(dks_ruv, "_state_store", None)
+                if state_store is not None:
+                        stats = state_store.stats()
+                        box = layout.box()
+                        box.label(text="Diagnostics:")
+                        box.label(text=(
+                                f"Import menu polls: {stats['poll_calls']}, "
+                                f"state file checks: {stats['stat_calls']}, reads: {stats['disk_reads']}"
+                        ))
+                        directory_stats = dks_ruv.export_directory_stats()
+                        box.label(text=(
+                                f"Export folder lookups: {directory_stats['lookups']}, "
+                                f"resolves: {directory_stats['resolves']}, mkdir calls: {directory_stats['mkdir_calls']}"
+                        ))
+                        watcher_stats = dks_ruv.auto_import_stats()
+                        box.label(text=(
+                                f"Result file checks: {watcher_stats['stat_calls']}, "
+                                f"automatic imports: {watcher_stats['imports']}"
+                        ))
+                        link_stats = dks_ruv.link_stats()
+                        if link_stats is not None:
+                                box.label(text=(
+                                        f"RizomUV link: {link_stats['reuses']} reused, {link_stats['connects']} reconnects, "
+                                        f"{link_stats['launches']} launches, mean connect "
+                                        f"{link_stats['mean_connect_ms']:.1f} ms, mean send {link_stats['mean_send_ms']:.1f} ms"
+                                ))
 
                 box = layout.box()
                 box.label(text="Temporary export folder:")
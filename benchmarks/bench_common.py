@@ -0,0 +1,44 @@
+"""Shared setup of the benchmarks that run inside Blender.
+
+Those benchmarks run either with Blender's bundled interpreter::
+
+    blender --background --factory-startup --python benchmarks/<script>.py -- [options]
+
+or with any Python that has the ``bpy`` module installed::
+
+    python benchmarks/<script>.py [options]
+"""
+
+from pathlib import Path
+
+import atexit
+import shutil
+import sys
+import tempfile
+
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "dks_ruv_bridge"
+
+
+def script_args():
+    """Return the command line arguments meant for the benchmark script."""
+
+    return sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+
+
+def enable_addon():
+    """Reset Blender to an empty scene and enable the add-on from this checkout."""
+
+    import addon_utils
+    import bpy
+
+    addon_dir = Path(tempfile.mkdtemp(prefix="dks_ruv_bench_"))
+    atexit.register(shutil.rmtree, addon_dir, ignore_errors=True)
+    (addon_dir / PACKAGE).symlink_to(ROOT, target_is_directory=True)
+    sys.path.insert(0, str(addon_dir))
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon_utils.enable(PACKAGE, default_set=True)
+    bpy.ops.wm.save_as_mainfile(filepath=str(addon_dir / "bench.blend"))
+    return sys.modules[PACKAGE]
@@ -0,0 +1,80 @@
+"""Decode throughput of the FBX reader for different worker counts.
+
+Writes a synthetic scene of ``--objects`` grids with :class:`FBXWriter` and
+times :func:`read_uv_meshes` on it with one up to ``--max-workers`` decoding
+threads. Only NumPy is needed::
+
+    python benchmarks/bench_fbx_decode.py --objects 50 --size 100
+"""
+
+from pathlib import Path
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, ROOT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+dks_ruv_fbx = _load("dks_ruv_fbx")
+sys.path.insert(0, str(ROOT / "tests"))
+from grids import quad_grid  # noqa: E402
+
+
+def grid(name, size, uv_maps, rng):
+    """A ``size`` x ``size`` quad grid with random UV maps."""
+
+    vertices, polygon_sizes, loop_vertices = quad_grid(size, extent=float(size))
+    uv_layers = [(f"UVMap{index}", rng.random(len(loop_vertices) * 2).astype(np.float32)) for index in range(uv_maps)]
+    return dks_ruv_fbx.FBXMesh(name, (size + 1) ** 2, loop_vertices, polygon_sizes, uv_layers, vertices=vertices)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", type=int, default=50)
+    parser.add_argument("--size", type=int, default=100, help="quads per grid side")
+    parser.add_argument("--uv-maps", type=int, default=2)
+    parser.add_argument("--compression", type=int, default=1)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "scene.fbx"
+        writer = dks_ruv_fbx.FBXWriter(compression=args.compression)
+        for index in range(args.objects):
+            writer.add_mesh(grid(f"Grid{index:03d}", args.size, args.uv_maps, rng))
+        size = writer.write(path)
+        loops = args.objects * args.size * args.size * 4
+        print(f"{args.objects} objects, {loops} loops, {args.uv_maps} UV maps, {size / 2 ** 20:.1f} MiB")
+
+        baseline = None
+        for workers in range(1, args.max_workers + 1):
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                dks_ruv_fbx.read_uv_meshes(path, workers=workers)
+                timings.append(time.perf_counter() - start)
+            best = min(timings)
+            baseline = baseline or best
+            print(f"workers={workers:2d}  {best * 1000:8.1f} ms  {loops / best / 1e6:7.2f} M loops/s  "
+                  f"x{baseline / best:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Cost of the Blender importer fallback in scenes with many objects.
+
+Compares the previous approach, which recorded the selection of every object
+in the scene, imported into the user's scene and restored every object
+afterwards, with the current one, which imports into a temporary scene and
+leaves the user's selection alone. See ``bench_common`` for how to run it::
+
+    python benchmarks/bench_import_selection.py --objects 1000 10000 100000
+"""
+
+from pathlib import Path
+
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bench_common  # noqa: E402
+
+import bpy  # noqa: E402
+
+
+FIXTURE = bench_common.ROOT / "tests" / "fixtures" / "blender_mixed.fbx"
+
+
+def build_scene(count, selected):
+    """Fill the scene with ``count`` objects sharing one mesh, ``selected`` of them selected."""
+
+    mesh = bpy.data.meshes.new("Shared")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0)], [], [(0, 1, 2)])
+    collection = bpy.context.scene.collection
+    objects = []
+    for index in range(count):
+        obj = bpy.data.objects.new(f"Object{index:06d}", mesh)
+        collection.objects.link(obj)
+        objects.append(obj)
+    for obj in objects[:selected]:
+        obj.select_set(True)
+    bpy.context.view_layer.objects.active = objects[0]
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+
+def import_full_snapshot(context, filepath):
+    """The previous fallback: snapshot and restore the whole scene around the import."""
+
+    scene = context.scene
+    selection = {obj.name: obj.select_get() for obj in scene.objects}
+    active = context.view_layer.objects.active
+    existing_names = {obj.name_full for obj in bpy.data.objects}
+    bpy.ops.import_scene.fbx(filepath=str(filepath), axis_forward='-Z', axis_up='Y')
+    imported = [obj for obj in bpy.data.objects if obj.name_full not in existing_names]
+    for obj in imported:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for obj in scene.objects:
+        obj.select_set(selection.get(obj.name, False))
+    context.view_layer.objects.active = scene.objects.get(active.name) if active else None
+
+
+def best_of(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--selected", type=int, default=10, help="selected objects per scene")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(bench_common.script_args())
+
+    addon = bench_common.enable_addon()
+    context = bpy.context
+    for count in args.objects:
+        clear_scene()
+        build_scene(count, args.selected)
+        before = best_of(lambda: import_full_snapshot(context, FIXTURE), args.repeat)
+        after = best_of(lambda: addon.dks_ruv._import_fbx(context, FIXTURE), args.repeat)
+        assert len(context.selected_objects) == args.selected
+        print(f"{count:7d} objects  full snapshot {before * 1000:9.1f} ms  "
+              f"temporary scene {after * 1000:7.1f} ms  x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    main()
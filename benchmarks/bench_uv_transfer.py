@@ -0,0 +1,85 @@
+"""UV transfer throughput in loops per second, per-loop versus bulk.
+
+Copies every UV map of a grid onto a second object with the same topology,
+once with the previous per-loop RNA copy and once with the bulk
+``foreach_get``/``foreach_set`` path of ``_copy_uv_layers``. See
+``bench_common`` for how to run it::
+
+    python benchmarks/bench_uv_transfer.py --loops 100000 1000000
+"""
+
+from pathlib import Path
+
+import argparse
+import math
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bench_common  # noqa: E402
+
+import bpy  # noqa: E402
+import numpy as np  # noqa: E402
+
+
+def grid_pair(loops, uv_maps):
+    """Two objects sharing the topology of a quad grid with about ``loops`` corners."""
+
+    side = max(1, int(math.sqrt(loops / 4)))
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=side, y_subdivisions=side)
+    source = bpy.context.active_object
+    mesh = source.data
+    rng = np.random.default_rng(0)
+    while len(mesh.uv_layers) < uv_maps:
+        mesh.uv_layers.new(name=f"UVMap{len(mesh.uv_layers)}")
+    for layer in mesh.uv_layers:
+        layer.data.foreach_set("uv", rng.random(len(mesh.loops) * 2).astype(np.float32))
+    target = bpy.data.objects.new(f"{source.name}_target", mesh.copy())
+    bpy.context.scene.collection.objects.link(target)
+    return source, target
+
+
+def copy_per_loop(source, target):
+    """The previous transfer: one RNA read and write per loop."""
+
+    src_mesh = source.data
+    dst_mesh = target.data
+    while dst_mesh.uv_layers:
+        dst_mesh.uv_layers.remove(dst_mesh.uv_layers[0])
+    for src_layer in src_mesh.uv_layers:
+        dst_layer = dst_mesh.uv_layers.new(name=src_layer.name)
+        for loop_index, src_data in enumerate(src_layer.data):
+            dst_layer.data[loop_index].uv = src_data.uv
+    dst_mesh.update()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--loops", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--uv-maps", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(bench_common.script_args())
+
+    addon = bench_common.enable_addon()
+    dks_ruv = addon.dks_ruv
+    for loops in args.loops:
+        source, target = grid_pair(loops, args.uv_maps)
+        transferred = len(source.data.loops) * len(source.data.uv_layers)
+        rates = []
+        for copy in (copy_per_loop,
+                     lambda source, target: dks_ruv._copy_uv_layers(dks_ruv._fbx_mesh_from_object(source), target)):
+            best = math.inf
+            for _ in range(args.repeat):
+                while target.data.uv_layers:
+                    target.data.uv_layers.remove(target.data.uv_layers[0])
+                start = time.perf_counter()
+                copy(source, target)
+                best = min(best, time.perf_counter() - start)
+            rates.append(transferred / best)
+        print(f"{len(source.data.loops):8d} loops x {args.uv_maps} UV maps  per-loop {rates[0] / 1e6:7.2f} M loops/s  "
+              f"bulk {rates[1] / 1e6:8.2f} M loops/s  x{rates[1] / rates[0]:.0f}")
+
+
+if __name__ == "__main__":
+    main()
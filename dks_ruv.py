@@ -20,14 +20,32 @@ from __future__ import annotations
 
 from pathlib import Path
 from subprocess import Popen
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+import copy
+import hashlib
+import io
 import json
+import math
+import os
+import shutil
 import tempfile
+import threading
+import time
 
 import bpy
+import numpy as np
 from bpy.types import Object
 from bpy.utils import register_class, unregister_class
+from bpy_extras.io_utils import axis_conversion
+from mathutils.kdtree import KDTree
+
+from . import dks_ruv_fbx, dks_ruv_link, dks_ruv_pool
+from .dks_ruv_cache import ContentStore
+from .dks_ruv_fbx import FBXMesh
+from .dks_ruv_pool import BatchJob
+from .dks_ruv_topology import (geometry_digest, loop_samples, match_loops_by_position, remap_loops,
+                               topology_fingerprint)
 
 
 try:  # Optional RizomUV Link integration
@@ -38,6 +56,44 @@ except Exception:  # pragma: no cover - optional dependency, may not exist
 
 
 EXPORT_SUBDIR_NAME = "rizomuv_bridge"
+EXPORT_CACHE_SUBDIR_NAME = "export_cache"
+EXPORT_COLLECTION_NAME = "RizomUV Bridge Export"
+IMPORT_SCENE_NAME = "RizomUV Bridge Import"
+# Vertex positions closer than this are considered equal when looking for
+# meshes with identical geometry.
+GEOMETRY_DEDUP_PRECISION = 1e-5
+# Number of nearest source loops compared by normal for the loops that have
+# no match in the neighbouring cells of the spatial grid.
+SPATIAL_MATCH_CANDIDATES = 8
+# Number of objects listed individually in the evaluation report of an export.
+EVALUATION_REPORT_LIMIT = 10
+RESULT_CACHE_SUBDIR_NAME = "result_cache"
+# Bump when the exported file contents change for identical input data, so
+# stale cache entries are never reused.
+EXPORT_CACHE_VERSION = 1
+
+# How long poll() may trust the last stat of last_export.json, in seconds.
+STATE_POLL_INTERVAL = 0.5
+# How often the timer checks whether a background export has been written, in
+# seconds.
+BACKGROUND_EXPORT_POLL_INTERVAL = 0.2
+# The modal import applies UVs for this long per timer event, in seconds, so
+# the interface keeps redrawing in between.
+MODAL_IMPORT_TIME_SLICE = 0.05
+MODAL_IMPORT_TIMER_STEP = 0.01
+# Polling of the RizomUV result file for automatic imports, in seconds. The
+# interval grows by WATCH_BACKOFF on every check that finds no change, and a
+# changed file has to stay unchanged for WATCH_SETTLE_TIME before it is read.
+WATCH_MIN_INTERVAL = 0.25
+WATCH_MAX_INTERVAL = 4.0
+WATCH_BACKOFF = 1.5
+WATCH_SETTLE_TIME = 1.0
+
+_resolved_export_directory: Optional[Tuple[str, Path]] = None
+_export_directory_stats: Dict[str, int] = {"lookups": 0, "resolves": 0, "mkdir_calls": 0}
+
+_export_store: Optional[ContentStore] = None
+_result_store: Optional[ContentStore] = None
 
 
 def _prefs():
@@ -51,18 +107,9 @@ def _require_saved_file(operator) -> bool:
     return True
 
 
-def get_export_directory() -> Path:
-    """Return the export directory used for RizomUV transfers.
-
-    The folder is always located inside the operating system's temporary
-    directory (or Blender's override, if available) to avoid accidental exports
-    to arbitrary user-specified locations. The directory is created on demand
-    and a stable location is returned for the duration of the Blender session.
-    """
-
+def _resolve_export_directory(blender_temp: str) -> Path:
     candidate_roots: List[Path] = []
 
-    blender_temp = getattr(bpy.app, "tempdir", None)
     if blender_temp:
         candidate_roots.append(Path(blender_temp))
 
@@ -72,6 +119,7 @@ def get_export_directory() -> Path:
 
     for root in candidate_roots:
         target_dir = root / EXPORT_SUBDIR_NAME
+        _export_directory_stats["mkdir_calls"] += 1
         try:
             target_dir.mkdir(parents=True, exist_ok=True)
         except OSError:
@@ -85,6 +133,42 @@ def get_export_directory() -> Path:
     return fallback_dir
 
 
+def get_export_directory() -> Path:
+    """Return the export directory used for RizomUV transfers.
+
+    The folder is always located inside the operating system's temporary
+    directory (or Blender's override, if available) to avoid accidental exports
+    to arbitrary user-specified locations. The directory is created on demand
+    and a stable location is returned for the duration of the Blender session.
+
+    The resolved folder is remembered until ``bpy.app.tempdir`` changes or
+    :func:`invalidate_export_directory` is called after a failed operation.
+    """
+
+    global _resolved_export_directory
+
+    _export_directory_stats["lookups"] += 1
+    blender_temp = getattr(bpy.app, "tempdir", None) or ""
+    if _resolved_export_directory is not None and _resolved_export_directory[0] == blender_temp:
+        return _resolved_export_directory[1]
+
+    _export_directory_stats["resolves"] += 1
+    target_dir = _resolve_export_directory(blender_temp)
+    _resolved_export_directory = (blender_temp, target_dir)
+    return target_dir
+
+
+def invalidate_export_directory() -> None:
+    """Forget the resolved export directory so the next lookup recreates it."""
+
+    global _resolved_export_directory
+    _resolved_export_directory = None
+
+
+def export_directory_stats() -> Dict[str, int]:
+    return dict(_export_directory_stats)
+
+
 def _export_directory() -> Path:
     return get_export_directory()
 
@@ -94,167 +178,603 @@ def _export_filename(obj: Object) -> Path:
     return _export_directory() / f"{clean_object_name}_ruv.fbx"
 
 
-def _selection_snapshot(context) -> Tuple[Dict[str, bool], Optional[Object]]:
-    scene = context.scene
-    selection = {obj.name: obj.select_get() for obj in scene.objects}
-    active = context.view_layer.objects.active
-    return selection, active
+def _set_objects_mode(context, objects: List[Object], mode: str) -> None:
+    """Switch ``objects`` to ``mode`` with as few ``mode_set`` calls as possible.
 
+    Blender switches every object sharing the active object's edit mode in a
+    single call (and enters edit mode for every selected object of the same
+    type), so one call usually covers the whole group. Objects that are still
+    in another mode afterwards are switched individually.
+    """
 
-def _restore_selection(context, selection: Dict[str, bool], active: Optional[Object]) -> None:
-    scene = context.scene
-    for obj in scene.objects:
-        obj.select_set(selection.get(obj.name, False))
-    if active:
-        restored_active = scene.objects.get(active.name)
-        context.view_layer.objects.active = restored_active
-    else:
-        context.view_layer.objects.active = None
+    view_layer = context.view_layer
+    pending = [obj for obj in objects if obj.mode != mode]
+    changed_selection: List[Tuple[Object, bool]] = []
+
+    if mode == 'EDIT' and len(pending) > 1:
+        # Entering edit mode picks up the selection, so it has to match the
+        # group for the duration of the call.
+        members = set(pending)
+        object_types = {obj.type for obj in pending}
+        for obj in context.selected_objects:
+            if obj not in members and obj.type in object_types:
+                obj.select_set(False)
+                changed_selection.append((obj, True))
+        for obj in pending:
+            if not obj.select_get():
+                obj.select_set(True)
+                changed_selection.append((obj, False))
+
+    try:
+        while pending:
+            obj = pending[0]
+            view_layer.objects.active = obj
+            try:
+                bpy.ops.object.mode_set(mode=mode, toggle=False)
+            except RuntimeError:
+                pass
+            pending = [other for other in pending[1:] if other.mode != mode]
+    finally:
+        for obj, selected in changed_selection:
+            obj.select_set(selected)
 
 
 def _ensure_objects_object_mode(context, objects: Iterable[Object]) -> Dict[str, str]:
-    view_layer = context.view_layer
-    previous_modes: Dict[str, str] = {}
-    for obj in objects:
-        if obj.mode != 'OBJECT':
-            view_layer.objects.active = obj
-            previous_modes[obj.name] = obj.mode
-            bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+    previous_modes = {obj.name: obj.mode for obj in objects if obj.mode != 'OBJECT'}
+    if previous_modes:
+        _set_objects_mode(context, [bpy.data.objects[name] for name in previous_modes], 'OBJECT')
     return previous_modes
 
 
 def _restore_object_modes(context, previous_modes: Dict[str, str]) -> None:
-    view_layer = context.view_layer
+    objects_by_mode: Dict[str, List[Object]] = {}
     for obj_name, mode in previous_modes.items():
         obj = bpy.data.objects.get(obj_name)
         if obj is None:
             continue
-        view_layer.objects.active = obj
-        try:
-            bpy.ops.object.mode_set(mode=mode, toggle=False)
-        except RuntimeError:
-            pass
+        objects_by_mode.setdefault(mode, []).append(obj)
+
+    for mode, objects in objects_by_mode.items():
+        _set_objects_mode(context, objects, mode)
+
+
+def _representatives(classes: Iterable[List[Object]], preferred: Optional[Object]) -> Dict[Object, List[Object]]:
+    """Map one member of every class (``preferred`` when it is part of the
+    class) to the other members."""
+
+    groups: Dict[Object, List[Object]] = {}
+    for members in classes:
+        representative = preferred if preferred in members else members[0]
+        groups[representative] = [obj for obj in members if obj is not representative]
+    return groups
+
+
+def _group_by_mesh(objects: Iterable[Object], preferred: Optional[Object] = None) -> Dict[Object, List[Object]]:
+    """Group objects sharing a mesh data-block.
+
+    Returns a mapping of one representative per mesh (``preferred`` when it is
+    part of the group) to the other objects using the same mesh.
+    """
+
+    by_mesh: Dict[str, List[Object]] = {}
+    for obj in objects:
+        by_mesh.setdefault(obj.data.name_full, []).append(obj)
+    return _representatives(by_mesh.values(), preferred)
+
+
+def _group_by_geometry(objects: Iterable[Object], preferred: Optional[Object] = None) -> Dict[Object, List[Object]]:
+    """Group objects whose meshes have identical topology and positions and
+    whose modifier stacks are identical.
+
+    Positions are quantized to ``GEOMETRY_DEDUP_PRECISION``. Objects with
+    modifiers that depend on other data-blocks are never grouped. Returns a
+    mapping of one representative per equivalence class to the other members.
+    """
+
+    by_key: Dict[object, List[Object]] = {}
+    for obj in objects:
+        modifiers = _modifier_state(obj)
+        if modifiers is None:
+            by_key[obj.name_full] = [obj]
+            continue
+        positions, polygon_sizes, loop_vertices = _mesh_topology(obj.data)
+        digest = geometry_digest(positions, polygon_sizes, loop_vertices, GEOMETRY_DEDUP_PRECISION)
+        by_key.setdefault((digest, modifiers), []).append(obj)
+    return _representatives(by_key.values(), preferred)
+
+
+def _export_targets(state: Dict[str, object]) -> List[Tuple[str, Object]]:
+    """Resolve the objects of the last export to ``(exported name, object)`` pairs.
+
+    Each exported name expands to its own object and the members of its group,
+    keeping one object per mesh data-block so that the UVs of every mesh are
+    written exactly once.
+    """
+
+    groups = state.get("groups", {})
+    targets: List[Tuple[str, Object]] = []
+    seen_meshes = set()
+    for name in state.get("objects", []):
+        for candidate in [name, *groups.get(name, [])]:
+            obj = bpy.data.objects.get(candidate)
+            if obj is None or obj.type != 'MESH' or obj.data.name_full in seen_meshes:
+                continue
+            seen_meshes.add(obj.data.name_full)
+            targets.append((name, obj))
+    return targets
+
+
+def _report_mode_switch(operator, previous_modes: Dict[str, str], seconds: float) -> None:
+    if previous_modes:
+        operator.report({'INFO'}, f"Switched modes of {len(previous_modes)} objects in {seconds * 1000.0:.1f} ms")
+
+
+# Built-in mesh arrays stored as generic attributes: the ``foreach_get``
+# property of the attribute, then the collection and property that expose the
+# same values per element.
+_MESH_ARRAYS = {
+    "position": ("vector", "vertices", "co"),
+    ".edge_verts": ("value", "edges", "vertices"),
+    ".corner_vert": ("value", "loops", "vertex_index"),
+    ".corner_edge": ("value", "loops", "edge_index"),
+}
+
+
+def _read_mesh_array(mesh, name: str, buffer: np.ndarray) -> np.ndarray:
+    """Fill ``buffer`` with the built-in array ``name`` of ``mesh`` and return it.
+
+    Attribute data is copied as one block, while the matching ``MeshVertex``,
+    ``MeshEdge`` and ``MeshLoop`` properties go through RNA element by element
+    and are only read when the attribute does not exist.
+    """
+
+    prop, collection, fallback = _MESH_ARRAYS[name]
+    attribute = mesh.attributes.get(name)
+    if attribute is not None:
+        attribute.data.foreach_get(prop, buffer)
+    else:
+        getattr(mesh, collection).foreach_get(fallback, buffer)
+    return buffer
+
+
+def _mesh_positions(mesh) -> np.ndarray:
+    return _read_mesh_array(mesh, "position", np.empty(len(mesh.vertices) * 3, dtype=np.float32))
 
 
-def _ensure_uv_topology_matches(source: Object, target: Object) -> None:
-    if source.type != 'MESH' or target.type != 'MESH':
+def _mesh_loops(mesh) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the polygon sizes and loop vertices of ``mesh``."""
+
+    polygon_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", polygon_sizes)
+    loop_vertices = _read_mesh_array(mesh, ".corner_vert", np.empty(len(mesh.loops), dtype=np.int32))
+    return polygon_sizes, loop_vertices
+
+
+def _mesh_topology(mesh) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the vertex positions, polygon sizes and loop vertices of ``mesh``."""
+
+    return (_mesh_positions(mesh), *_mesh_loops(mesh))
+
+
+def _loops_fingerprint(polygon_sizes: np.ndarray, loop_vertices: np.ndarray) -> str:
+    # Blender stores the loops of each polygon contiguously and in polygon
+    # order, so the loop starts follow from the sizes.
+    return topology_fingerprint(np.cumsum(polygon_sizes) - polygon_sizes, polygon_sizes, loop_vertices)
+
+
+def _mesh_fingerprint(mesh) -> str:
+    return _loops_fingerprint(*_mesh_loops(mesh))
+
+
+class _TopologyMismatch(RuntimeError):
+    """Raised when an imported mesh cannot be matched loop by loop to its target."""
+
+
+def _ensure_uv_topology_matches(source: FBXMesh, target: Object, expected_fingerprint: Optional[str] = None,
+                                loops: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> FBXMesh:
+    """Make sure the UVs of ``source`` can be written loop by loop into ``target``.
+
+    ``expected_fingerprint`` is the topology fingerprint recorded when
+    ``target`` was exported; a mismatch means the mesh was edited since.
+    ``loops`` are the polygon sizes and loop vertices of ``target`` when the
+    caller already read them. When ``source`` holds the same polygons as
+    ``target`` in a different polygon or loop order, a copy with its UV maps
+    reordered to match ``target`` is returned; otherwise ``source`` itself is.
+    """
+
+    if target.type != 'MESH':
         raise RuntimeError("RizomUV import requires mesh objects.")
 
-    src_mesh = source.data
     dst_mesh = target.data
+    polygon_sizes, loop_vertices = loops if loops is not None else _mesh_loops(dst_mesh)
+
+    if expected_fingerprint and _loops_fingerprint(polygon_sizes, loop_vertices) != expected_fingerprint:
+        raise RuntimeError(f"'{target.name}' was modified after it was exported to RizomUV. Export it again.")
+
+    if source.vertex_count != len(dst_mesh.vertices):
+        raise _TopologyMismatch(f"Imported mesh topology does not match '{target.name}'.")
+    if np.array_equal(source.polygon_sizes, polygon_sizes) and np.array_equal(source.loop_vertices, loop_vertices):
+        return source
+
+    order = remap_loops(source.polygon_sizes, source.loop_vertices, polygon_sizes, loop_vertices)
+    if order is None:
+        raise _TopologyMismatch(f"Imported mesh topology does not match '{target.name}'.")
+
+    uv_layers = [(name, coordinates.reshape(-1, 2)[order].reshape(-1)) for name, coordinates in source.uv_layers]
+    return FBXMesh(source.name, source.vertex_count, loop_vertices, polygon_sizes, uv_layers, source.active_uv_index)
+
+
+def _transfer_uvs_by_position(source: FBXMesh, target: Object, positions: np.ndarray,
+                              loops: Tuple[np.ndarray, np.ndarray]) -> Tuple[FBXMesh, int]:
+    """Map the UVs of ``source`` onto ``target`` by position for meshes with different topology.
+
+    ``positions`` and ``loops`` are the vertex positions, polygon sizes and
+    loop vertices of ``target``. Every target loop takes the UVs of the
+    nearest source loop facing the same way among the neighbouring cells of a
+    spatial grid; the few loops without one there go through a KD-tree.
+    Returns a mesh with the UVs in the loop order of ``target`` and the number
+    of loops that needed the KD-tree.
+    """
+
+    dst_mesh = target.data
+    polygon_sizes, loop_vertices = loops
+
+    source_points, source_normals = loop_samples(source.vertices, source.polygon_sizes, source.loop_vertices)
+    target_points, target_normals = loop_samples(positions, polygon_sizes, loop_vertices)
+    if not len(source_points):
+        raise _TopologyMismatch(f"Imported mesh for '{target.name}' has no polygons.")
+
+    order = match_loops_by_position(source_points, source_normals, target_points, target_normals)
+
+    missing = np.flatnonzero(order < 0)
+    if len(missing):
+        tree = KDTree(len(source_points))
+        for index, point in enumerate(source_points):
+            tree.insert(point, index)
+        tree.balance()
+        for index in missing:
+            candidates = tree.find_n(target_points[index], SPATIAL_MATCH_CANDIDATES)
+            facing = [candidate for candidate in candidates if source_normals[candidate[1]] @ target_normals[index] > 0.5]
+            order[index] = (facing or candidates)[0][1]
+
+    uv_layers = [(name, coordinates.reshape(-1, 2)[order].reshape(-1)) for name, coordinates in source.uv_layers]
+    transferred = FBXMesh(source.name, len(dst_mesh.vertices), loop_vertices, polygon_sizes, uv_layers,
+                          source.active_uv_index)
+    return transferred, len(missing)
+
+
+def _write_uv_layer(dst_layer, coordinates: np.ndarray, current: Optional[np.ndarray] = None) -> bool:
+    """Write ``coordinates`` (two float32 values per loop) into ``dst_layer``.
+
+    The coordinates are written with a single ``foreach_set`` call; the
+    per-loop path is only used when bulk access is not available for the
+    layer. When ``current`` is given, the target layer is read into it first
+    and left untouched if it already holds the incoming coordinates. Returns
+    whether the target layer was written.
+    """
 
-    if len(src_mesh.vertices) != len(dst_mesh.vertices) or len(src_mesh.loops) != len(dst_mesh.loops):
-        raise RuntimeError("Imported mesh topology does not match the active object.")
+    try:
+        if current is not None:
+            dst_layer.data.foreach_get("uv", current)
+            if np.array_equal(coordinates, current):
+                return False
+        dst_layer.data.foreach_set("uv", coordinates)
+    except (AttributeError, RuntimeError, TypeError):
+        for loop_index, dst_data in enumerate(dst_layer.data):
+            dst_data.uv = coordinates[loop_index * 2:loop_index * 2 + 2]
+    return True
 
 
-def _copy_uv_layers(source: Object, target: Object) -> None:
-    _ensure_uv_topology_matches(source, target)
+def _copy_uv_layers(source: FBXMesh, target: Object, remove_stale_layers: bool = False,
+                    aligned: bool = False) -> Tuple[int, int]:
+    """Reconcile the UV layers of ``target`` with the ones of ``source``.
+
+    Layers are matched by name: matching layers are overwritten in place and
+    only missing layers are created, so references to existing layer names stay
+    valid. Matching layers whose coordinates did not change are skipped. Layers
+    that do not exist on ``source`` are kept unless ``remove_stale_layers`` is
+    enabled. ``aligned`` skips the topology check for a ``source`` that already
+    went through :func:`_ensure_uv_topology_matches`.
+
+    Returns the number of UV layers and loops that were actually written.
+    """
+
+    if not aligned:
+        source = _ensure_uv_topology_matches(source, target)
 
-    src_mesh = source.data
     dst_mesh = target.data
+    dst_layers = dst_mesh.uv_layers
+
+    stale_names: List[str] = []
+    if remove_stale_layers:
+        incoming_names = {name for name, _coordinates in source.uv_layers}
+        stale_names = [layer.name for layer in dst_layers if layer.name not in incoming_names]
+        for stale_name in stale_names:
+            dst_layers.remove(dst_layers[stale_name])
+
+    if not source.uv_layers:
+        if stale_names:
+            dst_mesh.update()
+        return 0, 0
+
+    current = np.empty(source.loop_count * 2, dtype=np.float32)
+    written_layers = 0
+    for name, coordinates in source.uv_layers:
+        dst_layer = dst_layers.get(name)
+        if dst_layer is None:
+            dst_layer = dst_layers.new(name=name)
+            if dst_layer is None:
+                raise RuntimeError(f"Unable to add UV map '{name}' to '{target.name}': the UV map limit was reached.")
+            written = _write_uv_layer(dst_layer, coordinates)
+        else:
+            written = _write_uv_layer(dst_layer, coordinates, current)
+        if written:
+            written_layers += 1
 
-    while dst_mesh.uv_layers:
-        dst_mesh.uv_layers.remove(dst_mesh.uv_layers[0])
+    if 0 <= source.active_uv_index < len(source.uv_layers):
+        active_index = dst_layers.find(source.uv_layers[source.active_uv_index][0])
+        if active_index >= 0:
+            dst_layers.active_index = active_index
 
-    if not src_mesh.uv_layers:
+    if written_layers or stale_names:
         dst_mesh.update()
-        return
+    return written_layers, source.loop_count * written_layers
+
+
+def _uv_snapshot(mesh) -> Tuple[List[Tuple[str, np.ndarray]], Optional[str]]:
+    """Copy the UV maps of ``mesh`` together with the name of the active one."""
 
-    for src_layer in src_mesh.uv_layers:
-        dst_layer = dst_mesh.uv_layers.new(name=src_layer.name)
-        for loop_index, src_data in enumerate(src_layer.data):
-            dst_layer.data[loop_index].uv = src_data.uv
+    uv_layers: List[Tuple[str, np.ndarray]] = []
+    for layer in mesh.uv_layers:
+        coordinates = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", coordinates)
+        uv_layers.append((layer.name, coordinates))
+    active = mesh.uv_layers.active
+    return uv_layers, active.name if active is not None else None
 
-    if src_mesh.uv_layers.active_index >= 0:
-        dst_mesh.uv_layers.active_index = src_mesh.uv_layers.active_index
 
-    if hasattr(src_mesh.uv_layers, "active_render_index") and src_mesh.uv_layers.active_render_index >= 0:
-        dst_mesh.uv_layers.active_render_index = src_mesh.uv_layers.active_render_index
+def _restore_uv_snapshot(target: Object, snapshot: Tuple[List[Tuple[str, np.ndarray]], Optional[str]]) -> None:
+    """Make the UV maps of ``target`` match a :func:`_uv_snapshot` again.
 
-    if hasattr(src_mesh.uv_layers, "active_clone_index") and src_mesh.uv_layers.active_clone_index >= 0:
-        dst_mesh.uv_layers.active_clone_index = src_mesh.uv_layers.active_clone_index
+    Raises ``RuntimeError`` when the loop count of ``target`` changed since.
+    """
 
+    uv_layers, active_name = snapshot
+    dst_mesh = target.data
+    dst_layers = dst_mesh.uv_layers
+    if any(len(coordinates) != len(dst_mesh.loops) * 2 for _name, coordinates in uv_layers):
+        raise RuntimeError(f"'{target.name}' was edited after its UV maps were saved.")
+
+    names = {name for name, _coordinates in uv_layers}
+    for stale_name in [layer.name for layer in dst_layers if layer.name not in names]:
+        dst_layers.remove(dst_layers[stale_name])
+    for name, coordinates in uv_layers:
+        dst_layer = dst_layers.get(name)
+        if dst_layer is None:
+            dst_layer = dst_layers.new(name=name)
+            if dst_layer is None:
+                raise RuntimeError(f"Unable to add UV map '{name}' to '{target.name}': the UV map limit was reached.")
+        _write_uv_layer(dst_layer, coordinates)
+    if active_name is not None:
+        dst_layers.active_index = dst_layers.find(active_name)
     dst_mesh.update()
 
 
-def _import_fbx(filepath: Path) -> List[Object]:
-    existing_names = {obj.name_full for obj in bpy.data.objects}
-    result = bpy.ops.import_scene.fbx(filepath=str(filepath), axis_forward='-Z', axis_up='Y')
-    if 'FINISHED' not in result:
-        raise RuntimeError(f"Unable to import FBX file from RizomUV: {filepath}")
+def _fbx_mesh_from_object(obj: Object) -> FBXMesh:
+    mesh = obj.data
+    vertices, polygon_sizes, loop_vertices = _mesh_topology(mesh)
 
-    new_objects = [obj for obj in bpy.data.objects if obj.name_full not in existing_names and obj.type == 'MESH']
-    if not new_objects:
-        raise RuntimeError("No mesh objects were imported from RizomUV.")
+    uv_layers: List[Tuple[str, np.ndarray]] = []
+    for layer in mesh.uv_layers:
+        coordinates = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", coordinates)
+        uv_layers.append((layer.name, coordinates))
+
+    return FBXMesh(obj.name, len(mesh.vertices), loop_vertices, polygon_sizes, uv_layers, mesh.uv_layers.active_index,
+                   vertices=vertices)
 
-    return new_objects
+
+def _import_fbx(context, filepath: Path) -> Dict[str, FBXMesh]:
+    """Read ``filepath`` with Blender's FBX importer.
+
+    The importer deselects everything and selects what it creates, so it runs
+    in a temporary scene: the selection and active object of the user's scene
+    are never touched and nothing has to be restored afterwards. The imported
+    objects and the scene are removed again before returning.
+    """
+
+    scene = bpy.data.scenes.new(IMPORT_SCENE_NAME)
+    try:
+        with context.temp_override(scene=scene, view_layer=scene.view_layers[0], collection=scene.collection):
+            result = bpy.ops.import_scene.fbx(filepath=str(filepath), axis_forward='-Z', axis_up='Y')
+        if 'FINISHED' not in result:
+            raise RuntimeError(f"Unable to import FBX file from RizomUV: {filepath}")
+
+        imported_objects = list(scene.collection.all_objects)
+        try:
+            return {obj.name: _fbx_mesh_from_object(obj) for obj in imported_objects if obj.type == 'MESH'}
+        finally:
+            _cleanup_import(imported_objects)
+    finally:
+        bpy.data.scenes.remove(scene)
 
 
 def _cleanup_import(objects: Iterable[Object]) -> None:
     for obj in objects:
-        mesh = obj.data
+        data = obj.data
         bpy.data.objects.remove(obj, do_unlink=True)
-        if mesh.users == 0:
-            bpy.data.meshes.remove(mesh)
+        if isinstance(data, bpy.types.Mesh) and data.users == 0:
+            bpy.data.meshes.remove(data)
+
+
+def _read_rizom_result(context, filepath: Path, workers: int = 1, with_vertices: bool = False) -> Dict[str, FBXMesh]:
+    """Return the meshes stored in a RizomUV result keyed by object name.
+
+    Binary FBX files are decoded directly without creating any Blender data.
+    Other files go through Blender's FBX importer in a temporary scene.
+    ``workers`` sets how many threads decompress the FBX arrays. Vertex
+    positions are only read when ``with_vertices`` is set.
+    """
+
+    try:
+        meshes = dks_ruv_fbx.read_uv_meshes(filepath, workers, with_vertices)
+    except dks_ruv_fbx.FBXError:
+        meshes = _import_fbx(context, filepath)
+
+    if not meshes:
+        raise RuntimeError("No mesh objects were imported from RizomUV.")
+    return meshes
 
 
 def _state_file() -> Path:
     return _export_directory() / "last_export.json"
 
 
-def _load_state() -> Dict[str, object]:
-    path = _state_file()
-    if not path.exists():
-        return {}
-    try:
-        with path.open("r", encoding="utf8") as handle:
-            return json.load(handle)
-    except (OSError, json.JSONDecodeError):
-        return {}
+class _StateStore:
+    """In-memory copy of ``last_export.json``.
 
+    The file is only parsed again when its path, modification time or size
+    changes. ``poll()`` callers additionally reuse the last ``stat`` result for
+    ``STATE_POLL_INTERVAL`` seconds, since Blender polls operators on every
+    redraw, and remember which exported object resolved last.
+    """
 
-def _save_state(state: Dict[str, object]) -> None:
-    path = _state_file()
-    try:
+    def __init__(self):
+        self._state: Dict[str, object] = {}
+        self._signature: Optional[Tuple[str, int, int]] = None
+        self._checked_at = 0.0
+        self._resolved_name: Optional[str] = None
+        self.poll_calls = 0
+        self.stat_calls = 0
+        self.disk_reads = 0
+
+    def _refresh(self, max_age: float = 0.0) -> Dict[str, object]:
+        now = time.monotonic()
+        if self._signature is not None and now - self._checked_at < max_age:
+            return self._state
+
+        path = _state_file()
+        self.stat_calls += 1
+        self._checked_at = now
+        try:
+            info = path.stat()
+        except OSError:
+            signature = None
+        else:
+            signature = (str(path), info.st_mtime_ns, info.st_size)
+
+        if signature is None:
+            self._state = {}
+            self._resolved_name = None
+        elif signature != self._signature:
+            self.disk_reads += 1
+            self._resolved_name = None
+            try:
+                with path.open("r", encoding="utf8") as handle:
+                    state = json.load(handle)
+            except (OSError, json.JSONDecodeError):
+                state = {}
+            self._state = state if isinstance(state, dict) else {}
+        self._signature = signature
+        return self._state
+
+    def load(self) -> Dict[str, object]:
+        return copy.deepcopy(self._refresh())
+
+    def save(self, state: Dict[str, object]) -> None:
+        try:
+            path, info = self._write(state)
+        except OSError:
+            # The export directory may have been removed behind our back;
+            # resolve it again and retry once.
+            invalidate_export_directory()
+            try:
+                path, info = self._write(state)
+            except OSError:
+                self.invalidate()
+                return
+        self._state = copy.deepcopy(state)
+        self._signature = (str(path), info.st_mtime_ns, info.st_size)
+        self._checked_at = time.monotonic()
+        self._resolved_name = None
+
+    @staticmethod
+    def _write(state: Dict[str, object]):
+        path = _state_file()
         with path.open("w", encoding="utf8") as handle:
             json.dump(state, handle, indent=2)
-    except OSError:
-        pass
+        return path, path.stat()
 
+    def invalidate(self) -> None:
+        self._signature = None
+        self._resolved_name = None
 
-def _connect_or_launch_rizom(exe_path: Path, state: Dict[str, object]):
-    if CRizomUVLink is None:
-        return None
+    def filepath(self) -> Optional[str]:
+        """Return the file of the last export, trusting recent checks like ``has_export_target``."""
 
-    link = CRizomUVLink()
-    port = state.get("port")
-    if isinstance(port, int):
-        try:
-            link.Connect(port)
-            return link
-        except Exception:
-            port = None
+        return self._refresh(STATE_POLL_INTERVAL).get("filepath")
 
-    try:
-        port = link.RunRizomUV(str(exe_path))
-    except CZEx:  # type: ignore[misc]
-        return None
-    except Exception:
-        return None
+    def has_export_target(self) -> bool:
+        """Return whether an object of the last export still exists as a mesh."""
+
+        self.poll_calls += 1
+        state = self._refresh(STATE_POLL_INTERVAL)
+
+        if self._resolved_name is not None:
+            obj = bpy.data.objects.get(self._resolved_name)
+            if obj is not None and obj.type == 'MESH':
+                return True
 
-    state["port"] = port
-    _save_state(state)
-    return link
+        groups = state.get("groups", {})
+        for name in state.get("objects", []):
+            for candidate in [name, *groups.get(name, [])]:
+                obj = bpy.data.objects.get(candidate)
+                if obj is not None and obj.type == 'MESH':
+                    self._resolved_name = candidate
+                    return True
+        self._resolved_name = None
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        return {"poll_calls": self.poll_calls, "stat_calls": self.stat_calls, "disk_reads": self.disk_reads}
+
+
+_state_store = _StateStore()
+
+
+def _load_state() -> Dict[str, object]:
+    return _state_store.load()
+
+
+def _save_state(state: Dict[str, object]) -> None:
+    _state_store.save(state)
+
+
+_link_session = dks_ruv_link.LinkSession(CRizomUVLink) if CRizomUVLink is not None else None
+
+
+def link_stats() -> Optional[Dict[str, float]]:
+    return _link_session.stats() if _link_session is not None else None
 
 
 def _send_to_rizom(exe_path: Path, export_file: Path, operator, state: Dict[str, object]) -> None:
-    link = _connect_or_launch_rizom(exe_path, state)
-    if link is not None:
+    if _link_session is not None:
+        port = state.get("port")
         try:
-            link.Load({"File": {"Path": str(export_file)}})
-            return
+            new_port = _link_session.send(
+                str(exe_path), port if isinstance(port, int) else None,
+                lambda link: link.Load({"File": {"Path": str(export_file)}}),
+            )
         except Exception as exc:
             operator.report({'WARNING'}, f"Unable to communicate with RizomUV instance: {exc}")
+        else:
+            if new_port != port:
+                state["port"] = new_port
+                _save_state(state)
+            connect_time, send_time, reused = _link_session.latencies[-1]
+            connection = "reused connection" if reused else f"connected in {connect_time * 1000.0:.1f} ms"
+            operator.report({'INFO'}, f"Sent to RizomUV in {send_time * 1000.0:.1f} ms ({connection})")
+            return
 
     try:
         Popen([str(exe_path), str(export_file)])
@@ -262,10 +782,560 @@ def _send_to_rizom(exe_path: Path, export_file: Path, operator, state: Dict[str,
         operator.report({'WARNING'}, f"FBX exported, but RizomUV could not be launched: {exc}")
 
 
+def _hash_buffer(hasher, collection, attribute: str, dtype, size: int) -> None:
+    buffer = np.empty(size, dtype=dtype)
+    collection.foreach_get(attribute, buffer)
+    hasher.update(buffer)
+
+
+# ``foreach_get`` property, values per element and buffer type of every
+# generic attribute type that is fingerprinted.
+_ATTRIBUTE_BUFFERS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+
+def _hash_attributes(hasher, mesh) -> bool:
+    """Hash the generic attributes of ``mesh``: UV maps, sharp edges, edge
+    creases, bevel weights and custom attributes read by modifiers. Internal
+    attributes (selection, visibility and the topology hashed separately) and
+    positions are skipped. Returns ``False`` when an attribute cannot be read
+    in bulk."""
+
+    for attribute in mesh.attributes:
+        name = attribute.name
+        if name.startswith(".") or name == "position":
+            continue
+        layout = _ATTRIBUTE_BUFFERS.get(attribute.data_type)
+        if layout is None:
+            return False
+        prop, width, dtype = layout
+        hasher.update(repr((name, attribute.domain, attribute.data_type)).encode("utf8"))
+        _hash_buffer(hasher, attribute.data, prop, dtype, len(attribute.data) * width)
+    return True
+
+
+def _weighted_groups(obj: Object) -> List[str]:
+    """Return the vertex groups of ``obj`` named by its modifiers or shape keys."""
+
+    names = set(obj.vertex_groups.keys())
+    used = set()
+    for modifier in obj.modifiers:
+        for prop in modifier.bl_rna.properties:
+            if prop.type == 'STRING':
+                value = getattr(modifier, prop.identifier, "")
+                if value in names:
+                    used.add(value)
+    shape_keys = obj.data.shape_keys
+    if shape_keys is not None:
+        used.update(key_block.vertex_group for key_block in shape_keys.key_blocks if key_block.vertex_group in names)
+    return sorted(used)
+
+
+def _hash_vertex_weights(hasher, obj: Object, groups: List[str]) -> None:
+    hasher.update(repr(groups).encode("utf8"))
+    indices = {obj.vertex_groups[name].index for name in groups}
+    # Deform weights have no bulk accessor, so only the groups that change
+    # the exported mesh are walked.
+    weights = [(vertex.index, element.group, element.weight)
+               for vertex in obj.data.vertices for element in vertex.groups if element.group in indices]
+    hasher.update(np.array(weights, dtype=np.float64))
+
+
+def _modifier_state(obj: Object) -> Optional[str]:
+    """Describe the modifier stack of ``obj``, or return ``None`` when its
+    result depends on other data-blocks (objects, textures, node groups) whose
+    changes cannot be tracked from here."""
+
+    parts: List[str] = []
+    for modifier in obj.modifiers:
+        values = [modifier.type]
+        for prop in modifier.bl_rna.properties:
+            if prop.identifier == "rna_type" or prop.type == 'COLLECTION':
+                continue
+            value = getattr(modifier, prop.identifier, None)
+            if prop.type == 'POINTER':
+                if isinstance(value, bpy.types.ID):
+                    return None
+                continue
+            if getattr(prop, "is_array", False):
+                value = tuple(value)
+            values.append(f"{prop.identifier}={value!r}")
+        parts.append("|".join(values))
+    return "\n".join(parts)
+
+
+def _export_fingerprint(objects: List[Object], settings: Tuple) -> Optional[str]:
+    """Return a digest of everything that affects the exported FBX file.
+
+    The digest covers the base mesh buffers (vertices, loops, edges, polygons,
+    UV maps, generic attributes and shape keys), the modifier stack, the
+    vertex group weights read by modifiers and shape keys, the object
+    transforms and the export ``settings``. ``None`` is returned when one of
+    the objects cannot be fingerprinted reliably. Everything except the
+    vertex weights is read in bulk.
+    """
+
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(repr((EXPORT_CACHE_VERSION, settings)).encode("utf8"))
+    for obj in objects:
+        modifiers = _modifier_state(obj)
+        if modifiers is None:
+            return None
+
+        mesh = obj.data
+        matrix = tuple(tuple(row) for row in obj.matrix_world)
+        hasher.update(repr((obj.name, matrix, modifiers)).encode("utf8"))
+        hasher.update(repr((len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))).encode("utf8"))
+        hasher.update(_mesh_positions(mesh))
+        hasher.update(_read_mesh_array(mesh, ".edge_verts", np.empty(len(mesh.edges) * 2, dtype=np.int32)))
+        hasher.update(_read_mesh_array(mesh, ".corner_vert", np.empty(len(mesh.loops), dtype=np.int32)))
+        hasher.update(_read_mesh_array(mesh, ".corner_edge", np.empty(len(mesh.loops), dtype=np.int32)))
+        _hash_buffer(hasher, mesh.polygons, "loop_total", np.int32, len(mesh.polygons))
+        # The UV coordinates are hashed with the other attributes.
+        hasher.update(repr((mesh.uv_layers.keys(), mesh.uv_layers.active_index)).encode("utf8"))
+        if not _hash_attributes(hasher, mesh):
+            return None
+
+        groups = _weighted_groups(obj)
+        if groups:
+            _hash_vertex_weights(hasher, obj, groups)
+        shape_keys = mesh.shape_keys
+        if shape_keys is not None:
+            hasher.update(repr((obj.show_only_shape_key, obj.active_shape_key_index)).encode("utf8"))
+            for key_block in shape_keys.key_blocks:
+                hasher.update(repr((key_block.name, key_block.value, key_block.mute, key_block.vertex_group,
+                                    key_block.relative_key.name)).encode("utf8"))
+                _hash_buffer(hasher, key_block.data, "co", np.float32, len(mesh.vertices) * 3)
+
+    return hasher.hexdigest()
+
+
+def _export_cache(max_megabytes: int) -> ContentStore:
+    global _export_store
+
+    directory = _export_directory() / EXPORT_CACHE_SUBDIR_NAME
+    if _export_store is None or _export_store.directory != directory:
+        _export_store = ContentStore(directory, 0, ".fbx")
+    _export_store.max_bytes = max(0, max_megabytes) * 1024 * 1024
+    return _export_store
+
+
+def _result_cache_directory() -> Path:
+    return Path(bpy.utils.user_resource('DATAFILES', path=f"{EXPORT_SUBDIR_NAME}/{RESULT_CACHE_SUBDIR_NAME}", create=True))
+
+
+def _result_cache(max_megabytes: int) -> ContentStore:
+    global _result_store
+
+    if _result_store is None:
+        _result_store = ContentStore(_result_cache_directory(), 0, ".npz")
+    _result_store.max_bytes = max(0, max_megabytes) * 1024 * 1024
+    return _result_store
+
+
+def _store_result(cache: ContentStore, key: str, source: FBXMesh) -> None:
+    arrays = {f"uv_{index}": coordinates for index, (_name, coordinates) in enumerate(source.uv_layers)}
+    buffer = io.BytesIO()
+    np.savez(buffer, names=np.array([name for name, _coordinates in source.uv_layers], dtype=str),
+             active=np.array([source.active_uv_index]), **arrays)
+    cache.put_bytes(key, buffer.getvalue())
+
+
+def _edge_seams(mesh) -> np.ndarray:
+    # Seams are a boolean edge attribute that only exists once an edge is
+    # marked; it is hidden (".uv_seam") before Blender 5.0.
+    seams = np.zeros(len(mesh.edges), dtype=bool)
+    for name in ("uv_seam", ".uv_seam"):
+        attribute = mesh.attributes.get(name)
+        if attribute is not None:
+            attribute.data.foreach_get("value", seams)
+            break
+    return seams
+
+
+def _result_key(obj: Object, positions: np.ndarray, polygon_sizes: np.ndarray,
+                loop_vertices: np.ndarray) -> Optional[str]:
+    """Return the result cache key of ``obj``.
+
+    The key covers the geometry, the UV seams, the pinned UVs of every UV map
+    and the modifier stack, since RizomUV results depend on all of them.
+    ``None`` means the modifier stack cannot be tracked, so results for ``obj``
+    are neither stored nor reused.
+    """
+
+    modifiers = _modifier_state(obj)
+    if modifiers is None:
+        return None
+    mesh = obj.data
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(repr((geometry_digest(positions, polygon_sizes, loop_vertices), modifiers)).encode("utf8"))
+    hasher.update(_edge_seams(mesh))
+    for layer in mesh.uv_layers:
+        # ``pin`` is empty until a UV of the map is pinned.
+        pins = np.zeros(len(loop_vertices), dtype=bool)
+        if len(layer.pin):
+            layer.pin.foreach_get("value", pins)
+        hasher.update(layer.name.encode("utf8"))
+        hasher.update(pins)
+    return hasher.hexdigest()
+
+
+def _load_result(cache: ContentStore, key: str, target: Object, loop_vertices: np.ndarray,
+                 polygon_sizes: np.ndarray) -> Optional[FBXMesh]:
+    path = cache.get(key)
+    if path is None:
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            names = [str(name) for name in archive["names"]]
+            uv_layers = [(name, archive[f"uv_{index}"].astype(np.float32)) for index, name in enumerate(names)]
+            active_uv_index = int(archive["active"][0])
+    except (OSError, KeyError, ValueError):
+        return None
+    if any(len(coordinates) != len(loop_vertices) * 2 for _name, coordinates in uv_layers):
+        return None
+    return FBXMesh(target.name, len(target.data.vertices), loop_vertices, polygon_sizes, uv_layers, active_uv_index)
+
+
+def _apply_cached_results(cache: ContentStore, objects: List[Object]) -> List[Object]:
+    """Apply known RizomUV results to objects with identical geometry.
+
+    An object whose UV maps already hold the cached result is left for
+    RizomUV: exporting it again asks for a new unwrap. Returns the objects
+    whose UVs were restored from ``cache``.
+    """
+
+    reused: List[Object] = []
+    for obj in objects:
+        positions, polygon_sizes, loop_vertices = _mesh_topology(obj.data)
+        key = _result_key(obj, positions, polygon_sizes, loop_vertices)
+        source = _load_result(cache, key, obj, loop_vertices, polygon_sizes) if key is not None else None
+        if source is None:
+            continue
+        try:
+            # The key covers the loops, so the result is in the loop order of
+            # ``obj``.
+            written_layers, _written_loops = _copy_uv_layers(source, obj, aligned=True)
+        except RuntimeError:
+            continue
+        if written_layers:
+            reused.append(obj)
+    return reused
+
+
+def _export_matrix():
+    return axis_conversion(to_forward='-Z', to_up='Y').to_4x4()
+
+
+class _ExportBuffers:
+    """Growable NumPy buffers reused for the arrays of every exported mesh.
+
+    :class:`dks_ruv_fbx.FBXWriter` encodes arrays as soon as a mesh is added,
+    so one set of buffers sized for the largest mesh serves a whole export.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def get(self, name: str, length: int, dtype) -> np.ndarray:
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or len(buffer) < length:
+            # Grow geometrically so a sequence of slightly larger meshes does
+            # not reallocate every time.
+            capacity = max(length, int(len(buffer) * 1.5) if buffer is not None and buffer.dtype == dtype else 0)
+            buffer = np.empty(capacity, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer[:length]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+
+def _fbx_mesh_for_export(obj: Object, depsgraph, global_matrix, buffers: Optional[_ExportBuffers] = None) -> FBXMesh:
+    """Pull the evaluated geometry and UV maps of ``obj`` into plain arrays.
+
+    The object is evaluated once and the temporary mesh is freed before
+    returning. With ``buffers``, the returned arrays are views into them and
+    only stay valid until the next call that uses the same buffers.
+    """
+
+    def array(name: str, length: int, dtype) -> np.ndarray:
+        return buffers.get(name, length, dtype) if buffers is not None else np.empty(length, dtype=dtype)
+
+    evaluated = obj.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    try:
+        vertices = _read_mesh_array(mesh, "position", array("vertices", len(mesh.vertices) * 3, np.float32))
+        loop_vertices = _read_mesh_array(mesh, ".corner_vert", array("loop_vertices", len(mesh.loops), np.int32))
+        loop_edges = _read_mesh_array(mesh, ".corner_edge", array("loop_edges", len(mesh.loops), np.int32))
+        polygon_sizes = array("polygon_sizes", len(mesh.polygons), np.int32)
+        mesh.polygons.foreach_get("loop_total", polygon_sizes)
+        sharp_edges = array("sharp_edges", len(mesh.edges), bool)
+        mesh.edges.foreach_get("use_edge_sharp", sharp_edges)
+
+        uv_layers: List[Tuple[str, np.ndarray]] = []
+        for uv_index, layer in enumerate(mesh.uv_layers):
+            coordinates = array(f"uv_{uv_index}", len(mesh.loops) * 2, np.float32)
+            layer.data.foreach_get("uv", coordinates)
+            uv_layers.append((layer.name, coordinates))
+        active_uv_index = max(mesh.uv_layers.active_index, 0)
+    finally:
+        evaluated.to_mesh_clear()
+
+    translation, rotation, scale = (global_matrix @ obj.matrix_world).decompose()
+    transform = (
+        tuple(translation),
+        tuple(math.degrees(angle) for angle in rotation.to_euler('XYZ')),
+        tuple(scale),
+    )
+    return FBXMesh(obj.name, len(vertices) // 3, loop_vertices, polygon_sizes, uv_layers, active_uv_index,
+                   vertices=vertices, loop_edges=loop_edges, sharp_edges=sharp_edges, transform=transform)
+
+
+def _mesh_nbytes(mesh: FBXMesh) -> int:
+    arrays = [mesh.vertices, mesh.loop_vertices, mesh.loop_edges, mesh.polygon_sizes, mesh.sharp_edges]
+    arrays.extend(coordinates for _name, coordinates in mesh.uv_layers)
+    return sum(array.nbytes for array in arrays if array is not None)
+
+
+def _export_lean(context, objects: List[Object], export_file: Path,
+                 compression: int) -> Tuple[int, List[Tuple[str, float, int]]]:
+    """Write ``objects`` with the bridge's own FBX writer.
+
+    Returns the file size and, for every object, its name, the seconds spent
+    evaluating and encoding it and the bytes of mesh data pulled from it.
+    """
+
+    depsgraph = context.evaluated_depsgraph_get()
+    global_matrix = _export_matrix()
+    writer = dks_ruv_fbx.FBXWriter(compression=compression, unit_scale=100.0 * context.scene.unit_settings.scale_length)
+    buffers = _ExportBuffers()
+    evaluations: List[Tuple[str, float, int]] = []
+    for obj in objects:
+        start = time.perf_counter()
+        mesh = _fbx_mesh_for_export(obj, depsgraph, global_matrix, buffers)
+        writer.add_mesh(mesh)
+        evaluations.append((obj.name, time.perf_counter() - start, _mesh_nbytes(mesh)))
+    return writer.write(export_file), evaluations
+
+
+def _report_evaluations(operator, evaluations: List[Tuple[str, float, int]]) -> None:
+    """Report the slowest evaluated objects of a lean export."""
+
+    if not evaluations:
+        return
+    slowest = sorted(evaluations, key=lambda evaluation: evaluation[1], reverse=True)[:EVALUATION_REPORT_LIMIT]
+    for name, seconds, nbytes in slowest:
+        operator.report({'INFO'}, (
+            f"Evaluated '{name}' in {seconds * 1000.0:.1f} ms ({nbytes / (1024 * 1024):.2f} MB of mesh data)"
+        ))
+    if len(evaluations) > len(slowest):
+        operator.report({'INFO'}, f"{len(evaluations) - len(slowest)} more objects evaluated")
+    peak = max(nbytes for _name, _seconds, nbytes in evaluations)
+    operator.report({'INFO'}, (
+        f"Evaluated {len(evaluations)} objects in {sum(seconds for _name, seconds, _nbytes in evaluations):.3f}s, "
+        f"peak {peak / (1024 * 1024):.2f} MB of mesh data per object"
+    ))
+
+
+def _report_status(level: str, message: str) -> None:
+    """Report ``message`` outside of an operator, for example from a timer.
+
+    The message goes through the ``report_status`` operator so it shows in the
+    status bar and the Info editor. It is dropped when there is no window to
+    show it in or the add-on is being unregistered.
+    """
+
+    window_manager = bpy.context.window_manager
+    if window_manager is None or not window_manager.windows:
+        return
+    with bpy.context.temp_override(window=window_manager.windows[0]):
+        try:
+            bpy.ops.dks_ruv.report_status(level=level, message=message)
+        except (AttributeError, RuntimeError):
+            # The operator is gone while the add-on unregisters, and error
+            # reports are raised back to the caller once they are shown.
+            pass
+
+
+class _StatusReporter:
+    """Stands in for an operator in code that reports from a timer."""
+
+    def report(self, levels, message: str) -> None:
+        _report_status(next(iter(levels)), message)
+
+
+class _BackgroundExport:
+    """Lean FBX export whose encoding and file write run on a worker thread.
+
+    The meshes are snapshotted into plain arrays on the main thread before the
+    worker starts, so the worker never touches Blender data. The file is
+    written next to ``export_file`` and renamed once complete. A
+    ``bpy.app.timers`` callback picks up the result and sends the file to
+    RizomUV.
+    """
+
+    def __init__(self, meshes: List[FBXMesh], export_file: Path, compression: int, unit_scale: float,
+                 exe_path: Path, state: Dict[str, object], cache: ContentStore, fingerprint: Optional[str]):
+        self.export_file = export_file
+        self.object_count = len(meshes)
+        self.exe_path = exe_path
+        self.state = state
+        self.cache = cache
+        self.fingerprint = fingerprint
+        self.file_size = 0
+        self.error: Optional[BaseException] = None
+        self.start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, args=(meshes, compression, unit_scale),
+                                        name="dks_ruv_export", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self, meshes: List[FBXMesh], compression: int, unit_scale: float) -> None:
+        temp_file = self.export_file.with_name(f".{self.export_file.name}.tmp")
+        try:
+            writer = dks_ruv_fbx.FBXWriter(compression=compression, unit_scale=unit_scale)
+            # Drop every snapshot as soon as it is encoded.
+            meshes.reverse()
+            while meshes:
+                writer.add_mesh(meshes.pop())
+            self.file_size = writer.write(temp_file)
+            os.replace(temp_file, self.export_file)
+            if self.fingerprint:
+                self.cache.put_file(self.fingerprint, self.export_file)
+        except Exception as exc:
+            self.error = exc
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+    def finish(self) -> None:
+        reporter = _StatusReporter()
+        _result_watcher.rebaseline(self.export_file)
+        if self.error is not None:
+            if isinstance(self.error, OSError):
+                invalidate_export_directory()
+            reporter.report({'ERROR'}, f"Unable to export the selection to RizomUV: {self.error}")
+            return
+
+        elapsed = time.perf_counter() - self.start_time
+        reporter.report({'INFO'}, (
+            f"Exported {self.object_count} objects to {self.export_file.name} "
+            f"({self.file_size / (1024 * 1024):.2f} MB) in the background in {elapsed:.3f}s"
+        ))
+        if not self.exe_path.is_file():
+            reporter.report({'WARNING'}, (
+                f"FBX exported to {self.export_file}, but RizomUV executable was not found: {self.exe_path}"
+            ))
+            return
+
+        _save_state(self.state)
+        _send_to_rizom(self.exe_path, self.export_file, reporter, self.state)
+
+
+_background_export: Optional[_BackgroundExport] = None
+
+
+def _poll_background_export() -> Optional[float]:
+    global _background_export
+
+    job = _background_export
+    if job is None:
+        return None
+    if job.is_alive():
+        return BACKGROUND_EXPORT_POLL_INTERVAL
+    _background_export = None
+    job.finish()
+    return None
+
+
+def _start_background_export(job: _BackgroundExport) -> None:
+    global _background_export
+
+    _background_export = job
+    job.start()
+    bpy.app.timers.register(_poll_background_export, first_interval=BACKGROUND_EXPORT_POLL_INTERVAL)
+
+
+def background_export_running() -> bool:
+    return _background_export is not None
+
+
+def _layer_collection_for(layer_collection, collection):
+    if layer_collection.collection == collection:
+        return layer_collection
+    for child in layer_collection.children:
+        found = _layer_collection_for(child, collection)
+        if found is not None:
+            return found
+    return None
+
+
+def _export_with_blender(context, objects: List[Object], export_file: Path) -> int:
+    """Write ``objects`` with Blender's FBX exporter and return the file size.
+
+    The objects are linked into a throwaway collection that is made the active
+    collection for the export, so the scene selection is never touched.
+    """
+
+    view_layer = context.view_layer
+    previous_layer_collection = view_layer.active_layer_collection
+    collection = bpy.data.collections.new(EXPORT_COLLECTION_NAME)
+    try:
+        context.scene.collection.children.link(collection)
+        for obj in objects:
+            collection.objects.link(obj)
+
+        layer_collection = _layer_collection_for(view_layer.layer_collection, collection)
+        if layer_collection is None:
+            raise RuntimeError("Unable to activate the temporary export collection.")
+        view_layer.active_layer_collection = layer_collection
+
+        result = bpy.ops.export_scene.fbx(
+            filepath=str(export_file),
+            use_selection=False,
+            use_active_collection=True,
+            check_existing=False,
+            axis_forward='-Z',
+            axis_up='Y',
+            apply_unit_scale=True,
+            add_leaf_bones=False,
+            use_custom_props=False,
+            bake_anim=False,
+            use_mesh_modifiers=True,
+        )
+    finally:
+        view_layer.active_layer_collection = previous_layer_collection
+        bpy.data.collections.remove(collection)
+
+    if 'FINISHED' not in result:
+        raise RuntimeError(f"Blender could not export the FBX file: {export_file}")
+    return export_file.stat().st_size
+
+
 class dks_ruv_export(bpy.types.Operator):
     bl_idname = "dks_ruv.export"
     bl_label = "RizomUV"
     bl_description = "Export the current selection to RizomUV"
+    # Cached unwraps are written into the UV maps of the selection.
+    bl_options = {'REGISTER', 'UNDO'}
 
     @classmethod
     def poll(cls, context):
@@ -275,6 +1345,10 @@ class dks_ruv_export(bpy.types.Operator):
         if not _require_saved_file(self):
             return {'CANCELLED'}
 
+        if _background_export is not None:
+            self.report({'ERROR'}, "The previous RizomUV export is still being written.")
+            return {'CANCELLED'}
+
         selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
         if not selected_meshes:
             self.report({'ERROR'}, "Select at least one mesh object to export to RizomUV.")
@@ -283,44 +1357,144 @@ class dks_ruv_export(bpy.types.Operator):
         prefs = _prefs()
         state = _load_state()
 
-        selection_snapshot = _selection_snapshot(context)
+        previous_active = context.view_layer.objects.active
+        mode_start = time.perf_counter()
         mode_snapshot = _ensure_objects_object_mode(context, selected_meshes)
+        mode_time = time.perf_counter() - mode_start
+
+        # Linked duplicates share their mesh, so only one of them is sent.
+        mesh_groups = _group_by_mesh(selected_meshes, previous_active)
+        instance_count = len(selected_meshes)
+
+        # Cached results are looked up per mesh before merging identical
+        # geometry, so every mesh gets its UVs either from the cache or from
+        # the representative of its geometry class.
+        if prefs.option_result_cache:
+            result_cache = _result_cache(prefs.option_result_cache_mb)
+            reused = _apply_cached_results(result_cache, list(mesh_groups))
+            if reused:
+                for obj in reused:
+                    del mesh_groups[obj]
+                self.report({'INFO'}, (
+                    f"Applied cached RizomUV results to {len(reused)} objects "
+                    f"(result cache: {result_cache.hits} hits, {result_cache.misses} misses)"
+                ))
+            if not mesh_groups:
+                mode_start = time.perf_counter()
+                _restore_object_modes(context, mode_snapshot)
+                mode_time += time.perf_counter() - mode_start
+                context.view_layer.objects.active = previous_active
+                _report_mode_switch(self, mode_snapshot, mode_time)
+                return {'FINISHED'}
+
+        if prefs.option_dedupe_geometry and len(mesh_groups) > 1:
+            geometry_groups = _group_by_geometry(mesh_groups, previous_active)
+            merged_loops = 0
+            for representative, duplicates in geometry_groups.items():
+                for duplicate in duplicates:
+                    merged_loops += len(duplicate.data.loops)
+                    mesh_groups[representative].extend([duplicate, *mesh_groups.pop(duplicate)])
+            if merged_loops:
+                total_loops = merged_loops + sum(len(obj.data.loops) for obj in geometry_groups)
+                self.report({'INFO'}, (
+                    f"Found {len(geometry_groups)} geometry classes: "
+                    + ", ".join(f"{obj.name} x{1 + len(duplicates)}" for obj, duplicates in geometry_groups.items() if duplicates)
+                    + f". Skipped {merged_loops} of {total_loops} loops ({100.0 * merged_loops / total_loops:.0f}%)."
+                ))
+
+        selected_meshes = list(mesh_groups)
+
+        # Recorded while every object is in Object Mode, so the mesh data is
+        # current; the import checks it before writing UVs loop by loop.
+        mesh_fingerprints: Dict[str, str] = {}
+        fingerprints: Dict[str, str] = {}
+        for obj in selected_meshes:
+            for member in (obj, *mesh_groups[obj]):
+                mesh_name = member.data.name_full
+                if mesh_name not in mesh_fingerprints:
+                    mesh_fingerprints[mesh_name] = _mesh_fingerprint(member.data)
+                fingerprints[member.name] = mesh_fingerprints[mesh_name]
 
-        active = context.view_layer.objects.active
+        active = previous_active
         if active not in selected_meshes:
             active = selected_meshes[0]
         export_file = (_export_filename(active) if len(selected_meshes) == 1 else (_export_directory() / "selection_ruv.fbx"))
 
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in selected_meshes:
-            obj.select_set(True)
-        context.view_layer.objects.active = active
+        start = time.perf_counter()
+        cache = _export_cache(prefs.option_export_cache_mb)
+        fingerprint = None
+        cached_file = None
+        evaluations: List[Tuple[str, float, int]] = []
+        snapshot: Optional[List[FBXMesh]] = None
+        unit_scale = 100.0 * context.scene.unit_settings.scale_length
+        try:
+            if cache.max_bytes > 0:
+                settings = (prefs.option_export_engine, prefs.option_fbx_compression, context.scene.unit_settings.scale_length)
+                fingerprint = _export_fingerprint(selected_meshes, settings)
+                cached_file = cache.get(fingerprint) if fingerprint else None
+
+            if cached_file is not None:
+                shutil.copyfile(cached_file, export_file)
+                file_size = export_file.stat().st_size
+            elif prefs.option_export_engine == 'BLENDER':
+                file_size = _export_with_blender(context, selected_meshes, export_file)
+            elif prefs.option_background_export:
+                # Only the snapshot needs Blender data; it is encoded and
+                # written on a worker thread.
+                depsgraph = context.evaluated_depsgraph_get()
+                global_matrix = _export_matrix()
+                snapshot = [_fbx_mesh_for_export(obj, depsgraph, global_matrix) for obj in selected_meshes]
+            else:
+                file_size, evaluations = _export_lean(context, selected_meshes, export_file, prefs.option_fbx_compression)
+        except (OSError, RuntimeError) as exc:
+            if isinstance(exc, OSError):
+                invalidate_export_directory()
+            self.report({'ERROR'}, f"Unable to export the selection to RizomUV: {exc}")
+            return {'CANCELLED'}
+        finally:
+            mode_start = time.perf_counter()
+            _restore_object_modes(context, mode_snapshot)
+            mode_time += time.perf_counter() - mode_start
+            context.view_layer.objects.active = previous_active
 
-        bpy.ops.export_scene.fbx(
-            filepath=str(export_file),
-            use_selection=True,
-            check_existing=False,
-            axis_forward='-Z',
-            axis_up='Y',
-            apply_unit_scale=True,
-            add_leaf_bones=False,
-            use_custom_props=False,
-            bake_anim=False,
-            use_mesh_modifiers=True,
-        )
+        state.update({
+            "objects": [obj.name for obj in selected_meshes],
+            "groups": {obj.name: [member.name for member in mesh_groups[obj]] for obj in selected_meshes if mesh_groups[obj]},
+            "fingerprints": fingerprints,
+            "filepath": str(export_file),
+        })
+        exe_path = Path(prefs.option_ruv_exe).expanduser()
 
-        _restore_object_modes(context, mode_snapshot)
-        _restore_selection(context, *selection_snapshot)
+        if snapshot is not None:
+            _start_background_export(_BackgroundExport(
+                snapshot, export_file, prefs.option_fbx_compression, unit_scale, exe_path, state, cache, fingerprint,
+            ))
+            self.report({'INFO'}, (
+                f"Writing {len(selected_meshes)} objects to {export_file.name} in the background "
+                f"(snapshot took {time.perf_counter() - start:.3f}s)"
+            ))
+            _report_mode_switch(self, mode_snapshot, mode_time)
+            return {'FINISHED'}
+
+        if fingerprint and cached_file is None:
+            cache.put_file(fingerprint, export_file)
+        export_time = time.perf_counter() - start
+        _result_watcher.rebaseline(export_file)
+
+        verb = "Reused cached export of" if cached_file is not None else "Exported"
+        self.report({'INFO'}, (
+            f"{verb} {len(selected_meshes)} objects to {export_file.name} "
+            f"({file_size / (1024 * 1024):.2f} MB) in {export_time:.3f}s"
+        ))
+        if instance_count > len(mesh_groups):
+            self.report({'INFO'}, f"Sent {len(mesh_groups)} unique meshes for {instance_count} selected objects")
+        _report_evaluations(self, evaluations)
+        _report_mode_switch(self, mode_snapshot, mode_time)
 
-        exe_path = Path(prefs.option_ruv_exe).expanduser()
         if not exe_path.is_file():
             self.report({'WARNING'}, f"FBX exported to {export_file}, but RizomUV executable was not found: {exe_path}")
             return {'FINISHED'}
 
-        state.update({
-            "objects": [obj.name for obj in selected_meshes],
-            "filepath": str(export_file),
-        })
         _save_state(state)
 
         _send_to_rizom(exe_path, export_file, self, state)
@@ -328,32 +1502,305 @@ class dks_ruv_export(bpy.types.Operator):
         return {'FINISHED'}
 
 
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size, info.st_ino
+
+
+class _ResultWatcher:
+    """Watches the file of the last export and imports it once RizomUV saved over it.
+
+    Every check is a single ``stat`` of the file. A change is only imported
+    after the file kept the same modification time, size and inode for
+    ``WATCH_SETTLE_TIME`` seconds, so files RizomUV is still writing are left
+    alone. While nothing changes, the polling interval grows towards
+    ``WATCH_MAX_INTERVAL``.
+    """
+
+    def __init__(self):
+        self.path: Optional[Path] = None
+        self.baseline: Optional[Tuple[int, int, int]] = None
+        self.pending: Optional[Tuple[int, int, int]] = None
+        self.pending_since = 0.0
+        self.interval = WATCH_MIN_INTERVAL
+        self.stat_calls = 0
+        self.imports = 0
+
+    def rebaseline(self, path: Path) -> None:
+        """Accept the current contents of ``path``, e.g. right after exporting it."""
+
+        self.stat_calls += 1
+        self.path = path
+        self.baseline = _file_signature(path)
+        self.pending = None
+        self.interval = WATCH_MIN_INTERVAL
+
+    def _idle(self) -> float:
+        self.interval = min(self.interval * WATCH_BACKOFF, WATCH_MAX_INTERVAL)
+        return self.interval
+
+    def tick(self) -> float:
+        """Check the watched file once and return the delay until the next check."""
+
+        filepath = _state_store.filepath()
+        if not filepath or _background_export is not None:
+            self.interval = WATCH_MAX_INTERVAL
+            return self.interval
+
+        path = Path(filepath)
+        if path != self.path:
+            # A new export; its own contents are not a RizomUV result.
+            self.rebaseline(path)
+            return self.interval
+
+        self.stat_calls += 1
+        signature = _file_signature(path)
+        if signature is None or signature == self.baseline:
+            self.pending = None
+            return self._idle()
+
+        now = time.monotonic()
+        if signature != self.pending:
+            self.pending = signature
+            self.pending_since = now
+            self.interval = WATCH_MIN_INTERVAL
+            return WATCH_MIN_INTERVAL
+        if now - self.pending_since < WATCH_SETTLE_TIME:
+            return WATCH_MIN_INTERVAL
+
+        self.baseline = signature
+        self.pending = None
+        self.interval = WATCH_MIN_INTERVAL
+        if _run_auto_import():
+            self.imports += 1
+        return self.interval
+
+    def stats(self) -> Dict[str, int]:
+        return {"stat_calls": self.stat_calls, "imports": self.imports}
+
+
+def _run_auto_import() -> bool:
+    """Run the import operator from a timer and return whether it finished."""
+
+    window_manager = bpy.context.window_manager
+    if window_manager is None or not window_manager.windows:
+        return False
+    # ``import`` is a keyword, so the operator cannot be reached as an attribute.
+    import_operator = getattr(bpy.ops.dks_ruv, "import")
+    with bpy.context.temp_override(window=window_manager.windows[0]):
+        if not import_operator.poll():
+            return False
+        try:
+            return 'FINISHED' in import_operator('EXEC_DEFAULT')
+        except RuntimeError as exc:
+            _report_status('ERROR', f"Automatic RizomUV import failed: {exc}")
+            return False
+
+
+_result_watcher = _ResultWatcher()
+
+
+def _watch_rizom_result() -> Optional[float]:
+    return _result_watcher.tick()
+
+
+def set_auto_import(enabled: bool) -> None:
+    """Start or stop watching the last export for RizomUV results."""
+
+    registered = bpy.app.timers.is_registered(_watch_rizom_result)
+    if enabled and not registered:
+        _result_watcher.path = None
+        bpy.app.timers.register(_watch_rizom_result, first_interval=WATCH_MIN_INTERVAL, persistent=True)
+    elif not enabled and registered:
+        bpy.app.timers.unregister(_watch_rizom_result)
+
+
+def auto_import_stats() -> Dict[str, int]:
+    return _result_watcher.stats()
+
+
+class _ImportRun:
+    """UV transfer of one RizomUV result, applied one target at a time.
+
+    Used by both the blocking and the modal import. With ``keep_originals``,
+    the UV maps of every target (and nothing else of its mesh) are copied
+    before they are changed so that a cancelled import can put them back.
+    """
+
+    def __init__(self, state: Dict[str, object], export_targets: List[Tuple[str, Object]],
+                 remove_stale_layers: bool, keep_originals: bool = False):
+        prefs = _prefs()
+        self.export_targets = export_targets
+        self.remove_stale_layers = remove_stale_layers
+        self.transfer_by_position = prefs.option_transfer_by_position
+        self.result_cache = _result_cache(prefs.option_result_cache_mb) if prefs.option_result_cache else None
+        self.fingerprints = state.get("fingerprints", {})
+        self.keep_originals = keep_originals
+        self.originals: List[Tuple[Object, Tuple[List[Tuple[str, np.ndarray]], Optional[str]]]] = []
+        self.imported_meshes: Dict[str, FBXMesh] = {}
+        self.index = 0
+        self.updated_targets: List[Object] = []
+        self.written_layers = 0
+        self.written_loops = 0
+        self.transfer_time = 0.0
+        self.mode_snapshot: Dict[str, str] = {}
+        self.mode_time = 0.0
+        self.previous_active: Optional[Object] = None
+
+    @property
+    def done(self) -> bool:
+        return self.index >= len(self.export_targets)
+
+    def begin(self, context) -> None:
+        self.previous_active = context.view_layer.objects.active
+        mode_start = time.perf_counter()
+        self.mode_snapshot = _ensure_objects_object_mode(context, [obj for _name, obj in self.export_targets])
+        self.mode_time += time.perf_counter() - mode_start
+
+    def end(self, context) -> None:
+        mode_start = time.perf_counter()
+        _restore_object_modes(context, self.mode_snapshot)
+        self.mode_time += time.perf_counter() - mode_start
+        try:
+            context.view_layer.objects.active = self.previous_active
+        except ReferenceError:
+            # Deleted while a modal import was running.
+            context.view_layer.objects.active = None
+
+    def apply_next(self, operator) -> None:
+        """Transfer the UVs of the next target; raises ``RuntimeError`` on failure.
+
+        Targets that were deleted or entered Edit Mode since the import
+        started, which a modal import allows, are skipped.
+        """
+
+        source_name, target = self.export_targets[self.index]
+        self.index += 1
+        try:
+            target_name = target.name
+        except ReferenceError:
+            operator.report({'WARNING'}, f"'{source_name}' was deleted during the import; skipped it.")
+            return
+        if target.mode == 'EDIT':
+            operator.report({'WARNING'}, f"'{target_name}' is in Edit Mode; skipped it.")
+            return
+        source = self.imported_meshes.get(source_name)
+        if source is None:
+            operator.report({'WARNING'}, f"Imported data for '{source_name}' was not found.")
+            return
+
+        start = time.perf_counter()
+        # The loops of the target are read once and aligned here, so the
+        # result cache stores UVs in the loop order of the target.
+        loops = _mesh_loops(target.data)
+        positions: Optional[np.ndarray] = None
+        try:
+            source = _ensure_uv_topology_matches(source, target, self.fingerprints.get(target.name), loops)
+        except _TopologyMismatch:
+            if not self.transfer_by_position or source.vertices is None:
+                raise
+            positions = _mesh_positions(target.data)
+            source, nearest_loops = _transfer_uvs_by_position(source, target, positions, loops)
+            operator.report({'WARNING'}, (
+                f"Topology of '{target.name}' differs from the RizomUV result; transferred UVs by position "
+                f"({nearest_loops} of {source.loop_count} loops matched by nearest neighbor)"
+            ))
+        if self.keep_originals:
+            self.originals.append((target, _uv_snapshot(target.data)))
+        target_layers, target_loops = _copy_uv_layers(source, target, self.remove_stale_layers, aligned=True)
+        self.transfer_time += time.perf_counter() - start
+
+        if self.result_cache is not None:
+            if positions is None:
+                positions = _mesh_positions(target.data)
+            key = _result_key(target, positions, *loops)
+            if key is not None:
+                _store_result(self.result_cache, key, source)
+        self.written_layers += target_layers
+        self.written_loops += target_loops
+        if target_layers:
+            self.updated_targets.append(target)
+
+    def rollback(self) -> int:
+        """Put back the UV maps of every target changed so far and return how many there were."""
+
+        restored = 0
+        for target, snapshot in reversed(self.originals):
+            try:
+                if target.mode == 'EDIT':
+                    continue
+                _restore_uv_snapshot(target, snapshot)
+            except (ReferenceError, RuntimeError):
+                # Deleted, or edited into a different topology, since.
+                continue
+            restored += 1
+        self.originals.clear()
+        self.updated_targets.clear()
+        return restored
+
+    def report(self, operator) -> None:
+        if self.written_loops:
+            rate = self.written_loops / self.transfer_time if self.transfer_time > 0.0 else float("inf")
+            operator.report({'INFO'}, (
+                f"Updated {self.written_layers} UV maps ({self.written_loops} loops) on {len(self.updated_targets)} "
+                f"objects in {self.transfer_time:.3f}s ({rate:,.0f} loops/s)"
+            ))
+        else:
+            operator.report({'INFO'}, "UVs are already up to date; no UV maps were changed.")
+        _report_mode_switch(operator, self.mode_snapshot, self.mode_time)
+
+
+class _ResultReader:
+    """Decodes a binary RizomUV result on a worker thread.
+
+    Only :mod:`dks_ruv_fbx` runs on the worker. ``meshes`` stays ``None`` when
+    the file has to go through Blender's importer on the main thread instead.
+    """
+
+    def __init__(self, filepath: Path, workers: int, with_vertices: bool):
+        self.meshes: Optional[Dict[str, FBXMesh]] = None
+        self._thread = threading.Thread(target=self._run, args=(filepath, workers, with_vertices),
+                                        name="dks_ruv_import", daemon=True)
+        self._thread.start()
+
+    def _run(self, filepath: Path, workers: int, with_vertices: bool) -> None:
+        try:
+            self.meshes = dks_ruv_fbx.read_uv_meshes(filepath, workers, with_vertices)
+        except dks_ruv_fbx.FBXError:
+            self.meshes = None
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+
 class dks_ruv_import(bpy.types.Operator):
     bl_idname = "dks_ruv.import"
     bl_label = "RizomUV"
     bl_description = "Import UVs from RizomUV back into the active object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    remove_stale_uv_layers: bpy.props.BoolProperty(  # type: ignore[valid-type]
+        name="Remove Stale UV Maps",
+        description="Delete UV maps that do not exist in the RizomUV result instead of keeping them",
+        default=False,
+    )
 
     @classmethod
     def poll(cls, context):
-        state = _load_state()
-        if not state.get("objects"):
-            return False
-        for name in state.get("objects", []):
-            obj = bpy.data.objects.get(name)
-            if obj and obj.type == 'MESH':
-                return True
-        return False
+        return _state_store.has_export_target()
 
-    def execute(self, context):
+    def _import_request(self, context) -> Optional[Tuple[Dict[str, object], List[Tuple[str, Object]], Path]]:
         if not _require_saved_file(self):
-            return {'CANCELLED'}
+            return None
 
         state = _load_state()
-        export_objects = [bpy.data.objects.get(name) for name in state.get("objects", [])]
-        export_objects = [obj for obj in export_objects if obj and obj.type == 'MESH']
-        if not export_objects:
+        export_targets = _export_targets(state)
+        if not export_targets:
             self.report({'ERROR'}, "No previous RizomUV export found for the current scene.")
-            return {'CANCELLED'}
+            return None
 
         import_path = state.get("filepath")
         if import_path:
@@ -362,56 +1809,237 @@ class dks_ruv_import(bpy.types.Operator):
             active = context.view_layer.objects.active
             if not active or active.type != 'MESH':
                 self.report({'ERROR'}, "Unable to determine which RizomUV export to import.")
-                return {'CANCELLED'}
+                return None
             import_file = _export_filename(active)
 
         if not import_file.is_file():
             self.report({'ERROR'}, f"No RizomUV export found at {import_file}")
-            return {'CANCELLED'}
+            return None
+        return state, export_targets, import_file
 
-        selection_snapshot = _selection_snapshot(context)
-        mode_snapshot = _ensure_objects_object_mode(context, export_objects)
+    def execute(self, context):
+        request = self._import_request(context)
+        if request is None:
+            return {'CANCELLED'}
+        state, export_targets, import_file = request
 
+        prefs = _prefs()
+        run = _ImportRun(state, export_targets, self.remove_stale_uv_layers)
+        run.begin(context)
         try:
-            imported_objects = _import_fbx(import_file)
+            run.imported_meshes = _read_rizom_result(context, import_file, prefs.option_import_threads,
+                                                     prefs.option_transfer_by_position)
+            while not run.done:
+                run.apply_next(self)
         except RuntimeError as exc:
             self.report({'ERROR'}, str(exc))
-            _restore_object_modes(context, mode_snapshot)
-            _restore_selection(context, *selection_snapshot)
             return {'CANCELLED'}
+        finally:
+            run.end(context)
 
-        imported_by_name = {obj.name: obj for obj in imported_objects}
-        updated_targets: List[Object] = []
-        for target in export_objects:
-            source = imported_by_name.get(target.name)
-            if not source:
-                self.report({'WARNING'}, f"Imported data for '{target.name}' was not found.")
-                continue
+        run.report(self)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        request = self._import_request(context)
+        if request is None:
+            return {'CANCELLED'}
+        state, export_targets, import_file = request
+
+        prefs = _prefs()
+        self._run = _ImportRun(state, export_targets, self.remove_stale_uv_layers, keep_originals=True)
+        self._run.begin(context)
+        self._import_file = import_file
+        self._reader = _ResultReader(import_file, prefs.option_import_threads, prefs.option_transfer_by_position)
+
+        window_manager = context.window_manager
+        self._timer = window_manager.event_timer_add(MODAL_IMPORT_TIMER_STEP, window=context.window)
+        window_manager.modal_handler_add(self)
+        window_manager.progress_begin(0, len(export_targets))
+        return {'RUNNING_MODAL'}
+
+    def _stop(self, context) -> None:
+        window_manager = context.window_manager
+        window_manager.event_timer_remove(self._timer)
+        window_manager.progress_end()
+        self._run.end(context)
+
+    def _abort(self, context, message: str):
+        """Undo the UV maps written so far and end the modal import."""
+
+        try:
+            self._run.rollback()
+        finally:
+            self._stop(context)
+        self.report({'ERROR'}, message)
+        return {'CANCELLED'}
+
+    def modal(self, context, event):
+        run = self._run
+        if event.type == 'ESC':
             try:
-                _copy_uv_layers(source, target)
-            except RuntimeError as exc:
-                self.report({'ERROR'}, str(exc))
-                _cleanup_import(imported_objects)
-                _restore_object_modes(context, mode_snapshot)
-                _restore_selection(context, *selection_snapshot)
-                return {'CANCELLED'}
-            updated_targets.append(target)
+                restored = run.rollback()
+            finally:
+                self._stop(context)
+            self.report({'WARNING'}, (
+                f"RizomUV import cancelled after {run.index} of {len(run.export_targets)} objects; "
+                f"restored the UV maps of {restored} objects"
+            ))
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
 
-        _cleanup_import(imported_objects)
+        try:
+            if self._reader is not None:
+                if self._reader.is_alive():
+                    return {'RUNNING_MODAL'}
+                meshes = self._reader.meshes
+                self._reader = None
+                if meshes is None:
+                    prefs = _prefs()
+                    meshes = _read_rizom_result(context, self._import_file, prefs.option_import_threads,
+                                                prefs.option_transfer_by_position)
+                elif not meshes:
+                    raise RuntimeError("No mesh objects were imported from RizomUV.")
+                run.imported_meshes = meshes
+
+            deadline = time.perf_counter() + MODAL_IMPORT_TIME_SLICE
+            while not run.done and time.perf_counter() < deadline:
+                run.apply_next(self)
+        except RuntimeError as exc:
+            return self._abort(context, str(exc))
+        except Exception as exc:
+            # Anything else would leave the timer, the progress bar and the
+            # object modes behind with the modal handler gone.
+            return self._abort(context, f"RizomUV import failed: {exc!r}")
+
+        context.window_manager.progress_update(run.index)
+        if not run.done:
+            return {'RUNNING_MODAL'}
+
+        self._stop(context)
+        run.report(self)
+        return {'FINISHED'}
+
+
+class dks_ruv_clear_result_cache(bpy.types.Operator):
+    bl_idname = "dks_ruv.clear_result_cache"
+    bl_label = "Clear Result Cache"
+    bl_description = "Forget every RizomUV unwrap stored for reuse on identical geometry"
+
+    def execute(self, context):
+        removed = _result_cache(_prefs().option_result_cache_mb).clear()
+        self.report({'INFO'}, f"Removed {removed} cached RizomUV results.")
+        return {'FINISHED'}
+
+
+def batch_unwrap(context, objects: Iterable[Object], process: Callable[[object, BatchJob], None],
+                 workers: Optional[int] = None, link_factory: Optional[Callable[[], object]] = None,
+                 reporter=None) -> List[BatchJob]:
+    """Unwrap every mesh in ``objects`` on a pool of RizomUV instances and import the results.
+
+    Each mesh is written to its own FBX file. ``process(link, job)`` runs the
+    RizomUVLink commands of one job: it has to load ``job.source``, unwrap it
+    and save the result to ``job.output``. ``workers`` defaults to the *Batch
+    Workers* preference and ``link_factory`` to ``CRizomUVLink``. Blocks until
+    every job finished and quits the RizomUV instances it started; meant for
+    pipeline scripts, for example in a background Blender. Returns the jobs,
+    failed ones carrying their error.
+    """
 
-        if updated_targets:
-            for obj in updated_targets:
-                obj.data.update()
+    if link_factory is None:
+        if CRizomUVLink is None:
+            raise RuntimeError("Batch unwrapping requires the RizomUVLink module.")
+        link_factory = CRizomUVLink
+    reporter = reporter if reporter is not None else _StatusReporter()
 
+    meshes = list(_group_by_mesh([obj for obj in objects if obj.type == 'MESH'], None))
+    batch_directory = _export_directory() / "batch"
+    batch_directory.mkdir(parents=True, exist_ok=True)
+
+    previous_active = context.view_layer.objects.active
+    mode_snapshot = _ensure_objects_object_mode(context, meshes)
+    try:
+        jobs = _run_batch(context, meshes, batch_directory, process, workers, link_factory, reporter)
+    finally:
         _restore_object_modes(context, mode_snapshot)
-        _restore_selection(context, *selection_snapshot)
+        context.view_layer.objects.active = previous_active
+    return jobs
+
+
+def _run_batch(context, meshes: List[Object], batch_directory: Path, process: Callable[[object, BatchJob], None],
+               workers: Optional[int],
+               link_factory: Callable[[], object], reporter) -> List[BatchJob]:
+    prefs = _prefs()
+    depsgraph = context.evaluated_depsgraph_get()
+    global_matrix = _export_matrix()
+    unit_scale = 100.0 * context.scene.unit_settings.scale_length
+    buffers = _ExportBuffers()
+    jobs: List[BatchJob] = []
+    for index, obj in enumerate(meshes):
+        source = batch_directory / f"{index:05d}.fbx"
+        writer = dks_ruv_fbx.FBXWriter(compression=prefs.option_fbx_compression, unit_scale=unit_scale)
+        writer.add_mesh(_fbx_mesh_for_export(obj, depsgraph, global_matrix, buffers))
+        writer.write(source)
+        jobs.append(BatchJob(obj.name, source, batch_directory / f"{index:05d}_ruv.fbx"))
+
+    pool = dks_ruv_pool.WorkerPool(link_factory, str(Path(prefs.option_ruv_exe).expanduser()),
+                                   workers if workers is not None else prefs.option_batch_workers)
+    start = time.perf_counter()
+    try:
+        pool.run(jobs, process)
+    finally:
+        closed = pool.release()
+    stats = pool.stats()
+    reporter.report({'INFO'}, (
+        f"Unwrapped {sum(job.succeeded for job in jobs)} of {len(jobs)} meshes on {stats['workers']} RizomUV "
+        f"instances in {time.perf_counter() - start:.1f}s ({stats['launches']} launches, {stats['steals']} steals, "
+        f"{closed} instances closed)"
+    ))
+
+    for job, obj in zip(jobs, meshes):
+        if not job.succeeded:
+            reporter.report({'WARNING'}, f"RizomUV could not unwrap '{job.name}': {job.error}")
+            continue
+        # Linked duplicates share the mesh, so writing the UVs once covers them.
+        run = _ImportRun({}, [(obj.name, obj)], remove_stale_layers=False)
+        try:
+            run.imported_meshes = _read_rizom_result(context, job.output, prefs.option_import_threads,
+                                                     prefs.option_transfer_by_position)
+            while not run.done:
+                run.apply_next(reporter)
+        except RuntimeError as exc:
+            job.error = exc
+            reporter.report({'WARNING'}, f"Unable to import the RizomUV result of '{job.name}': {exc}")
+    return jobs
+
+
+class dks_ruv_report_status(bpy.types.Operator):
+    bl_idname = "dks_ruv.report_status"
+    bl_label = "RizomUV Bridge Status"
+    bl_description = "Show a status message of a RizomUV background task"
+    bl_options = {'INTERNAL'}
+
+    level: bpy.props.EnumProperty(  # type: ignore[valid-type]
+        items=(
+            ('INFO', "Info", ""),
+            ('WARNING', "Warning", ""),
+            ('ERROR', "Error", ""),
+        ),
+        default='INFO',
+    )
+    message: bpy.props.StringProperty()  # type: ignore[valid-type]
 
+    def execute(self, context):
+        self.report({self.level}, self.message)
         return {'FINISHED'}
 
 
 classes = (
     dks_ruv_import,
     dks_ruv_export,
+    dks_ruv_clear_result_cache,
+    dks_ruv_report_status,
 )
 
 
@@ -419,7 +2047,26 @@ def register():
     for cls in classes:
         register_class(cls)
 
+    # The preferences are not available yet while the add-on is first enabled.
+    try:
+        auto_import = _prefs().option_auto_import
+    except (AttributeError, KeyError):
+        auto_import = False
+    set_auto_import(auto_import)
+
 
 def unregister():
+    global _background_export
+
+    set_auto_import(False)
+    if _link_session is not None:
+        _link_session.release()
+
+    # A running worker finishes its file on its own; only the timer that
+    # would hand it to RizomUV is removed.
+    if bpy.app.timers.is_registered(_poll_background_export):
+        bpy.app.timers.unregister(_poll_background_export)
+    _background_export = None
+
     for cls in reversed(classes):
         unregister_class(cls)
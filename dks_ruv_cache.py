@@ -0,0 +1,159 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""Content-addressed file store used by the RizomUV bridge caches.
+
+Entries are plain files named after their key. The modification time of an
+entry doubles as its last-use time, so least recently used entries are evicted
+first once the store grows past its size budget.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import os
+import shutil
+import tempfile
+
+
+class ContentStore:
+    """Size-capped store of files keyed by a content digest."""
+
+    def __init__(self, directory: Path, max_bytes: int, suffix: str = ""):
+        self.directory = Path(directory)
+        self.max_bytes = max(0, int(max_bytes))
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the entry stored under ``key`` and mark it as recently used."""
+
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put_file(self, key: str, source: Path) -> Optional[Path]:
+        """Store a copy of ``source`` under ``key``."""
+
+        def copy(handle) -> None:
+            with open(source, "rb") as source_handle:
+                shutil.copyfileobj(source_handle, handle)
+
+        return self._store(key, copy)
+
+    def put_bytes(self, key: str, data: bytes) -> Optional[Path]:
+        """Store ``data`` under ``key``."""
+
+        return self._store(key, lambda handle: handle.write(data))
+
+    def _store(self, key: str, write) -> Optional[Path]:
+        if self.max_bytes <= 0:
+            return None
+
+        target = self.path_for(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write next to the target and rename, so readers never see a
+            # partially written entry.
+            descriptor, temp_name = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as handle:
+                    write(handle)
+                os.replace(temp_name, target)
+            except BaseException:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            return None
+
+        self.evict()
+        return target if target.exists() else None
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        try:
+            with os.scandir(self.directory) as iterator:
+                for entry in iterator:
+                    if entry.name.startswith(".") or not entry.name.endswith(self.suffix):
+                        continue
+                    try:
+                        info = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((info.st_mtime, info.st_size, Path(entry.path)))
+        except OSError:
+            pass
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _mtime, size, _path in self._entries())
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the store fits its budget."""
+
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, size, _path in entries)
+        removed = 0
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self.evictions += removed
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry and return how many were deleted."""
+
+        removed = 0
+        for _mtime, _size, path in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _mtime, size, _path in entries),
+        }
@@ -0,0 +1,792 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""Binary FBX access for the RizomUV bridge.
+
+Only the data the bridge needs is decoded: the polygon vertex indices and the
+``LayerElementUV`` arrays of every mesh geometry. Files are memory-mapped,
+node records are parsed lazily and array properties are kept as lightweight
+descriptors that are only decompressed when they are read, so nodes that are
+not needed never cost more than their header scan.
+
+:class:`FBXWriter` emits the minimal binary FBX the bridge sends to RizomUV:
+vertex positions, polygons, edge smoothing and UV maps, without materials,
+normals or any other scene data.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import mmap
+import struct
+import time
+import zlib
+
+import numpy as np
+
+
+FBX_MAGIC = b"Kaydara FBX Binary  \x00"
+_HEADER_SIZE = len(FBX_MAGIC) + 2 + 4
+
+_SCALAR_FORMATS = {
+    "Y": struct.Struct("<h"),
+    "C": struct.Struct("<?"),
+    "I": struct.Struct("<i"),
+    "F": struct.Struct("<f"),
+    "D": struct.Struct("<d"),
+    "L": struct.Struct("<q"),
+}
+
+_ARRAY_DTYPES = {
+    "f": np.dtype("<f4"),
+    "d": np.dtype("<f8"),
+    "l": np.dtype("<i8"),
+    "i": np.dtype("<i4"),
+    "b": np.dtype("?"),
+}
+
+_ARRAY_HEADER = struct.Struct("<III")
+_UINT32 = struct.Struct("<I")
+_NODE_HEADER_32 = struct.Struct("<IIIB")
+_NODE_HEADER_64 = struct.Struct("<QQQB")
+
+_NAME_SEPARATOR = "\x00\x01"
+# Upper bound of the zlib compression ratio, used to reject corrupted array
+# lengths before allocating for them.
+_MAX_DEFLATE_RATIO = 1032
+
+Vector3 = Tuple[float, float, float]
+Transform = Tuple[Vector3, Vector3, Vector3]
+_PER_VERTEX_MAPPINGS = {"ByVertice", "ByVertex", "ByControlPoint"}
+
+
+class FBXError(RuntimeError):
+    """Raised when a file cannot be read as a binary FBX file."""
+
+
+class FBXArray:
+    """Lazily decoded array property of an FBX node."""
+
+    __slots__ = ("_data", "dtype", "count", "encoding", "offset", "size")
+
+    def __init__(self, data, dtype: np.dtype, count: int, encoding: int, offset: int, size: int):
+        self._data = data
+        self.dtype = dtype
+        self.count = count
+        self.encoding = encoding
+        self.offset = offset
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def read(self) -> np.ndarray:
+        """Decode the array into a NumPy array that owns its memory."""
+
+        expected = self.count * self.dtype.itemsize
+        if self.encoding == 0:
+            if self.size != expected:
+                raise FBXError(f"Array at offset {self.offset} holds {self.size} bytes, expected {expected}")
+            return np.frombuffer(self._data, dtype=self.dtype, count=self.count, offset=self.offset).copy()
+        if self.encoding != 1:
+            raise FBXError(f"Unsupported array encoding {self.encoding} at offset {self.offset}")
+        if expected > self.size * _MAX_DEFLATE_RATIO + 1024:
+            # zlib cannot inflate this much, so the count is corrupted; do not
+            # let it size the output buffer.
+            raise FBXError(f"Array at offset {self.offset} claims {expected} bytes from {self.size} compressed bytes")
+
+        try:
+            raw = zlib.decompress(self._data[self.offset:self.offset + self.size], bufsize=max(expected, 1))
+        except zlib.error as exc:
+            raise FBXError(f"Corrupted compressed array at offset {self.offset}: {exc}") from exc
+        if len(raw) != expected:
+            raise FBXError(f"Array at offset {self.offset} holds {len(raw)} bytes, expected {expected}")
+        return np.frombuffer(raw, dtype=self.dtype)
+
+
+class FBXNode:
+    """A node record of a binary FBX file.
+
+    Only the record header is read up front. Properties and child records are
+    parsed on first access, so subtrees that are never visited are skipped
+    using the end offset stored in their header.
+    """
+
+    __slots__ = ("name", "_data", "_header", "_property_count", "_properties_start", "_children_start",
+                 "_end_offset", "_properties", "_children")
+
+    def __init__(self, name: str, data, header: struct.Struct, property_count: int, properties_start: int,
+                 children_start: int, end_offset: int):
+        self.name = name
+        self._data = data
+        self._header = header
+        self._property_count = property_count
+        self._properties_start = properties_start
+        self._children_start = children_start
+        self._end_offset = end_offset
+        self._properties: Optional[List[object]] = None
+        self._children: Optional[List[FBXNode]] = None
+
+    @property
+    def properties(self) -> List[object]:
+        if self._properties is None:
+            self._properties = _read_properties(self._data, self._properties_start, self._property_count)
+        return self._properties
+
+    @property
+    def children(self) -> List["FBXNode"]:
+        if self._children is None:
+            self._children = _read_nodes(self._data, self._children_start, self._end_offset, self._header)
+        return self._children
+
+    def find(self, name: str) -> Optional["FBXNode"]:
+        for child in self.children:
+            if child.name == name:
+                return child
+        return None
+
+    def find_all(self, name: str) -> Iterator["FBXNode"]:
+        return (child for child in self.children if child.name == name)
+
+    def value(self, name: str, default: object = None) -> object:
+        child = self.find(name)
+        if child is None or not child.properties:
+            return default
+        return child.properties[0]
+
+
+class FBXMesh:
+    """Plain array view of one mesh of an FBX file.
+
+    ``loop_vertices`` holds the vertex index of every polygon corner,
+    ``polygon_sizes`` the corner count of every polygon and ``uv_layers`` the
+    ``(name, coordinates)`` pairs of the UV maps, with two float32 values per
+    corner.
+
+    Meshes passed to :class:`FBXWriter` also carry ``vertices`` (three values
+    per vertex), ``loop_edges`` (the edge index of every corner),
+    ``sharp_edges`` (one flag per edge) and ``transform``, a ``(translation,
+    rotation, scale)`` triple with the rotation given as XYZ Euler angles in
+    degrees.
+    """
+
+    __slots__ = ("name", "vertex_count", "loop_vertices", "polygon_sizes", "uv_layers", "active_uv_index",
+                 "vertices", "loop_edges", "sharp_edges", "transform")
+
+    def __init__(self, name: str, vertex_count: int, loop_vertices: np.ndarray, polygon_sizes: np.ndarray,
+                 uv_layers: Optional[List[Tuple[str, np.ndarray]]] = None, active_uv_index: int = 0,
+                 vertices: Optional[np.ndarray] = None, loop_edges: Optional[np.ndarray] = None,
+                 sharp_edges: Optional[np.ndarray] = None, transform: Optional[Transform] = None):
+        self.name = name
+        self.vertex_count = vertex_count
+        self.loop_vertices = loop_vertices
+        self.polygon_sizes = polygon_sizes
+        self.uv_layers = uv_layers if uv_layers is not None else []
+        self.active_uv_index = active_uv_index
+        self.vertices = vertices
+        self.loop_edges = loop_edges
+        self.sharp_edges = sharp_edges
+        self.transform = transform
+
+    @property
+    def loop_count(self) -> int:
+        return len(self.loop_vertices)
+
+
+def _check_bounds(data, offset: int, size: int) -> None:
+    if offset < 0 or size < 0 or offset + size > len(data):
+        raise FBXError(f"Record at offset {offset} runs past the end of the file")
+
+
+def _read_string(data, offset: int) -> Tuple[bytes, int]:
+    _check_bounds(data, offset, _UINT32.size)
+    (length,) = _UINT32.unpack_from(data, offset)
+    start = offset + _UINT32.size
+    _check_bounds(data, start, length)
+    return bytes(data[start:start + length]), start + length
+
+
+def _read_properties(data, offset: int, count: int) -> List[object]:
+    properties: List[object] = []
+    for _ in range(count):
+        _check_bounds(data, offset, 1)
+        type_code = chr(data[offset])
+        offset += 1
+        scalar = _SCALAR_FORMATS.get(type_code)
+        if scalar is not None:
+            _check_bounds(data, offset, scalar.size)
+            properties.append(scalar.unpack_from(data, offset)[0])
+            offset += scalar.size
+        elif type_code in _ARRAY_DTYPES:
+            _check_bounds(data, offset, _ARRAY_HEADER.size)
+            count_, encoding, size = _ARRAY_HEADER.unpack_from(data, offset)
+            offset += _ARRAY_HEADER.size
+            _check_bounds(data, offset, size)
+            properties.append(FBXArray(data, _ARRAY_DTYPES[type_code], count_, encoding, offset, size))
+            offset += size
+        elif type_code == "S":
+            raw, offset = _read_string(data, offset)
+            properties.append(raw.decode("utf8", errors="replace"))
+        elif type_code == "R":
+            raw, offset = _read_string(data, offset)
+            properties.append(raw)
+        else:
+            raise FBXError(f"Unknown FBX property type {type_code!r} at offset {offset - 1}")
+    return properties
+
+
+def _read_node(data, offset: int, header: struct.Struct, parent_end: int) -> Tuple[Optional[FBXNode], int]:
+    end_offset, property_count, property_bytes, name_length = header.unpack_from(data, offset)
+    if end_offset == 0:
+        return None, offset + header.size + name_length
+
+    name_start = offset + header.size
+    properties_start = name_start + name_length
+    children_start = properties_start + property_bytes
+    if children_start > end_offset or end_offset > parent_end:
+        raise FBXError(f"Node at offset {offset} does not fit inside its parent")
+
+    name = bytes(data[name_start:name_start + name_length]).decode("ascii", errors="replace")
+    node = FBXNode(name, data, header, property_count, properties_start, children_start, end_offset)
+    return node, end_offset
+
+
+def _read_nodes(data, offset: int, end_offset: int, header: struct.Struct) -> List[FBXNode]:
+    nodes: List[FBXNode] = []
+    while offset + header.size <= end_offset:
+        node, offset = _read_node(data, offset, header, end_offset)
+        if node is None:
+            break
+        nodes.append(node)
+    return nodes
+
+
+def parse(data) -> FBXNode:
+    """Parse the binary FBX document held in ``data`` and return its root node.
+
+    ``data`` may be any object supporting the buffer protocol, such as a memory
+    view over a memory-mapped file. It must stay valid while the returned
+    nodes are used.
+    """
+
+    if len(data) < _HEADER_SIZE or bytes(data[:len(FBX_MAGIC)]) != FBX_MAGIC:
+        raise FBXError("Not a binary FBX file")
+
+    (version,) = _UINT32.unpack_from(data, _HEADER_SIZE - _UINT32.size)
+    header = _NODE_HEADER_64 if version >= 7500 else _NODE_HEADER_32
+
+    root = FBXNode("", data, header, 0, _HEADER_SIZE, _HEADER_SIZE, len(data))
+    root._properties = [version]
+    return root
+
+
+def _object_name(node: FBXNode) -> str:
+    if len(node.properties) < 2 or not isinstance(node.properties[1], str):
+        return ""
+    return node.properties[1].split(_NAME_SEPARATOR, 1)[0]
+
+
+def _array(node: FBXNode, name: str, decoded: Dict[int, np.ndarray]) -> Optional[np.ndarray]:
+    value = node.value(name)
+    if not isinstance(value, FBXArray):
+        return None
+    array = decoded.pop(id(value), None)
+    return array if array is not None else value.read()
+
+
+def _uv_layer_nodes(node: FBXNode) -> List[FBXNode]:
+    return sorted(node.find_all("LayerElementUV"), key=_layer_index)
+
+
+def _layer_index(layer: FBXNode) -> int:
+    index = layer.properties[0] if layer.properties else 0
+    return index if isinstance(index, int) else 0
+
+
+def _geometry_arrays(node: FBXNode, with_vertices: bool = False) -> List[FBXArray]:
+    """Return the array properties of a geometry that the UV transfer decodes."""
+
+    arrays = [node.value("PolygonVertexIndex")]
+    if with_vertices:
+        arrays.append(node.value("Vertices"))
+    for layer in _uv_layer_nodes(node):
+        arrays.append(layer.value("UV"))
+        if layer.value("ReferenceInformationType") == "IndexToDirect":
+            arrays.append(layer.value("UVIndex"))
+    return [array for array in arrays if isinstance(array, FBXArray)]
+
+
+def _decode_arrays(arrays: List[FBXArray], workers: int) -> Dict[int, np.ndarray]:
+    """Decode ``arrays`` keyed by ``id()``, using up to ``workers`` threads.
+
+    Every compressed array is an independent zlib stream and ``zlib`` releases
+    the GIL while inflating, so the arrays of all geometries can be decoded
+    concurrently.
+    """
+
+    if workers <= 1 or len(arrays) <= 1:
+        return {id(array): array.read() for array in arrays}
+
+    # Large arrays go first so a single big block does not end up last.
+    arrays = sorted(arrays, key=lambda array: array.size, reverse=True)
+    with ThreadPoolExecutor(max_workers=min(workers, len(arrays)), thread_name_prefix="dks_ruv_fbx") as executor:
+        return {id(array): decoded for array, decoded in zip(arrays, executor.map(FBXArray.read, arrays))}
+
+
+def _loop_uvs(layer: FBXNode, loop_vertices: np.ndarray, vertex_count: int, decoded: Dict[int, np.ndarray]) -> np.ndarray:
+    coordinates = _array(layer, "UV", decoded)
+    if coordinates is None:
+        raise FBXError("LayerElementUV without UV coordinates")
+    if len(coordinates) % 2:
+        raise FBXError("LayerElementUV holds an odd number of UV values")
+    coordinates = coordinates.astype(np.float32, copy=False).reshape(-1, 2)
+
+    reference = layer.value("ReferenceInformationType", "Direct")
+    if reference == "IndexToDirect":
+        indices = _array(layer, "UVIndex", decoded)
+        if indices is None or indices.dtype.kind not in "iu":
+            raise FBXError("LayerElementUV uses IndexToDirect without integer UVIndex")
+        if len(indices) and (indices.min() < -1 or indices.max() >= len(coordinates)):
+            raise FBXError("UVIndex refers to missing UV coordinates")
+        if len(indices) and not len(coordinates):
+            raise FBXError("LayerElementUV has indices but no UV coordinates")
+        # Unmapped corners are stored as -1 and fall back to the first coordinate.
+        coordinates = coordinates[np.maximum(indices, 0)]
+    elif reference != "Direct":
+        raise FBXError(f"Unsupported UV reference type {reference!r}")
+
+    mapping = layer.value("MappingInformationType", "ByPolygonVertex")
+    if mapping in _PER_VERTEX_MAPPINGS:
+        if len(coordinates) != vertex_count:
+            raise FBXError("Per-vertex UV layer does not match the vertex count")
+        coordinates = coordinates[loop_vertices]
+    elif mapping != "ByPolygonVertex":
+        raise FBXError(f"Unsupported UV mapping type {mapping!r}")
+
+    if len(coordinates) != len(loop_vertices):
+        raise FBXError("UV layer does not match the polygon vertex count")
+    return np.ascontiguousarray(coordinates).reshape(-1)
+
+
+def _read_geometry(node: FBXNode, name: str, decoded: Dict[int, np.ndarray], with_vertices: bool = False) -> FBXMesh:
+    vertices = node.value("Vertices")
+    if not isinstance(vertices, FBXArray):
+        raise FBXError(f"Geometry '{name}' has no vertices")
+    vertex_count = len(vertices) // 3
+
+    polygon_vertex_index = _array(node, "PolygonVertexIndex", decoded)
+    if polygon_vertex_index is None or polygon_vertex_index.dtype.kind not in "iu":
+        raise FBXError(f"Geometry '{name}' has no polygons")
+
+    # The last corner of every polygon is stored as the bitwise complement of
+    # its vertex index.
+    polygon_ends = polygon_vertex_index < 0
+    if len(polygon_vertex_index) and not polygon_ends[-1]:
+        raise FBXError(f"Geometry '{name}' ends in the middle of a polygon")
+    loop_vertices = np.where(polygon_ends, ~polygon_vertex_index, polygon_vertex_index).astype(np.int32)
+    if len(loop_vertices) and loop_vertices.max() >= vertex_count:
+        raise FBXError(f"Geometry '{name}' refers to missing vertices")
+    end_indices = np.flatnonzero(polygon_ends)
+    polygon_sizes = np.diff(end_indices, prepend=-1).astype(np.int32)
+
+    uv_layers: List[Tuple[str, np.ndarray]] = []
+    for layer in _uv_layer_nodes(node):
+        layer_name = layer.value("Name") or "UVMap"
+        uv_layers.append((layer_name, _loop_uvs(layer, loop_vertices, vertex_count, decoded)))
+
+    positions = None
+    if with_vertices:
+        positions = _array(node, "Vertices", decoded).astype(np.float32, copy=False)
+        if len(positions) != vertex_count * 3:
+            raise FBXError(f"Geometry '{name}' has an incomplete vertex array")
+
+    return FBXMesh(name, vertex_count, loop_vertices, polygon_sizes, uv_layers, vertices=positions)
+
+
+def read_meshes(root: FBXNode, workers: int = 1, with_vertices: bool = False) -> Dict[str, FBXMesh]:
+    """Return the meshes of a parsed FBX document keyed by their object name.
+
+    The arrays of all geometries are decoded up front on ``workers`` threads.
+    Vertex positions are only decoded when ``with_vertices`` is set.
+    """
+
+    objects = root.find("Objects")
+    if objects is None:
+        return {}
+
+    model_names: Dict[int, str] = {}
+    geometries: Dict[int, FBXNode] = {}
+    for node in objects.children:
+        if not node.properties:
+            continue
+        if node.name == "Model":
+            model_names[node.properties[0]] = _object_name(node)
+        elif node.name == "Geometry" and node.properties[-1] == "Mesh":
+            geometries[node.properties[0]] = node
+
+    geometry_owners: Dict[int, str] = {}
+    connections = root.find("Connections")
+    if connections is not None:
+        for connection in connections.find_all("C"):
+            if len(connection.properties) < 3 or connection.properties[0] != "OO":
+                continue
+            child_id, parent_id = connection.properties[1], connection.properties[2]
+            if child_id in geometries and parent_id in model_names:
+                geometry_owners.setdefault(child_id, model_names[parent_id])
+
+    arrays: List[FBXArray] = []
+    for node in geometries.values():
+        arrays.extend(_geometry_arrays(node, with_vertices))
+    decoded = _decode_arrays(arrays, workers)
+
+    meshes: Dict[str, FBXMesh] = {}
+    for geometry_id, node in geometries.items():
+        name = geometry_owners.get(geometry_id) or _object_name(node)
+        meshes[name] = _read_geometry(node, name, decoded, with_vertices)
+    return meshes
+
+
+def read_uv_meshes(filepath: Path, workers: int = 1, with_vertices: bool = False) -> Dict[str, FBXMesh]:
+    """Read the UV maps of every mesh stored in the binary FBX at ``filepath``.
+
+    The file is memory-mapped and only the arrays needed for the UV transfer
+    are decoded, so peak memory stays close to the size of the UV data.
+    ``workers`` sets how many threads decompress the arrays. ``with_vertices``
+    also decodes the vertex positions.
+    """
+
+    try:
+        with open(filepath, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return read_meshes(parse(view), workers, with_vertices)
+            finally:
+                view.release()
+    except (OSError, ValueError, OverflowError, struct.error) as exc:
+        raise FBXError(f"Unable to read FBX file {filepath}: {exc}") from exc
+
+
+# Binary FBX writing ----------------------------------------------------------
+
+FBX_VERSION = 7400
+FBX_CREATOR = "DKS RizomUV Bridge"
+
+# The FBX SDK validates the file id and creation time against the footer, so
+# these values have to be written together.
+_FILE_ID = b"\x28\xb3\x2a\xeb\xb6\x24\xcc\xc2\xbf\xc8\xb0\x2a\xa9\x2b\xfc\xf1"
+_TIME_ID = "1970-01-01 10:00:00:000"
+_FOOT_ID = b"\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e"
+_FOOT_MAGIC = b"\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b"
+
+_ARRAY_CODES = {value: key for key, value in _ARRAY_DTYPES.items()}
+# Arrays smaller than this are always stored raw, as the FBX SDK does.
+_MIN_COMPRESSED_BYTES = 128
+
+
+class Int64(int):
+    """Marks an integer property that is stored as a 64-bit FBX value."""
+
+
+def _encode_property(value, compression: int) -> bytes:
+    if isinstance(value, np.ndarray):
+        dtype = value.dtype.newbyteorder("<") if value.dtype.byteorder == ">" else value.dtype
+        code = _ARRAY_CODES.get(np.dtype(dtype))
+        if code is None:
+            raise TypeError(f"Unsupported FBX array type {value.dtype}")
+        raw = np.ascontiguousarray(value, dtype=_ARRAY_DTYPES[code]).tobytes()
+        encoding = 0
+        if compression > 0 and len(raw) >= _MIN_COMPRESSED_BYTES:
+            raw = zlib.compress(raw, compression)
+            encoding = 1
+        return code.encode("ascii") + _ARRAY_HEADER.pack(len(value), encoding, len(raw)) + raw
+    if isinstance(value, bool):
+        return b"C" + _SCALAR_FORMATS["C"].pack(value)
+    if isinstance(value, Int64):
+        return b"L" + _SCALAR_FORMATS["L"].pack(value)
+    if isinstance(value, int):
+        return b"I" + _SCALAR_FORMATS["I"].pack(value)
+    if isinstance(value, float):
+        return b"D" + _SCALAR_FORMATS["D"].pack(value)
+    if isinstance(value, str):
+        raw = value.encode("utf8")
+        return b"S" + _UINT32.pack(len(raw)) + raw
+    if isinstance(value, bytes):
+        return b"R" + _UINT32.pack(len(value)) + value
+    raise TypeError(f"Unsupported FBX property value {value!r}")
+
+
+class _Element:
+    """Node record that is encoded eagerly and placed in the file on write.
+
+    Properties (including compressed arrays) are encoded as soon as they are
+    added, so the source arrays can be released right away. Absolute offsets
+    are only computed when the document is written.
+    """
+
+    __slots__ = ("name", "property_count", "payload", "children")
+
+    def __init__(self, name: str, values: Tuple[object, ...], compression: int):
+        self.name = name.encode("ascii")
+        self.property_count = len(values)
+        self.payload = b"".join(_encode_property(value, compression) for value in values)
+        self.children: List[_Element] = []
+
+    def add(self, name: str, *values, compression: int = 0) -> "_Element":
+        child = _Element(name, values, compression)
+        self.children.append(child)
+        return child
+
+    def _needs_null_record(self, is_last: bool) -> bool:
+        return bool(self.children) or (not self.property_count and not is_last)
+
+    def size(self, header: struct.Struct, is_last: bool = False) -> int:
+        size = header.size + len(self.name) + len(self.payload)
+        last_index = len(self.children) - 1
+        size += sum(child.size(header, index == last_index) for index, child in enumerate(self.children))
+        if self._needs_null_record(is_last):
+            size += header.size
+        return size
+
+    def write(self, handle: BinaryIO, offset: int, header: struct.Struct, is_last: bool = False) -> int:
+        end_offset = offset + self.size(header, is_last)
+        handle.write(header.pack(end_offset, self.property_count, len(self.payload), len(self.name)))
+        handle.write(self.name)
+        handle.write(self.payload)
+        cursor = offset + header.size + len(self.name) + len(self.payload)
+        last_index = len(self.children) - 1
+        for index, child in enumerate(self.children):
+            cursor = child.write(handle, cursor, header, index == last_index)
+        if self._needs_null_record(is_last):
+            handle.write(b"\x00" * header.size)
+        return end_offset
+
+
+def _root_element(name: str, *values) -> _Element:
+    return _Element(name, values, 0)
+
+
+def _add_property70(properties: _Element, name: str, type_name: str, label: str, flags: str, *values) -> None:
+    properties.add("P", name, type_name, label, flags, *values)
+
+
+def _polygon_vertex_index(mesh: FBXMesh) -> np.ndarray:
+    polygon_vertex_index = np.array(mesh.loop_vertices, dtype=np.int32)
+    if len(mesh.polygon_sizes):
+        ends = np.cumsum(mesh.polygon_sizes, dtype=np.int64) - 1
+        polygon_vertex_index[ends] = ~polygon_vertex_index[ends]
+    return polygon_vertex_index
+
+
+def _indexed_uvs(coordinates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split per-corner UVs into unique coordinates and per-corner indices."""
+
+    pairs = np.ascontiguousarray(coordinates, dtype=np.float32).reshape(-1, 2)
+    # Two float32 values compare bit-exactly as one uint64, which is much
+    # cheaper to sort than a structured row.
+    keys = pairs.view(np.uint64).reshape(-1)
+    unique_keys, indices = np.unique(keys, return_inverse=True)
+    unique_pairs = unique_keys.view(np.float32).reshape(-1, 2)
+    return unique_pairs.astype(np.float64).reshape(-1), indices.astype(np.int32).reshape(-1)
+
+
+class FBXWriter:
+    """Write meshes and their UV maps to a minimal binary FBX file.
+
+    Each mesh is encoded (and its arrays compressed with the given zlib
+    ``compression`` level, 0 disables compression) when it is added, so the
+    caller can release its arrays before adding the next one.
+    ``unit_scale`` is the number of centimeters per scene unit. Files of
+    ``version`` 7500 and later use 64-bit record headers.
+    """
+
+    def __init__(self, compression: int = 1, unit_scale: float = 100.0, version: int = FBX_VERSION):
+        if version < 7100:
+            raise ValueError(f"Unsupported FBX version {version}")
+        self.compression = max(0, min(9, int(compression)))
+        self.unit_scale = float(unit_scale)
+        self.version = int(version)
+        self._geometries: List[_Element] = []
+        self._models: List[_Element] = []
+        self._connections: List[Tuple[int, int]] = []
+        self._next_id = 1000000
+
+    def _new_id(self) -> Int64:
+        self._next_id += 1
+        return Int64(self._next_id)
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def add_mesh(self, mesh: FBXMesh) -> None:
+        if mesh.vertices is None:
+            raise ValueError(f"Mesh '{mesh.name}' has no vertex positions")
+
+        compression = self.compression
+        geometry_id = self._new_id()
+        model_id = self._new_id()
+
+        geometry = _Element("Geometry", (geometry_id, f"{mesh.name}{_NAME_SEPARATOR}Geometry", "Mesh"), 0)
+        geometry.add("Properties70")
+        geometry.add("GeometryVersion", 124)
+        geometry.add("Vertices", np.asarray(mesh.vertices, dtype=np.float64).reshape(-1), compression=compression)
+        geometry.add("PolygonVertexIndex", _polygon_vertex_index(mesh), compression=compression)
+
+        layer_elements: List[Tuple[str, int]] = []
+        if mesh.loop_edges is not None and len(mesh.loop_edges):
+            # FBX stores every edge as the polygon corner it starts at. There
+            # is no layer element for UV seams, so only sharpness is written.
+            edge_indices, edge_loops = np.unique(mesh.loop_edges, return_index=True)
+            geometry.add("Edges", edge_loops.astype(np.int32), compression=compression)
+            if mesh.sharp_edges is not None:
+                smooth = (~np.asarray(mesh.sharp_edges, dtype=bool)[edge_indices]).astype(np.int32)
+                smoothing = geometry.add("LayerElementSmoothing", 0)
+                smoothing.add("Version", 102)
+                smoothing.add("Name", "")
+                smoothing.add("MappingInformationType", "ByEdge")
+                smoothing.add("ReferenceInformationType", "Direct")
+                smoothing.add("Smoothing", smooth, compression=compression)
+                layer_elements.append(("LayerElementSmoothing", 0))
+
+        uv_layer_count = 0
+        for uv_index, (name, coordinates) in enumerate(mesh.uv_layers):
+            unique_uvs, uv_indices = _indexed_uvs(coordinates)
+            uv_layer = geometry.add("LayerElementUV", uv_index)
+            uv_layer.add("Version", 101)
+            uv_layer.add("Name", name)
+            uv_layer.add("MappingInformationType", "ByPolygonVertex")
+            uv_layer.add("ReferenceInformationType", "IndexToDirect")
+            uv_layer.add("UV", unique_uvs, compression=compression)
+            uv_layer.add("UVIndex", uv_indices, compression=compression)
+            uv_layer_count += 1
+
+        for layer_index in range(max(uv_layer_count, 1)):
+            layer = geometry.add("Layer", layer_index)
+            layer.add("Version", 100)
+            if layer_index == 0:
+                for element_type, typed_index in layer_elements:
+                    element = layer.add("LayerElement")
+                    element.add("Type", element_type)
+                    element.add("TypedIndex", typed_index)
+            if layer_index < uv_layer_count:
+                element = layer.add("LayerElement")
+                element.add("Type", "LayerElementUV")
+                element.add("TypedIndex", layer_index)
+
+        translation, rotation, scale = mesh.transform or ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+        model = _Element("Model", (model_id, f"{mesh.name}{_NAME_SEPARATOR}Model", "Mesh"), 0)
+        model.add("Version", 232)
+        properties = model.add("Properties70")
+        _add_property70(properties, "Lcl Translation", "Lcl Translation", "", "A", *map(float, translation))
+        _add_property70(properties, "Lcl Rotation", "Lcl Rotation", "", "A", *map(float, rotation))
+        _add_property70(properties, "Lcl Scaling", "Lcl Scaling", "", "A", *map(float, scale))
+        _add_property70(properties, "DefaultAttributeIndex", "int", "Integer", "", 0)
+        model.add("MultiLayer", 0)
+        model.add("MultiTake", 0)
+        model.add("Shading", True)
+        model.add("Culling", "CullingOff")
+
+        self._geometries.append(geometry)
+        self._models.append(model)
+        self._connections.append((geometry_id, model_id))
+        self._connections.append((model_id, Int64(0)))
+
+    def _elements(self) -> List[_Element]:
+        now = time.localtime()
+
+        header = _root_element("FBXHeaderExtension")
+        header.add("FBXHeaderVersion", 1003)
+        header.add("FBXVersion", self.version)
+        timestamp = header.add("CreationTimeStamp")
+        timestamp.add("Version", 1000)
+        for name, value in (("Year", now.tm_year), ("Month", now.tm_mon), ("Day", now.tm_mday),
+                            ("Hour", now.tm_hour), ("Minute", now.tm_min), ("Second", now.tm_sec),
+                            ("Millisecond", 0)):
+            timestamp.add(name, value)
+        header.add("Creator", FBX_CREATOR)
+
+        global_settings = _root_element("GlobalSettings")
+        global_settings.add("Version", 1000)
+        properties = global_settings.add("Properties70")
+        for name, value in (("UpAxis", 1), ("UpAxisSign", 1), ("FrontAxis", 2), ("FrontAxisSign", 1),
+                            ("CoordAxis", 0), ("CoordAxisSign", 1)):
+            _add_property70(properties, name, "int", "Integer", "", value)
+        _add_property70(properties, "UnitScaleFactor", "double", "Number", "", self.unit_scale)
+        _add_property70(properties, "OriginalUnitScaleFactor", "double", "Number", "", self.unit_scale)
+
+        documents = _root_element("Documents")
+        documents.add("Count", 1)
+        document = documents.add("Document", self._new_id(), "Scene", "Scene")
+        document.add("Properties70")
+        document.add("RootNode", Int64(0))
+
+        definitions = _root_element("Definitions")
+        definitions.add("Version", 100)
+        definitions.add("Count", 1 + 2 * len(self._models))
+        definitions.add("ObjectType", "GlobalSettings").add("Count", 1)
+        definitions.add("ObjectType", "Model").add("Count", len(self._models))
+        definitions.add("ObjectType", "Geometry").add("Count", len(self._geometries))
+
+        objects = _root_element("Objects")
+        objects.children.extend(self._geometries)
+        objects.children.extend(self._models)
+
+        connections = _root_element("Connections")
+        for child_id, parent_id in self._connections:
+            connections.add("C", "OO", child_id, parent_id)
+
+        return [
+            header,
+            _root_element("FileId", _FILE_ID),
+            _root_element("CreationTime", _TIME_ID),
+            _root_element("Creator", FBX_CREATOR),
+            global_settings,
+            documents,
+            _root_element("References"),
+            definitions,
+            objects,
+            connections,
+        ]
+
+    def write(self, filepath: Path) -> int:
+        """Write the document to ``filepath`` and return the file size."""
+
+        elements = self._elements()
+        header = _NODE_HEADER_64 if self.version >= 7500 else _NODE_HEADER_32
+        with open(filepath, "wb") as handle:
+            handle.write(FBX_MAGIC + b"\x1a\x00")
+            handle.write(_UINT32.pack(self.version))
+            offset = _HEADER_SIZE
+            for element in elements:
+                offset = element.write(handle, offset, header)
+            handle.write(b"\x00" * header.size)
+            offset += header.size
+
+            handle.write(_FOOT_ID)
+            handle.write(b"\x00" * 4)
+            offset += len(_FOOT_ID) + 4
+            # The footer is aligned to 16 bytes, with a full block of padding
+            # when the offset is already aligned.
+            padding = ((offset + 15) & ~15) - offset
+            handle.write(b"\x00" * (padding or 16))
+            handle.write(_UINT32.pack(self.version))
+            handle.write(b"\x00" * 120)
+            handle.write(_FOOT_MAGIC)
+            return handle.tell()
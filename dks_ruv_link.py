@@ -0,0 +1,173 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""Session-scoped RizomUVLink connection for the RizomUV bridge.
+
+Links are created through a ``link_factory``, normally ``CRizomUVLink``, so
+any object with the same ``RunRizomUV``, ``Connect`` and ``RizomUVVersion``
+methods can stand in for it.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import time
+
+
+class LinkSession:
+    """Keeps one RizomUVLink connection alive between sends.
+
+    A cached link is health-checked with a cheap version query before it is
+    reused. Reconnecting to a known port is retried ``max_attempts`` times
+    with exponential backoff starting at ``base_delay`` and capped at
+    ``max_delay`` seconds; RizomUV is only launched again when that fails.
+    """
+
+    def __init__(self, link_factory: Callable[[], object], max_attempts: int = 3, base_delay: float = 0.1,
+                 max_delay: float = 1.0, history: int = 32, sleep: Callable[[float], None] = time.sleep):
+        self.link_factory = link_factory
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.link = None
+        self.port: Optional[int] = None
+        # (connect seconds, send seconds, whether the link was reused)
+        self.latencies: Deque[Tuple[float, float, bool]] = deque(maxlen=history)
+        self.reuses = 0
+        self.connects = 0
+        self.launches = 0
+        self.failed_checks = 0
+        # Ports of the RizomUV instances this session started.
+        self.launched_ports: List[int] = []
+
+    def _healthy(self, link) -> bool:
+        try:
+            link.RizomUVVersion()
+        except Exception:
+            return False
+        return True
+
+    def _connect(self, port: int):
+        delay = self.base_delay
+        for attempt in range(self.max_attempts):
+            if attempt:
+                self.sleep(delay)
+                delay = min(delay * 2.0, self.max_delay)
+            link = self.link_factory()
+            try:
+                link.Connect(port)
+            except Exception:
+                continue
+            return link
+        return None
+
+    def connect(self, exe_path: str, port: Optional[int] = None) -> Tuple[object, int, bool]:
+        """Return a live link, its port and whether it was reused.
+
+        ``port`` is the port of a RizomUV instance started earlier, for
+        example in a previous Blender session. Raises the error of the launch
+        when no instance could be reached or started.
+        """
+
+        if self.link is not None and (port is None or port == self.port):
+            if self._healthy(self.link):
+                self.reuses += 1
+                return self.link, self.port, True
+            self.failed_checks += 1
+            port = self.port
+        self.release()
+
+        if isinstance(port, int):
+            link = self._connect(port)
+            if link is not None:
+                self.connects += 1
+                self.link, self.port = link, port
+                return link, port, False
+
+        link = self.link_factory()
+        port = link.RunRizomUV(exe_path)
+        self.launches += 1
+        self.launched_ports.append(port)
+        self.link, self.port = link, port
+        return link, port, False
+
+    def send(self, exe_path: str, port: Optional[int], command: Callable[[object], None]) -> int:
+        """Run ``command`` with a live link and return the port it used.
+
+        A link that fails the command is dropped, so the next send connects
+        again.
+        """
+
+        start = time.perf_counter()
+        link, port, reused = self.connect(exe_path, port)
+        connected = time.perf_counter()
+        try:
+            command(link)
+        except Exception:
+            self.release()
+            raise
+        self.latencies.append((connected - start, time.perf_counter() - connected, reused))
+        return port
+
+    def release(self) -> None:
+        """Forget the current link; the RizomUV instance keeps running."""
+
+        link, self.link = self.link, None
+        disconnect = getattr(link, "Disconnect", None)
+        if callable(disconnect):
+            try:
+                disconnect()
+            except Exception:
+                pass
+
+    def shutdown(self) -> int:
+        """Quit every RizomUV instance this session launched and forget the link.
+
+        Instances that cannot be reached any more, usually because they
+        crashed, are skipped. Returns how many instances were asked to quit.
+        """
+
+        closed = 0
+        for port in self.launched_ports:
+            link = self.link if port == self.port else None
+            try:
+                if link is None:
+                    link = self.link_factory()
+                    link.Connect(port)
+                link.Quit({"Force": True})
+            except Exception:
+                continue
+            closed += 1
+        self.launched_ports.clear()
+        self.release()
+        return closed
+
+    def stats(self) -> Dict[str, float]:
+        sends = len(self.latencies)
+        return {
+            "reuses": self.reuses,
+            "connects": self.connects,
+            "launches": self.launches,
+            "failed_checks": self.failed_checks,
+            "sends": sends,
+            "mean_connect_ms": sum(latency[0] for latency in self.latencies) * 1000.0 / sends if sends else 0.0,
+            "mean_send_ms": sum(latency[1] for latency in self.latencies) * 1000.0 / sends if sends else 0.0,
+        }
@@ -0,0 +1,201 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""Pool of RizomUV instances for unwrapping many files in parallel.
+
+Every worker drives its own RizomUV instance through a
+:class:`dks_ruv_link.LinkSession`, so each one listens on its own port and a
+crashed instance is relaunched the next time its worker connects. The
+instances belong to the pool and are closed by :meth:`WorkerPool.release`.
+Links are created through ``link_factory``; any object with the
+``RunRizomUV``, ``Connect``, ``RizomUVVersion`` and ``Quit`` methods of
+``CRizomUVLink`` (plus whatever the job callable uses) can stand in for
+RizomUV.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+import threading
+import time
+
+from .dks_ruv_link import LinkSession
+
+
+class BatchJob:
+    """One file to unwrap: ``process`` loads ``source`` and saves the result to ``output``."""
+
+    __slots__ = ("name", "source", "output", "attempts", "error", "port", "seconds")
+
+    def __init__(self, name: str, source: Path, output: Path):
+        self.name = name
+        self.source = source
+        self.output = output
+        self.attempts = 0
+        self.error: Optional[BaseException] = None
+        self.port: Optional[int] = None
+        self.seconds = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.attempts > 0
+
+
+class _Worker:
+    def __init__(self, session: LinkSession):
+        self.session = session
+        self.queue: Deque[BatchJob] = deque()
+        self.port: Optional[int] = None
+        self.completed = 0
+        self.retired = False
+
+
+class WorkerPool:
+    """Runs :class:`BatchJob` s on ``size`` RizomUV instances.
+
+    Jobs are dealt to the workers up front and every worker takes jobs from
+    the front of its own queue; a worker that runs dry steals from the back of
+    the longest other queue, and waits while jobs are still running elsewhere
+    since a failed one may be queued again. A job whose command fails is
+    queued again up to ``max_attempts`` times. The session drops a link that
+    failed, so the next job reconnects and relaunches RizomUV if the instance
+    died; a worker whose instance had to be relaunched more than
+    ``max_restarts`` times stops and leaves its jobs to the others.
+    """
+
+    def __init__(self, link_factory: Callable[[], object], exe_path: str, size: int, max_attempts: int = 2,
+                 max_restarts: int = 3, session_factory: Callable[[Callable[[], object]], LinkSession] = LinkSession):
+        self.exe_path = exe_path
+        self.max_attempts = max(1, max_attempts)
+        self.max_restarts = max(0, max_restarts)
+        self.workers = [_Worker(session_factory(link_factory)) for _index in range(max(1, size))]
+        self.steals = 0
+        # Guards the queues; notified whenever a job is queued or finished.
+        self._changed = threading.Condition()
+        # Jobs that are queued or running.
+        self._unfinished = 0
+
+    def _next_job(self, worker: _Worker) -> Optional[BatchJob]:
+        with self._changed:
+            while not worker.retired:
+                if worker.queue:
+                    return worker.queue.popleft()
+                victims = [other for other in self.workers if other is not worker and other.queue]
+                if victims:
+                    self.steals += 1
+                    return max(victims, key=lambda other: len(other.queue)).queue.pop()
+                if not self._unfinished:
+                    return None
+                self._changed.wait()
+            return None
+
+    def _requeue(self, job: BatchJob) -> bool:
+        """Queue ``job`` on the least busy worker; the lock must be held."""
+
+        active = [worker for worker in self.workers if not worker.retired]
+        if not active:
+            return False
+        min(active, key=lambda worker: len(worker.queue)).queue.append(job)
+        return True
+
+    def _finish(self, jobs: List[BatchJob]) -> None:
+        """Take ``jobs`` off the unfinished count; the lock must be held."""
+
+        self._unfinished -= len(jobs)
+        for job in jobs:
+            if job.error is None and not job.attempts:
+                job.error = RuntimeError("No RizomUV worker is left to run this job.")
+
+    def _settle(self, worker: _Worker, job: BatchJob) -> None:
+        """Record the outcome of ``job`` run by ``worker``."""
+
+        with self._changed:
+            if job.error is not None and worker.session.launches - 1 > self.max_restarts:
+                worker.retired = True
+                orphans = list(worker.queue)
+                worker.queue.clear()
+                self._finish([orphan for orphan in orphans if not self._requeue(orphan)])
+            if job.error is None or job.attempts >= self.max_attempts or not self._requeue(job):
+                self._finish([job])
+            self._changed.notify_all()
+
+    def _work(self, worker: _Worker, process: Callable[[object, BatchJob], None]) -> None:
+        while True:
+            job = self._next_job(worker)
+            if job is None:
+                return
+
+            job.attempts += 1
+            start = time.perf_counter()
+            try:
+                worker.port = worker.session.send(self.exe_path, worker.port, lambda link: process(link, job))
+            except Exception as exc:
+                job.error = exc
+            else:
+                job.error = None
+                job.port = worker.port
+                worker.completed += 1
+            job.seconds += time.perf_counter() - start
+            self._settle(worker, job)
+
+    def run(self, jobs: List[BatchJob], process: Callable[[object, BatchJob], None]) -> List[BatchJob]:
+        """Run ``process(link, job)`` for every job and return the jobs.
+
+        Blocks until every job either succeeded or used up its attempts;
+        failed jobs keep their last error.
+        """
+
+        with self._changed:
+            active = [worker for worker in self.workers if not worker.retired]
+            self._unfinished += len(jobs)
+            if not active:
+                self._finish(jobs)
+                return jobs
+            for index, job in enumerate(jobs):
+                active[index % len(active)].queue.append(job)
+
+        threads = [
+            threading.Thread(target=self._work, args=(worker, process), name=f"dks_ruv_pool_{index}", daemon=True)
+            for index, worker in enumerate(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return jobs
+
+    def release(self) -> int:
+        """Quit every RizomUV instance the pool launched and drop the links.
+
+        Returns how many instances were shut down; crashed ones are gone
+        already.
+        """
+
+        return sum(worker.session.shutdown() for worker in self.workers)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": len(self.workers),
+            "retired": sum(worker.retired for worker in self.workers),
+            "completed": sum(worker.completed for worker in self.workers),
+            "launches": sum(worker.session.launches for worker in self.workers),
+            "steals": self.steals,
+        }
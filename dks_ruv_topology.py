@@ -0,0 +1,296 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""Vectorized mesh topology helpers for the RizomUV bridge.
+
+Meshes are described by plain NumPy arrays: vertex ``positions`` (three
+values per vertex), ``polygon_sizes`` (corner count per polygon) and
+``loop_vertices`` (vertex index per polygon corner).
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import hashlib
+
+import numpy as np
+
+
+def _update(hasher, array: np.ndarray, dtype) -> None:
+    hasher.update(np.ascontiguousarray(array, dtype=dtype))
+
+
+def geometry_digest(positions: np.ndarray, polygon_sizes: np.ndarray, loop_vertices: np.ndarray,
+                    precision: Optional[float] = None) -> str:
+    """Return a digest identifying a mesh by its topology and vertex positions.
+
+    Positions are compared bit-exactly unless ``precision`` is given, in which
+    case they are quantized to multiples of it first.
+    """
+
+    positions = np.asarray(positions).reshape(-1)
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(np.array([len(positions) // 3, len(polygon_sizes), len(loop_vertices)], dtype=np.int64))
+    _update(hasher, polygon_sizes, np.int32)
+    _update(hasher, loop_vertices, np.int32)
+    if precision:
+        _update(hasher, np.round(positions / precision), np.int64)
+    else:
+        # Adding zero turns -0.0 into 0.0 so both hash the same.
+        _update(hasher, positions.astype(np.float32) + np.float32(0.0), np.float32)
+    return hasher.hexdigest()
+
+
+def topology_fingerprint(polygon_starts: np.ndarray, polygon_sizes: np.ndarray, loop_vertices: np.ndarray) -> str:
+    """Return a digest of the polygon layout and loop vertex order of a mesh.
+
+    Unlike vertex and loop counts, the fingerprint changes when polygons or
+    loops are reordered or the mesh is re-triangulated.
+    """
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(np.array([len(polygon_sizes), len(loop_vertices)], dtype=np.int64))
+    _update(hasher, polygon_starts, np.int32)
+    _update(hasher, polygon_sizes, np.int32)
+    _update(hasher, loop_vertices, np.int32)
+    return hasher.hexdigest()
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Scramble integers with the SplitMix64 finalizer."""
+
+    with np.errstate(over="ignore"):
+        mixed = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        mixed = (mixed ^ (mixed >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        mixed = (mixed ^ (mixed >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return mixed ^ (mixed >> np.uint64(31))
+
+
+def _polygon_keys(polygon_starts: np.ndarray, polygon_sizes: np.ndarray, loop_vertices: np.ndarray) -> np.ndarray:
+    """Return one hash per polygon that does not depend on where its loops start."""
+
+    mixed = _mix(loop_vertices)
+    with np.errstate(over="ignore"):
+        keys = np.add.reduceat(mixed, polygon_starts) if len(polygon_starts) else mixed[:0]
+        return _mix(keys ^ polygon_sizes.astype(np.uint64))
+
+
+def _first_corners(polygon_starts: np.ndarray, polygon_sizes: np.ndarray, loop_vertices: np.ndarray) -> np.ndarray:
+    """Return the corner offset of the lowest vertex index of every polygon."""
+
+    if not len(polygon_starts):
+        return polygon_starts.copy()
+    corners = np.arange(len(loop_vertices), dtype=np.int64) - np.repeat(polygon_starts, polygon_sizes)
+    lowest = np.repeat(np.minimum.reduceat(loop_vertices, polygon_starts), polygon_sizes)
+    corners[loop_vertices != lowest] = np.iinfo(np.int64).max
+    return np.minimum.reduceat(corners, polygon_starts)
+
+
+def remap_loops(source_sizes: np.ndarray, source_loop_vertices: np.ndarray,
+                target_sizes: np.ndarray, target_loop_vertices: np.ndarray) -> Optional[np.ndarray]:
+    """Match the loops of two meshes that differ only in polygon and loop order.
+
+    Polygons are paired through a hash of their vertex set, and the corners of
+    paired polygons are aligned on their lowest vertex index. Returns ``order``
+    such that source loop ``order[i]`` corresponds to target loop ``i``, or
+    ``None`` if the meshes are not equivalent.
+    """
+
+    source_sizes = np.asarray(source_sizes, dtype=np.int64)
+    target_sizes = np.asarray(target_sizes, dtype=np.int64)
+    source_loop_vertices = np.asarray(source_loop_vertices, dtype=np.int64)
+    target_loop_vertices = np.asarray(target_loop_vertices, dtype=np.int64)
+    if len(source_sizes) != len(target_sizes) or len(source_loop_vertices) != len(target_loop_vertices):
+        return None
+    if source_sizes.sum() != len(source_loop_vertices) or target_sizes.sum() != len(target_loop_vertices):
+        return None
+    if np.any(source_sizes <= 0) or np.any(target_sizes <= 0):
+        return None
+
+    source_starts = np.cumsum(source_sizes) - source_sizes
+    target_starts = np.cumsum(target_sizes) - target_sizes
+
+    # Sorting both key arrays pairs equal polygons by rank; duplicated vertex
+    # sets are paired in their original order.
+    source_keys = _polygon_keys(source_starts, source_sizes, source_loop_vertices)
+    target_keys = _polygon_keys(target_starts, target_sizes, target_loop_vertices)
+    source_rank = np.argsort(source_keys, kind="stable")
+    target_rank = np.argsort(target_keys, kind="stable")
+    if not np.array_equal(source_keys[source_rank], target_keys[target_rank]):
+        return None
+    matches = np.empty(len(target_sizes), dtype=np.int64)
+    matches[target_rank] = source_rank
+    if not np.array_equal(source_sizes[matches], target_sizes):
+        return None
+
+    source_first = _first_corners(source_starts, source_sizes, source_loop_vertices)
+    target_first = _first_corners(target_starts, target_sizes, target_loop_vertices)
+
+    polygon_of_loop = np.repeat(np.arange(len(target_sizes), dtype=np.int64), target_sizes)
+    sizes = target_sizes[polygon_of_loop]
+    corners = np.arange(len(target_loop_vertices), dtype=np.int64) - target_starts[polygon_of_loop]
+    corners = (corners - target_first[polygon_of_loop]) % sizes
+    matched = matches[polygon_of_loop]
+    order = source_starts[matched] + (source_first[matched] + corners) % sizes
+
+    # Hash collisions and flipped winding both end up here.
+    if not np.array_equal(source_loop_vertices[order], target_loop_vertices):
+        return None
+    return order
+
+
+def loop_samples(positions: np.ndarray, polygon_sizes: np.ndarray,
+                 loop_vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return a sample point and the polygon normal of every loop.
+
+    The sample point sits a quarter of the way from the corner towards the
+    polygon center, so corners that share a vertex but belong to different
+    polygons end up at different points.
+    """
+
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    polygon_sizes = np.asarray(polygon_sizes, dtype=np.int64)
+    loop_vertices = np.asarray(loop_vertices, dtype=np.int64)
+    if not len(polygon_sizes):
+        empty = np.empty((0, 3), dtype=np.float64)
+        return empty, empty.copy()
+
+    polygon_starts = np.cumsum(polygon_sizes) - polygon_sizes
+    polygon_of_loop = np.repeat(np.arange(len(polygon_sizes)), polygon_sizes)
+    corners = positions[loop_vertices]
+
+    centers = np.add.reduceat(corners, polygon_starts) / polygon_sizes[:, None]
+    points = corners + 0.25 * (centers[polygon_of_loop] - corners)
+
+    # Newell's method, which also works for non-planar polygons.
+    following = np.arange(1, len(loop_vertices) + 1)
+    ends = polygon_starts + polygon_sizes
+    following[ends - 1] = polygon_starts
+    normals = np.add.reduceat(np.cross(corners, corners[following]), polygon_starts)
+    lengths = np.linalg.norm(normals, axis=1)
+    normals /= np.where(lengths > 0.0, lengths, 1.0)[:, None]
+    return points, normals[polygon_of_loop]
+
+
+# Offsets of a grid cell and its 26 neighbours.
+_NEIGHBOUR_CELLS = np.stack(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), axis=-1).reshape(-1, 3)
+# Target loops compared with their candidates at once; bounds the size of the
+# candidate pair arrays.
+_MATCH_CHUNK = 1 << 15
+
+
+def _cell_keys(cells: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore"):
+        keys = np.zeros(len(cells), dtype=np.uint64)
+        for column in cells.T:
+            keys = _mix(keys ^ column.astype(np.uint64))
+    return keys
+
+
+def _sample_spacing(points: np.ndarray) -> float:
+    """Typical distance between neighbouring sample points.
+
+    Consecutive loops mostly belong to the same or adjacent polygons, so the
+    median step along the loop order approximates the polygon size.
+    """
+
+    steps = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    steps = steps[steps > 0.0]
+    return float(np.median(steps)) if len(steps) else 1.0
+
+
+def match_loops_by_position(source_points: np.ndarray, source_normals: np.ndarray, target_points: np.ndarray,
+                            target_normals: np.ndarray, cell: Optional[float] = None,
+                            min_facing: float = 0.5) -> np.ndarray:
+    """Pair every target loop with the nearest source loop facing the same way.
+
+    Source loops are bucketed in a grid of ``cell`` sized cells (see
+    :func:`loop_samples` for the points and normals). Every target loop is
+    compared in bulk with the source loops of the 27 cells around its own and
+    takes the nearest one whose normal has a dot product above ``min_facing``
+    with its own. Those cells hold every source loop closer than ``cell``, so
+    only matches within that distance are accepted. ``cell`` defaults to the
+    typical spacing of the source loops.
+
+    Returns the matching source loop of every target loop, or -1 where none
+    was found.
+    """
+
+    order = np.full(len(target_points), -1, dtype=np.int64)
+    if not len(source_points) or not len(target_points):
+        return order
+
+    if cell is None:
+        cell = _sample_spacing(source_points)
+    extent = float(np.linalg.norm(np.ptp(source_points, axis=0)))
+    cell = max(cell, extent * 1e-9, 1e-12)
+
+    source_keys = _cell_keys(np.floor(source_points / cell).astype(np.int64))
+    source_rank = np.argsort(source_keys, kind="stable")
+    sorted_keys = source_keys[source_rank]
+    # Neighbouring cells are looked up once per occupied target cell.
+    target_cells = np.floor(target_points / cell).astype(np.int64)
+    _keys, cell_index, cell_of_target = np.unique(_cell_keys(target_cells), return_index=True, return_inverse=True)
+    occupied_cells = target_cells[cell_index]
+    cell_of_target = cell_of_target.reshape(-1)
+
+    # Candidates further away than this may be beaten by a loop outside the
+    # neighbouring cells.
+    best = np.full(len(target_points), cell * cell)
+    for offset in _NEIGHBOUR_CELLS:
+        keys = _cell_keys(occupied_cells + offset)
+        lower = np.searchsorted(sorted_keys, keys, side="left")
+        counts = np.searchsorted(sorted_keys, keys, side="right") - lower
+        lower = lower[cell_of_target]
+        counts = counts[cell_of_target]
+        for start in range(0, len(target_points), _MATCH_CHUNK):
+            chunk = slice(start, start + _MATCH_CHUNK)
+            chunk_counts = counts[chunk]
+            total = int(chunk_counts.sum())
+            if not total:
+                continue
+            # Expand every [lower, lower + count) range of sorted source loops
+            # into (target, source) pairs, grouped by target.
+            group_starts = np.cumsum(chunk_counts) - chunk_counts
+            within = np.arange(total) - np.repeat(group_starts, chunk_counts)
+            targets = np.repeat(np.arange(start, start + len(chunk_counts)), chunk_counts)
+            sources = source_rank[np.repeat(lower[chunk], chunk_counts) + within]
+
+            offsets = target_points[targets] - source_points[sources]
+            distances = np.einsum("ij,ij->i", offsets, offsets)
+            facing = np.einsum("ij,ij->i", target_normals[targets], source_normals[sources]) > min_facing
+            distances[~facing] = np.inf
+
+            # Nearest candidate of every target in this cell, kept when it
+            # beats the ones found in the previous cells.
+            occupied = chunk_counts > 0
+            nearest = np.minimum.reduceat(distances, group_starts[occupied])
+            group_targets = np.arange(start, start + len(chunk_counts))[occupied]
+            closer = nearest < best[group_targets]
+            if not closer.any():
+                continue
+            is_nearest = distances == np.repeat(nearest, chunk_counts[occupied])
+            is_nearest &= np.repeat(closer, chunk_counts[occupied])
+            hits = np.flatnonzero(is_nearest)
+            first = np.ones(len(hits), dtype=bool)
+            first[1:] = targets[hits][1:] != targets[hits][:-1]
+            hits = hits[first]
+            best[targets[hits]] = distances[hits]
+            order[targets[hits]] = sources[hits]
+    return order
@@ -0,0 +1,73 @@
+"""Test setup for the RizomUV bridge.
+
+The repository root is the add-on package itself, so it is exposed to the
+tests as ``dks_ruv_bridge`` through a symlink in a temporary directory. When
+Blender's ``bpy`` module is not installed, the package ``__init__`` (which
+registers the add-on) cannot be imported; an empty stand-in package is used
+instead. ``dks_ruv_fbx``, ``dks_ruv_topology``, ``dks_ruv_cache``,
+``dks_ruv_link`` and ``dks_ruv_pool`` only need NumPy and the standard
+library, so their tests run with plain pytest. Tests that need Blender use
+the ``blender`` fixture and are skipped without it.
+"""
+
+from pathlib import Path
+
+import importlib.util
+import shutil
+import sys
+import tempfile
+import types
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+PACKAGE = "dks_ruv_bridge"
+
+HAS_BPY = importlib.util.find_spec("bpy") is not None
+
+_addon_dir = Path(tempfile.mkdtemp(prefix="dks_ruv_tests_"))
+(_addon_dir / PACKAGE).symlink_to(ROOT, target_is_directory=True)
+sys.path.insert(0, str(_addon_dir))
+
+if not HAS_BPY:
+    # pytest also imports the ``__init__`` of the repository root, as a
+    # package named after the checkout directory, so that name gets the
+    # stand-in too.
+    for _name in (PACKAGE, ROOT.name):
+        _package = types.ModuleType(_name)
+        _package.__file__ = str(ROOT / "__init__.py")
+        _package.__path__ = [str(_addon_dir / PACKAGE)]
+        sys.modules[_name] = _package
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_addon_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def fixtures():
+    return FIXTURES
+
+
+@pytest.fixture
+def blender(tmp_path):
+    """Start from an empty scene with the add-on enabled."""
+
+    if not HAS_BPY:
+        pytest.skip("requires Blender's bpy module")
+
+    import addon_utils
+    import bpy
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon_utils.enable(PACKAGE, default_set=True)
+    prefs = bpy.context.preferences.addons[PACKAGE].preferences
+    executable = tmp_path / "rizomuv"
+    executable.write_text("#!/bin/sh\nexit 0\n")
+    executable.chmod(0o755)
+    prefs.option_ruv_exe = str(executable)
+    bpy.ops.wm.save_as_mainfile(filepath=str(tmp_path / "scene.blend"))
+    yield bpy
+    addon_utils.disable(PACKAGE, default_set=True)
@@ -0,0 +1,82 @@
+"""Regenerate the Blender-exported FBX fixtures.
+
+Run with a Python that has Blender's ``bpy`` module installed::
+
+    python tests/fixtures/make_fixtures.py
+
+Every ``<name>.fbx`` is written by Blender's own FBX exporter and comes with a
+``<name>.npz`` holding the loop vertices, polygon sizes and UV maps of the
+exported meshes, as Blender stores them.
+"""
+
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+
+HERE = Path(__file__).resolve().parent
+
+
+def _mesh(name, vertices, polygons, uv_maps):
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(vertices, [], polygons)
+    for uv_name, transform in uv_maps:
+        layer = mesh.uv_layers.new(name=uv_name)
+        for loop in mesh.loops:
+            x, y, z = vertices[loop.vertex_index]
+            layer.data[loop.index].uv = transform(x, y, z)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _arrays(obj):
+    mesh = obj.data
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    polygon_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", polygon_sizes)
+    arrays = {f"{obj.name}/loop_vertices": loop_vertices, f"{obj.name}/polygon_sizes": polygon_sizes}
+    for layer in mesh.uv_layers:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uvs)
+        arrays[f"{obj.name}/uv/{layer.name}"] = uvs
+    return arrays
+
+
+def mixed_scene():
+    """A quad grid with two UV maps and a cone of triangles on an n-gon."""
+
+    grid_vertices = [(x, y, 0.0) for y in range(4) for x in range(4)]
+    grid_polygons = [(y * 4 + x, y * 4 + x + 1, (y + 1) * 4 + x + 1, (y + 1) * 4 + x)
+                     for y in range(3) for x in range(3)]
+    grid = _mesh("Grid", grid_vertices, grid_polygons,
+                 [("UVMap", lambda x, y, z: (x / 3.0, y / 3.0)),
+                  ("Lightmap", lambda x, y, z: (0.5 + y / 8.0, 0.25 + x / 8.0))])
+
+    sides = 7
+    cone_vertices = [(np.cos(2.0 * np.pi * i / sides), np.sin(2.0 * np.pi * i / sides), 0.0) for i in range(sides)]
+    cone_vertices.append((0.0, 0.0, 1.5))
+    cone_polygons = [tuple(reversed(range(sides)))]
+    cone_polygons += [(i, (i + 1) % sides, sides) for i in range(sides)]
+    cone = _mesh("Cone", cone_vertices, cone_polygons,
+                 [("UVMap", lambda x, y, z: (0.5 + x * 0.4, 0.5 + y * 0.4 + z * 0.1))])
+    cone.location = (4.0, 0.0, 0.0)
+    return [grid, cone]
+
+
+def main():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    objects = mixed_scene()
+    arrays = {}
+    for obj in objects:
+        arrays.update(_arrays(obj))
+    name = "blender_mixed"
+    bpy.ops.export_scene.fbx(filepath=str(HERE / f"{name}.fbx"), use_selection=False, object_types={'MESH'},
+                             bake_anim=False, embed_textures=False)
+    np.savez(HERE / f"{name}.npz", **arrays)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Synthetic quad grids shared by the tests and the NumPy benchmarks."""
+
+import numpy as np
+
+
+def quad_grid(size, extent=1.0, bend=0.0, split_corner=False):
+    """A ``size`` x ``size`` quad grid spanning ``extent`` in X and Y.
+
+    Returns the flat float64 vertex positions, the polygon sizes and the loop
+    vertices. ``bend`` lifts the grid along a sine wave so the polygon normals
+    vary; ``split_corner`` splits the first quad into two triangles.
+    """
+
+    xs, ys = np.meshgrid(np.linspace(0.0, extent, size + 1), np.linspace(0.0, extent, size + 1))
+    positions = np.stack([xs.ravel(), ys.ravel(), bend * np.sin(xs.ravel() * 3.0)], axis=1)
+    corner = (np.arange(size)[None, :] + np.arange(size)[:, None] * (size + 1)).ravel()
+    quads = np.stack([corner, corner + 1, corner + size + 2, corner + size + 1], axis=1)
+    polygon_sizes = np.full(size * size, 4, dtype=np.int32)
+    loop_vertices = quads.reshape(-1)
+    if split_corner:
+        a, b, c, d = quads[0]
+        loop_vertices = np.concatenate([[a, b, c, a, c, d], quads[1:].reshape(-1)])
+        polygon_sizes = np.concatenate([[3, 3], polygon_sizes[1:]])
+    return positions.reshape(-1), polygon_sizes.astype(np.int32), loop_vertices.astype(np.int32)
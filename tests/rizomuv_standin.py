@@ -0,0 +1,131 @@
+"""In-process stand-in for RizomUV and its ``CRizomUVLink`` Python link.
+
+:class:`StandInRizomUV` plays the RizomUV installation: every
+``RunRizomUV`` launches an instance listening on a new port, and links
+connect to instances by port. Loading a file listed in ``crashes`` kills the
+instance, after which its links fail like a real dead connection. Loads take
+``durations[name]`` seconds, and saving writes the loaded file to the output
+path with an ``unwrapped:`` prefix.
+"""
+
+from pathlib import Path
+
+import threading
+import time
+
+
+class LinkError(RuntimeError):
+    """Raised where ``CRizomUVLink`` raises ``CZEx``."""
+
+
+class _Instance:
+    def __init__(self, port):
+        self.port = port
+        self.alive = True
+        self.loaded = None
+        self.loads = 0
+
+
+class StandInLink:
+    """The subset of ``CRizomUVLink`` used by the bridge."""
+
+    def __init__(self, rizomuv):
+        self._rizomuv = rizomuv
+        self._instance = None
+
+    def _live(self):
+        if self._instance is None or not self._instance.alive:
+            raise LinkError("RizomUV is not connected")
+        return self._instance
+
+    def RunRizomUV(self, exe_path):
+        self._instance = self._rizomuv.launch(exe_path)
+        return self._instance.port
+
+    def Connect(self, port):
+        if self._rizomuv.refuse():
+            raise LinkError(f"Connection to port {port} refused")
+        instance = self._rizomuv.instances.get(port)
+        if instance is None or not instance.alive:
+            raise LinkError(f"Nothing listens on port {port}")
+        self._instance = instance
+
+    def RizomUVVersion(self):
+        self._live()
+        return "2025.0.0"
+
+    def Load(self, params):
+        instance = self._live()
+        path = Path(params["File"]["Path"])
+        time.sleep(self._rizomuv.durations.get(path.name, 0.0))
+        if self._rizomuv.crash(path.name):
+            instance.alive = False
+            raise LinkError(f"RizomUV crashed while loading {path.name}")
+        instance.loaded = path.read_bytes()
+        instance.loads += 1
+
+    def Save(self, params):
+        instance = self._live()
+        if instance.loaded is None:
+            raise LinkError("Nothing is loaded")
+        Path(params["File"]["Path"]).write_bytes(b"unwrapped:" + instance.loaded)
+
+    def Quit(self, params):
+        self._live().alive = False
+        self._instance = None
+
+    def Disconnect(self):
+        self._instance = None
+
+
+class StandInRizomUV:
+    """A RizomUV installation whose instances run inside the test process.
+
+    ``crashes`` maps file names to how many loads of that file crash the
+    instance; ``durations`` maps file names to the seconds a load takes.
+    The next ``refusals`` connection attempts fail as if the instance were
+    busy.
+    """
+
+    def __init__(self, crashes=None, durations=None, refusals=0, first_port=50000):
+        self.crashes = dict(crashes or {})
+        self.durations = dict(durations or {})
+        self.refusals = refusals
+        self.instances = {}
+        self.launched = []
+        self._next_port = first_port
+        self._lock = threading.Lock()
+
+    def launch(self, exe_path):
+        with self._lock:
+            instance = _Instance(self._next_port)
+            self._next_port += 1
+            self.instances[instance.port] = instance
+            self.launched.append(exe_path)
+            return instance
+
+    def crash(self, name):
+        with self._lock:
+            remaining = self.crashes.get(name, 0)
+            if remaining:
+                self.crashes[name] = remaining - 1
+            return bool(remaining)
+
+    def refuse(self):
+        with self._lock:
+            if self.refusals:
+                self.refusals -= 1
+                return True
+            return False
+
+    def link(self):
+        """Link factory, used where ``CRizomUVLink`` would be."""
+
+        return StandInLink(self)
+
+
+def unwrap(link, job):
+    """A batch job as a pipeline script would write it."""
+
+    link.Load({"File": {"Path": str(job.source)}})
+    link.Save({"File": {"Path": str(job.output)}})
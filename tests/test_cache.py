@@ -0,0 +1,81 @@
+"""Size budget and least-recently-used eviction of the content store."""
+
+import os
+
+from dks_ruv_bridge.dks_ruv_cache import ContentStore
+
+
+def _store(tmp_path, max_bytes, **entries):
+    """A store holding ``entries`` (key to last-use time) of ten bytes each."""
+
+    store = ContentStore(tmp_path / "store", max_bytes, ".bin")
+    store.max_bytes = 1 << 20
+    for key, used in entries.items():
+        store.put_bytes(key, b"0123456789")
+        os.utime(store.path_for(key), (used, used))
+    store.max_bytes = max_bytes
+    return store
+
+
+def _keys(store):
+    return sorted(path.stem for _mtime, _size, path in store._entries())
+
+
+def test_evict_removes_least_recently_used_first(tmp_path):
+    store = _store(tmp_path, 20, a=300, b=100, c=200)
+    assert store.evict() == 1
+    assert _keys(store) == ["a", "c"]
+    store.max_bytes = 10
+    assert store.evict() == 1
+    assert _keys(store) == ["a"]
+    assert store.stats()["evictions"] == 2
+
+
+def test_get_marks_entry_as_recently_used(tmp_path):
+    store = _store(tmp_path, 20, a=100, b=200, c=300)
+    assert store.get("a") == store.path_for("a")
+    assert store.evict() == 1
+    assert _keys(store) == ["a", "c"]
+    assert store.get("b") is None
+    assert (store.hits, store.misses) == (1, 1)
+
+
+def test_put_evicts_to_fit_the_budget(tmp_path):
+    store = _store(tmp_path, 30, a=100, b=200, c=300)
+    assert store.put_bytes("d", b"0123456789") == store.path_for("d")
+    assert _keys(store) == ["b", "c", "d"]
+    assert store.size() == 30
+
+    # An entry larger than the whole budget is not kept.
+    assert store.put_bytes("e", b"0" * 31) is None
+    assert store.size() <= 30
+
+
+def test_put_file_copies_the_source(tmp_path):
+    source = tmp_path / "export.fbx"
+    source.write_bytes(b"fbx")
+    store = ContentStore(tmp_path / "store", 100, ".fbx")
+    path = store.put_file("key", source)
+    source.write_bytes(b"changed")
+    assert path.read_bytes() == b"fbx"
+
+
+def test_store_without_budget_keeps_nothing(tmp_path):
+    for max_bytes in (0, -5):
+        store = ContentStore(tmp_path / "store", max_bytes, ".bin")
+        assert store.max_bytes == 0
+        assert store.put_bytes("a", b"data") is None
+        assert not store.directory.exists()
+        assert store.get("a") is None
+
+
+def test_clear_removes_only_entries(tmp_path):
+    store = _store(tmp_path, 100, a=100, b=200)
+    other = store.directory / "notes.txt"
+    other.write_text("kept")
+    temporary = store.directory / ".partial.bin"
+    temporary.write_bytes(b"kept")
+    assert store.clear() == 2
+    assert _keys(store) == []
+    assert other.exists() and temporary.exists()
+    assert store.stats()["entries"] == 0
@@ -0,0 +1,160 @@
+"""Lean FBX export checked against the bridge's reader and Blender's importer."""
+
+import numpy as np
+import pytest
+
+
+def _loop_arrays(mesh):
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    uv_layers = []
+    for layer in mesh.uv_layers:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        layer.data.foreach_get("uv", uvs)
+        uv_layers.append((layer.name, uvs))
+    return loop_vertices, uv_layers
+
+
+@pytest.fixture
+def scene(blender):
+    bpy = blender
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=12, y_subdivisions=9)
+    bpy.context.active_object.data.uv_layers.new(name="Second")
+    bpy.ops.mesh.primitive_monkey_add(location=(3.0, 0.0, 0.0))
+    bpy.context.active_object.modifiers.new("Subdivision", 'SUBSURF')
+    for obj in bpy.context.scene.objects:
+        obj.select_set(True)
+    return bpy
+
+
+def _export_lean(bpy):
+    from dks_ruv_bridge import dks_ruv
+
+    prefs = bpy.context.preferences.addons["dks_ruv_bridge"].preferences
+    prefs.option_export_engine = 'LEAN'
+    assert bpy.ops.dks_ruv.export() == {'FINISHED'}
+    return dks_ruv._load_state()["filepath"]
+
+
+def test_lean_export_reads_back(scene):
+    from dks_ruv_bridge import dks_ruv_fbx
+
+    bpy = scene
+    meshes = dks_ruv_fbx.read_uv_meshes(_export_lean(bpy))
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    assert sorted(meshes) == sorted(obj.name for obj in bpy.context.scene.objects)
+    for obj in bpy.context.scene.objects:
+        evaluated = obj.evaluated_get(depsgraph).to_mesh()
+        loop_vertices, uv_layers = _loop_arrays(evaluated)
+        mesh = meshes[obj.name]
+        assert mesh.vertex_count == len(evaluated.vertices)
+        np.testing.assert_array_equal(mesh.loop_vertices, loop_vertices)
+        assert [name for name, _ in mesh.uv_layers] == [name for name, _ in uv_layers]
+        for (_, coordinates), (_, expected) in zip(mesh.uv_layers, uv_layers):
+            np.testing.assert_array_equal(coordinates, expected)
+        obj.evaluated_get(depsgraph).to_mesh_clear()
+
+
+def test_lean_export_imports_in_blender(scene):
+    bpy = scene
+    filepath = _export_lean(bpy)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    expected = {}
+    for obj in bpy.context.scene.objects:
+        expected[obj.name] = _loop_arrays(obj.evaluated_get(depsgraph).to_mesh())
+        obj.evaluated_get(depsgraph).to_mesh_clear()
+
+    before = set(bpy.data.objects)
+    assert bpy.ops.import_scene.fbx(filepath=filepath) == {'FINISHED'}
+    imported = [obj for obj in bpy.data.objects if obj not in before]
+    assert len(imported) == len(expected)
+    for obj in imported:
+        loop_vertices, uv_layers = _loop_arrays(obj.data)
+        expected_vertices, expected_uvs = expected[obj.name.rsplit(".", 1)[0]]
+        np.testing.assert_array_equal(loop_vertices, expected_vertices)
+        assert [name for name, _ in uv_layers] == [name for name, _ in expected_uvs]
+        for (_, coordinates), (_, expected_coordinates) in zip(uv_layers, expected_uvs):
+            np.testing.assert_allclose(coordinates, expected_coordinates, atol=1e-6)
+
+
+def test_fingerprint_tracks_attributes_and_weights(blender):
+    from dks_ruv_bridge import dks_ruv
+
+    bpy = blender
+    bpy.ops.mesh.primitive_cube_add()
+    obj = bpy.context.active_object
+    mesh = obj.data
+    group = obj.vertex_groups.new(name="Mask")
+    group.add([0, 1, 2], 1.0, 'REPLACE')
+    modifier = obj.modifiers.new("Bevel", 'BEVEL')
+    modifier.limit_method = 'WEIGHT'
+
+    def fingerprint():
+        return dks_ruv._export_fingerprint([obj], ())
+
+    seen = {fingerprint()}
+    for change in (
+        lambda: mesh.attributes.new("crease_edge", 'FLOAT', 'EDGE').data[0].__setattr__("value", 1.0),
+        lambda: mesh.attributes["crease_edge"].data[3].__setattr__("value", 0.5),
+        lambda: mesh.attributes.new("bevel_weight_edge", 'FLOAT', 'EDGE').data[2].__setattr__("value", 1.0),
+        lambda: mesh.attributes.new("Custom", 'FLOAT_VECTOR', 'POINT').data[1].__setattr__("vector", (1, 2, 3)),
+        lambda: setattr(modifier, "vertex_group", "Mask"),
+        lambda: group.add([0], 0.25, 'REPLACE'),
+        lambda: group.add([5], 0.5, 'REPLACE'),
+    ):
+        change()
+        current = fingerprint()
+        assert current is not None and current not in seen
+        seen.add(current)
+
+    # Neither do selection changes or weights that no modifier reads.
+    mesh.vertices[0].select = not mesh.vertices[0].select
+    obj.vertex_groups.new(name="Unused").add([4], 1.0, 'REPLACE')
+    assert fingerprint() in seen
+
+
+def _cubes(bpy, count):
+    bpy.ops.mesh.primitive_cube_add()
+    cubes = [bpy.context.active_object]
+    for index in range(1, count):
+        cube = cubes[0].copy()
+        cube.data = cubes[0].data.copy()
+        cube.location.x = index * 3.0
+        bpy.context.scene.collection.objects.link(cube)
+        cubes.append(cube)
+    return cubes
+
+
+def test_geometry_groups_respect_modifiers(blender):
+    from dks_ruv_bridge import dks_ruv
+
+    first, second, third = _cubes(blender, 3)
+    second.modifiers.new("Bevel", 'BEVEL')
+    groups = dks_ruv._group_by_geometry([first, second, third], third)
+    assert groups == {third: [first], second: []}
+
+
+def test_cached_results_reach_every_geometry_duplicate(blender, tmp_path, monkeypatch):
+    from dks_ruv_bridge import dks_ruv
+
+    bpy = blender
+    monkeypatch.setattr(dks_ruv, "_result_cache_directory", lambda: tmp_path / "results")
+    monkeypatch.setattr(dks_ruv, "_result_store", None)
+    prefs = bpy.context.preferences.addons["dks_ruv_bridge"].preferences
+    prefs.option_dedupe_geometry = True
+    prefs.option_result_cache = True
+
+    cubes = _cubes(bpy, 3)
+    result = dks_ruv._fbx_mesh_from_object(cubes[0])
+    unwrapped = np.random.default_rng(0).random(result.loop_count * 2).astype(np.float32)
+    result.uv_layers = [("UVMap", unwrapped)]
+    positions, polygon_sizes, loop_vertices = dks_ruv._mesh_topology(cubes[0].data)
+    cache = dks_ruv._result_cache(prefs.option_result_cache_mb)
+    dks_ruv._store_result(cache, dks_ruv._result_key(cubes[0], positions, polygon_sizes, loop_vertices), result)
+
+    for cube in cubes:
+        cube.select_set(True)
+    assert bpy.ops.dks_ruv.export() == {'FINISHED'}
+    for cube in cubes:
+        _, uv_layers = _loop_arrays(cube.data)
+        np.testing.assert_array_equal(dict(uv_layers)["UVMap"], unwrapped)
@@ -0,0 +1,119 @@
+"""Round trips and corruption handling of the binary FBX reader and writer."""
+
+import numpy as np
+import pytest
+
+from dks_ruv_bridge import dks_ruv_fbx
+from dks_ruv_bridge.dks_ruv_fbx import FBXError, FBXMesh, FBXWriter
+
+from grids import quad_grid
+
+
+def _grid(name, size=5, uv_maps=("UVMap", "Second")):
+    """A quad grid with one corner split into two triangles and random UV maps."""
+
+    vertices, polygon_sizes, loop_vertices = quad_grid(size, extent=float(size), split_corner=True)
+    rng = np.random.default_rng(len(name))
+    uv_layers = [(uv_name, rng.random(len(loop_vertices) * 2).astype(np.float32)) for uv_name in uv_maps]
+    return FBXMesh(name, len(vertices) // 3, loop_vertices, polygon_sizes, uv_layers, vertices=vertices)
+
+
+def _write(path, meshes, **options):
+    writer = FBXWriter(**options)
+    for mesh in meshes:
+        writer.add_mesh(mesh)
+    writer.write(path)
+    return path
+
+
+def _assert_same(mesh, expected):
+    assert mesh.vertex_count == expected.vertex_count
+    np.testing.assert_array_equal(mesh.loop_vertices, expected.loop_vertices)
+    np.testing.assert_array_equal(mesh.polygon_sizes, expected.polygon_sizes)
+    assert [name for name, _ in mesh.uv_layers] == [name for name, _ in expected.uv_layers]
+    for (_, coordinates), (_, expected_coordinates) in zip(mesh.uv_layers, expected.uv_layers):
+        np.testing.assert_array_equal(coordinates, expected_coordinates)
+
+
+@pytest.mark.parametrize("version", [7400, 7500])
+@pytest.mark.parametrize("compression", [0, 1])
+def test_writer_round_trip(tmp_path, version, compression):
+    meshes = [_grid("Grid"), _grid("Small", size=2, uv_maps=("UVMap",))]
+    path = _write(tmp_path / "scene.fbx", meshes, version=version, compression=compression)
+
+    with open(path, "rb") as handle:
+        assert dks_ruv_fbx.parse(handle.read()).properties == [version]
+    read = dks_ruv_fbx.read_uv_meshes(path, with_vertices=True)
+    assert sorted(read) == ["Grid", "Small"]
+    for mesh in meshes:
+        _assert_same(read[mesh.name], mesh)
+        np.testing.assert_allclose(read[mesh.name].vertices, mesh.vertices)
+
+
+def test_writer_round_trip_with_workers(tmp_path):
+    meshes = [_grid(f"Grid{index}") for index in range(8)]
+    path = _write(tmp_path / "scene.fbx", meshes)
+    read = dks_ruv_fbx.read_uv_meshes(path, workers=4)
+    for mesh in meshes:
+        _assert_same(read[mesh.name], mesh)
+
+
+def test_blender_exported_file(fixtures):
+    expected = np.load(fixtures / "blender_mixed.npz")
+    read = dks_ruv_fbx.read_uv_meshes(fixtures / "blender_mixed.fbx", with_vertices=True)
+    assert sorted(read) == ["Cone", "Grid"]
+    for name, mesh in read.items():
+        np.testing.assert_array_equal(mesh.loop_vertices, expected[f"{name}/loop_vertices"])
+        np.testing.assert_array_equal(mesh.polygon_sizes, expected[f"{name}/polygon_sizes"])
+        uv_names = [key.rsplit("/", 1)[1] for key in expected.files if key.startswith(f"{name}/uv/")]
+        assert [uv_name for uv_name, _ in mesh.uv_layers] == uv_names
+        for uv_name, coordinates in mesh.uv_layers:
+            np.testing.assert_allclose(coordinates, expected[f"{name}/uv/{uv_name}"], atol=1e-6)
+        assert len(mesh.vertices) == mesh.vertex_count * 3
+
+
+@pytest.mark.parametrize("version", [7400, 7500])
+def test_corrupted_bytes_raise_fbx_error(tmp_path, version):
+    path = _write(tmp_path / "scene.fbx", [_grid("Grid", size=3)], version=version, compression=1)
+    data = path.read_bytes()
+    rng = np.random.default_rng(version)
+    corrupted = tmp_path / "corrupted.fbx"
+    # Every byte of the node records, each replaced by a few different values.
+    for offset in range(len(data) - 176):
+        for value in {0x00, 0xff, data[offset] ^ 0x01, int(rng.integers(256))}:
+            if value == data[offset]:
+                continue
+            corrupted.write_bytes(data[:offset] + bytes((value,)) + data[offset + 1:])
+            try:
+                meshes = dks_ruv_fbx.read_uv_meshes(corrupted)
+            except FBXError:
+                continue
+            for mesh in meshes.values():
+                assert mesh.polygon_sizes.sum() == mesh.loop_count
+                for _, coordinates in mesh.uv_layers:
+                    assert len(coordinates) == mesh.loop_count * 2
+
+
+def test_truncated_file_raises_fbx_error(tmp_path):
+    path = _write(tmp_path / "scene.fbx", [_grid("Grid", size=3)])
+    data = path.read_bytes()
+    for length in range(0, len(data), 7):
+        path.write_bytes(data[:length])
+        try:
+            dks_ruv_fbx.read_uv_meshes(path)
+        except FBXError:
+            pass
+
+
+def test_uv_index_out_of_range(tmp_path):
+    mesh = _grid("Grid", size=2, uv_maps=("UVMap",))
+    path = _write(tmp_path / "scene.fbx", [mesh], compression=0)
+    data = bytearray(path.read_bytes())
+    # Point the last UVIndex entry past the end of the UV array.
+    marker = data.index(b"UVIndex") + len(b"UVIndex")
+    count = int.from_bytes(data[marker + 1:marker + 5], "little")
+    last = marker + 1 + 12 + (count - 1) * 4
+    data[last:last + 4] = (10 ** 6).to_bytes(4, "little")
+    path.write_bytes(bytes(data))
+    with pytest.raises(FBXError, match="UVIndex"):
+        dks_ruv_fbx.read_uv_meshes(path)
@@ -0,0 +1,248 @@
+"""Importing RizomUV results back onto the exported objects."""
+
+import numpy as np
+
+
+def test_mesh_arrays_match_element_properties(blender):
+    from dks_ruv_bridge import dks_ruv
+
+    bpy = blender
+    bpy.ops.mesh.primitive_monkey_add()
+    mesh = bpy.context.active_object.data
+    for name, (_prop, collection, fallback) in dks_ruv._MESH_ARRAYS.items():
+        elements = getattr(mesh, collection)
+        width = len(np.ravel(getattr(elements[0], fallback)))
+        dtype = np.float32 if name == "position" else np.int32
+        expected = np.empty(len(elements) * width, dtype=dtype)
+        elements.foreach_get(fallback, expected)
+        actual = dks_ruv._read_mesh_array(mesh, name, np.empty(len(elements) * width, dtype=dtype))
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_blender_importer_fallback_keeps_selection(blender, fixtures):
+    from dks_ruv_bridge import dks_ruv
+
+    bpy = blender
+    for index in range(6):
+        bpy.ops.mesh.primitive_cube_add(location=(index * 3.0, 0.0, 0.0))
+    objects = list(bpy.context.scene.objects)
+    objects[1].select_set(False)
+    objects[4].select_set(False)
+    bpy.context.view_layer.objects.active = objects[2]
+    selection = {obj.name: obj.select_get() for obj in objects}
+    object_names = set(bpy.data.objects.keys())
+    mesh_names = set(bpy.data.meshes.keys())
+    scene_count = len(bpy.data.scenes)
+
+    meshes = dks_ruv._import_fbx(bpy.context, fixtures / "blender_mixed.fbx")
+
+    expected = np.load(fixtures / "blender_mixed.npz")
+    assert sorted(meshes) == ["Cone", "Grid"]
+    for name, mesh in meshes.items():
+        np.testing.assert_array_equal(mesh.loop_vertices, expected[f"{name}/loop_vertices"])
+    assert {obj.name: obj.select_get() for obj in objects} == selection
+    assert bpy.context.view_layer.objects.active == objects[2]
+    assert set(bpy.data.objects.keys()) == object_names
+    assert set(bpy.data.meshes.keys()) == mesh_names
+    assert len(bpy.data.scenes) == scene_count
+
+
+def test_round_trip_through_lean_export(blender):
+    from dks_ruv_bridge import dks_ruv, dks_ruv_fbx
+
+    bpy = blender
+    prefs = bpy.context.preferences.addons["dks_ruv_bridge"].preferences
+    prefs.option_export_engine = 'LEAN'
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=8, y_subdivisions=8)
+    grid = bpy.context.active_object
+    linked = grid.copy()
+    bpy.context.scene.collection.objects.link(linked)
+    linked.select_set(True)
+    assert bpy.ops.dks_ruv.export() == {'FINISHED'}
+
+    # Stand in for RizomUV: write new UVs into the exported file.
+    filepath = dks_ruv._load_state()["filepath"]
+    meshes = dks_ruv_fbx.read_uv_meshes(filepath, with_vertices=True)
+    mesh = meshes[grid.name]
+    unwrapped = np.random.default_rng(1).random(mesh.loop_count * 2).astype(np.float32)
+    mesh.uv_layers = [("UVMap", unwrapped)]
+    writer = dks_ruv_fbx.FBXWriter()
+    writer.add_mesh(mesh)
+    writer.write(filepath)
+
+    assert getattr(bpy.ops.dks_ruv, "import")('EXEC_DEFAULT') == {'FINISHED'}
+    coordinates = np.empty(mesh.loop_count * 2, dtype=np.float32)
+    linked.data.uv_layers["UVMap"].data.foreach_get("uv", coordinates)
+    np.testing.assert_array_equal(coordinates, unwrapped)
+
+
+def test_transfer_by_position_after_subdivision(blender):
+    from dks_ruv_bridge import dks_ruv, dks_ruv_fbx
+
+    bpy = blender
+    prefs = bpy.context.preferences.addons["dks_ruv_bridge"].preferences
+    prefs.option_export_engine = 'LEAN'
+    prefs.option_transfer_by_position = True
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=10, y_subdivisions=10, size=2.0)
+    grid = bpy.context.active_object
+    modifier = grid.modifiers.new("Subdivision", 'SUBSURF')
+    modifier.subdivision_type = 'SIMPLE'
+    assert bpy.ops.dks_ruv.export() == {'FINISHED'}
+
+    # The result holds the subdivided mesh, with UVs following the positions.
+    filepath = dks_ruv._load_state()["filepath"]
+    mesh = dks_ruv_fbx.read_uv_meshes(filepath, with_vertices=True)[grid.name]
+    corners = mesh.vertices.reshape(-1, 3)[mesh.loop_vertices]
+    mesh.uv_layers = [("UVMap", ((corners[:, :2] + 1.0) / 2.0).astype(np.float32).reshape(-1))]
+    writer = dks_ruv_fbx.FBXWriter()
+    writer.add_mesh(mesh)
+    writer.write(filepath)
+
+    assert getattr(bpy.ops.dks_ruv, "import")('EXEC_DEFAULT') == {'FINISHED'}
+    positions, _sizes, loop_vertices = dks_ruv._mesh_topology(grid.data)
+    expected = (positions.reshape(-1, 3)[loop_vertices][:, :2] + 1.0) / 2.0
+    coordinates = np.empty(len(loop_vertices) * 2, dtype=np.float32)
+    grid.data.uv_layers["UVMap"].data.foreach_get("uv", coordinates)
+    # Every corner takes the UV of a nearby loop of the subdivided result.
+    assert np.abs(coordinates.reshape(-1, 2) - expected).max() < 0.05
+
+
+class _Reports:
+    def __init__(self):
+        self.messages = []
+
+    def report(self, levels, message):
+        self.messages.append((next(iter(levels)), message))
+
+
+def test_import_run_skips_deleted_and_edited_targets(blender):
+    from dks_ruv_bridge import dks_ruv
+
+    bpy = blender
+    grids = []
+    for index in range(3):
+        bpy.ops.mesh.primitive_grid_add(x_subdivisions=4, y_subdivisions=4, location=(index * 3.0, 0.0, 0.0))
+        grids.append(bpy.context.active_object)
+    originals = {grid.name: dks_ruv._fbx_mesh_from_object(grid) for grid in grids}
+    results = {}
+    for name, mesh in originals.items():
+        unwrapped = np.random.default_rng(len(results)).random(mesh.loop_count * 2).astype(np.float32)
+        results[name] = dks_ruv.FBXMesh(name, mesh.vertex_count, mesh.loop_vertices, mesh.polygon_sizes,
+                                        [("UVMap", unwrapped)])
+    first, deleted, edited = (grid.name for grid in grids)
+
+    run = dks_ruv._ImportRun({}, [(grid.name, grid) for grid in grids], False, keep_originals=True)
+    run.imported_meshes = results
+    run.begin(bpy.context)
+    reports = _Reports()
+    run.apply_next(reports)
+    bpy.data.objects.remove(grids[1])
+    bpy.context.view_layer.objects.active = grids[2]
+    bpy.ops.object.mode_set(mode='EDIT')
+    run.apply_next(reports)
+    run.apply_next(reports)
+    assert run.done
+    assert [level for level, _message in reports.messages] == ['WARNING', 'WARNING']
+    assert deleted in reports.messages[0][1] and edited in reports.messages[1][1]
+
+    changed = dks_ruv._fbx_mesh_from_object(bpy.data.objects[first])
+    np.testing.assert_array_equal(changed.uv_layers[0][1], results[first].uv_layers[0][1])
+    assert run.rollback() == 1
+    restored = dks_ruv._fbx_mesh_from_object(bpy.data.objects[first])
+    np.testing.assert_array_equal(restored.uv_layers[0][1], originals[first].uv_layers[0][1])
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def _uvs(obj):
+    coordinates = np.empty(len(obj.data.loops) * 2, dtype=np.float32)
+    obj.data.uv_layers["UVMap"].data.foreach_get("uv", coordinates)
+    return coordinates
+
+
+def _export_only(bpy, obj):
+    """Export ``obj`` and return whether the export file was written."""
+
+    from dks_ruv_bridge import dks_ruv
+
+    for other in bpy.context.scene.objects:
+        other.select_set(other == obj)
+    bpy.context.view_layer.objects.active = obj
+    export_file = dks_ruv._export_filename(obj)
+    export_file.unlink(missing_ok=True)
+    assert bpy.ops.dks_ruv.export() == {'FINISHED'}
+    return export_file.is_file()
+
+
+def test_result_cache_reuses_unwraps_until_the_mesh_changes(blender, tmp_path, monkeypatch):
+    from dks_ruv_bridge import dks_ruv, dks_ruv_fbx
+
+    bpy = blender
+    monkeypatch.setattr(dks_ruv, "_result_cache_directory", lambda: tmp_path / "results")
+    monkeypatch.setattr(dks_ruv, "_result_store", None)
+    prefs = bpy.context.preferences.addons["dks_ruv_bridge"].preferences
+    prefs.option_export_engine = 'LEAN'
+    prefs.option_export_cache_mb = 0
+    prefs.option_result_cache = True
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=6, y_subdivisions=6)
+    grid = bpy.context.active_object
+    assert _export_only(bpy, grid)
+
+    filepath = dks_ruv._load_state()["filepath"]
+    mesh = dks_ruv_fbx.read_uv_meshes(filepath, with_vertices=True)[grid.name]
+    unwrapped = np.random.default_rng(2).random(mesh.loop_count * 2).astype(np.float32)
+    mesh.uv_layers = [("UVMap", unwrapped)]
+    writer = dks_ruv_fbx.FBXWriter()
+    writer.add_mesh(mesh)
+    writer.write(filepath)
+    assert getattr(bpy.ops.dks_ruv, "import")('EXEC_DEFAULT') == {'FINISHED'}
+
+    # The grid already holds the remembered unwrap: send it to RizomUV again.
+    assert _export_only(bpy, grid)
+
+    copy = grid.copy()
+    copy.data = grid.data.copy()
+    bpy.context.scene.collection.objects.link(copy)
+    copy.data.uv_layers["UVMap"].data.foreach_set("uv", np.zeros(mesh.loop_count * 2, dtype=np.float32))
+    assert not _export_only(bpy, copy)
+    np.testing.assert_array_equal(_uvs(copy), unwrapped)
+
+    # Seams, pins and modifiers are part of the key.
+    copy.data.uv_layers["UVMap"].data.foreach_set("uv", np.zeros(mesh.loop_count * 2, dtype=np.float32))
+    copy.data.edges[0].use_seam = True
+    assert _export_only(bpy, copy)
+    copy.data.edges[0].use_seam = False
+    copy.data.uv_layers["UVMap"].data[0].pin_uv = True
+    assert _export_only(bpy, copy)
+    copy.data.uv_layers["UVMap"].data[0].pin_uv = False
+    copy.modifiers.new("Triangulate", 'TRIANGULATE')
+    assert _export_only(bpy, copy)
+    assert not _uvs(copy).any()
+
+
+def test_rollback_restores_removed_uv_maps(blender):
+    from dks_ruv_bridge import dks_ruv
+
+    bpy = blender
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=4, y_subdivisions=4)
+    grid = bpy.context.active_object
+    extra = grid.data.uv_layers.new(name="Extra")
+    extra.data.foreach_set("uv", np.full(len(grid.data.loops) * 2, 0.5, dtype=np.float32))
+    grid.data.uv_layers.active = extra
+    before, active = dks_ruv._uv_snapshot(grid.data)
+
+    mesh = dks_ruv._fbx_mesh_from_object(grid)
+    unwrapped = np.random.default_rng(3).random(mesh.loop_count * 2).astype(np.float32)
+    mesh.uv_layers = [("UVMap", unwrapped)]
+    run = dks_ruv._ImportRun({}, [(grid.name, grid)], True, keep_originals=True)
+    run.imported_meshes = {grid.name: mesh}
+    run.begin(bpy.context)
+    run.apply_next(_Reports())
+    run.end(bpy.context)
+    assert grid.data.uv_layers.keys() == ["UVMap"]
+
+    assert run.rollback() == 1
+    after, restored_active = dks_ruv._uv_snapshot(grid.data)
+    assert restored_active == active == "Extra"
+    assert dict(after).keys() == dict(before).keys()
+    for name, coordinates in before:
+        np.testing.assert_array_equal(dict(after)[name], coordinates)
@@ -0,0 +1,110 @@
+"""Reuse, health checks and reconnects of the RizomUVLink session."""
+
+import pytest
+
+from dks_ruv_bridge.dks_ruv_link import LinkSession
+
+from rizomuv_standin import LinkError, StandInRizomUV
+
+
+def _session(rizomuv, **options):
+    sleeps = []
+    session = LinkSession(rizomuv.link, sleep=sleeps.append, **options)
+    return session, sleeps
+
+
+def _version(link):
+    link.RizomUVVersion()
+
+
+def test_link_is_health_checked_and_reused():
+    rizomuv = StandInRizomUV()
+    session, sleeps = _session(rizomuv)
+    port = session.send("rizomuv", None, _version)
+    assert session.send("rizomuv", port, _version) == port
+    assert session.send("rizomuv", None, _version) == port
+    assert rizomuv.launched == ["rizomuv"]
+    assert [reused for _connect, _send, reused in session.latencies] == [False, True, True]
+    stats = session.stats()
+    assert (stats["launches"], stats["reuses"], stats["connects"], stats["sends"]) == (1, 2, 0, 3)
+    assert stats["mean_connect_ms"] >= 0.0 and stats["mean_send_ms"] >= 0.0
+    assert sleeps == []
+
+
+def test_new_session_connects_to_a_running_instance():
+    rizomuv = StandInRizomUV()
+    first, _sleeps = _session(rizomuv)
+    port = first.send("rizomuv", None, _version)
+
+    second, sleeps = _session(rizomuv)
+    assert second.send("rizomuv", port, _version) == port
+    assert (second.connects, second.launches) == (1, 0)
+    assert len(rizomuv.instances) == 1 and sleeps == []
+
+
+def test_reconnect_backs_off_before_it_succeeds():
+    rizomuv = StandInRizomUV()
+    port = LinkSession(rizomuv.link).send("rizomuv", None, _version)
+
+    rizomuv.refusals = 2
+    session, sleeps = _session(rizomuv, max_attempts=3, base_delay=0.1)
+    assert session.send("rizomuv", port, _version) == port
+    assert (session.connects, session.launches) == (1, 0)
+    assert sleeps == pytest.approx([0.1, 0.2])
+
+
+def test_dead_instance_fails_the_health_check_and_is_relaunched():
+    rizomuv = StandInRizomUV()
+    session, sleeps = _session(rizomuv, max_attempts=4, base_delay=0.5, max_delay=0.8)
+    port = session.send("rizomuv", None, _version)
+    rizomuv.instances[port].alive = False
+
+    new_port = session.send("rizomuv", port, _version)
+    assert new_port != port and rizomuv.instances[new_port].alive
+    assert (session.failed_checks, session.connects, session.launches) == (1, 0, 2)
+    # Bounded exponential backoff between the reconnect attempts.
+    assert sleeps == pytest.approx([0.5, 0.8, 0.8])
+
+
+def test_failed_command_drops_the_link():
+    rizomuv = StandInRizomUV()
+    session, _sleeps = _session(rizomuv)
+    port = session.send("rizomuv", None, _version)
+
+    def fail(link):
+        raise LinkError("command failed")
+
+    with pytest.raises(LinkError):
+        session.send("rizomuv", port, fail)
+    assert session.link is None and len(session.latencies) == 1
+
+    # The instance is still alive, so the next send reconnects to it.
+    assert session.send("rizomuv", port, _version) == port
+    assert (session.connects, session.launches) == (1, 1)
+
+
+def test_launch_errors_reach_the_caller():
+    class Broken:
+        def RunRizomUV(self, exe_path):
+            raise LinkError(f"{exe_path} not found")
+
+    session = LinkSession(Broken, sleep=lambda seconds: None)
+    with pytest.raises(LinkError, match="not found"):
+        session.send("missing", None, _version)
+    assert session.link is None and session.launches == 0
+
+
+def test_shutdown_quits_only_launched_instances():
+    rizomuv = StandInRizomUV()
+    running = LinkSession(rizomuv.link).send("rizomuv", None, _version)
+
+    # An instance the session only connected to keeps running.
+    session, _sleeps = _session(rizomuv)
+    session.send("rizomuv", running, _version)
+    assert session.shutdown() == 0
+    assert rizomuv.instances[running].alive and session.link is None
+
+    launched = session.send("rizomuv", None, _version)
+    assert launched != running
+    assert session.shutdown() == 1
+    assert not rizomuv.instances[launched].alive and rizomuv.instances[running].alive
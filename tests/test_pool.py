@@ -0,0 +1,124 @@
+"""The RizomUV worker pool against the stand-in link."""
+
+import threading
+
+import pytest
+
+from dks_ruv_bridge.dks_ruv_pool import BatchJob, WorkerPool
+
+from rizomuv_standin import StandInRizomUV, unwrap
+
+
+def _jobs(tmp_path, names):
+    jobs = []
+    for name in names:
+        source = tmp_path / f"{name}.fbx"
+        source.write_bytes(name.encode("utf8"))
+        jobs.append(BatchJob(name, source, tmp_path / f"{name}_out.fbx"))
+    return jobs
+
+
+def _run(pool, jobs, process=unwrap, timeout=10.0):
+    """Run the pool on a thread so a pool that never returns fails the test."""
+
+    runner = threading.Thread(target=pool.run, args=(jobs, process), daemon=True)
+    runner.start()
+    runner.join(timeout)
+    assert not runner.is_alive(), "the pool did not finish"
+    return jobs
+
+
+def _assert_unwrapped(jobs):
+    for job in jobs:
+        assert job.succeeded, job.error
+        assert job.output.read_bytes() == b"unwrapped:" + job.name.encode("utf8")
+
+
+def test_jobs_are_spread_over_workers(tmp_path):
+    rizomuv = StandInRizomUV()
+    pool = WorkerPool(rizomuv.link, "rizomuv", 3)
+    jobs = _run(pool, _jobs(tmp_path, [f"mesh{index}" for index in range(12)]))
+    _assert_unwrapped(jobs)
+    assert len(rizomuv.instances) == 3
+    assert len({job.port for job in jobs}) == 3
+    assert pool.stats()["completed"] == 12
+
+
+def test_idle_workers_steal_queued_jobs(tmp_path):
+    # Jobs are dealt round robin, so the first worker is stuck on the slow job
+    # while its other jobs wait in its queue.
+    names = ["slow"] + [f"mesh{index}" for index in range(7)]
+    rizomuv = StandInRizomUV(durations={"slow.fbx": 0.3})
+    pool = WorkerPool(rizomuv.link, "rizomuv", 2)
+    jobs = _run(pool, _jobs(tmp_path, names))
+    _assert_unwrapped(jobs)
+    assert pool.steals > 0
+    slow_port = jobs[0].port
+    assert all(job.port != slow_port for job in jobs[2::2])
+
+
+def test_crashed_instance_is_relaunched(tmp_path):
+    rizomuv = StandInRizomUV(crashes={"crashy.fbx": 1})
+    pool = WorkerPool(rizomuv.link, "rizomuv", 1)
+    jobs = _run(pool, _jobs(tmp_path, ["before", "crashy", "after"]))
+    _assert_unwrapped(jobs)
+    assert jobs[1].attempts == 2
+    assert pool.stats()["launches"] == 2
+    assert jobs[0].port != jobs[2].port
+
+
+def test_failed_job_is_requeued_on_an_idle_worker(tmp_path):
+    # The second worker crashes twice on the same job and retires while the
+    # first worker, done with its own job, waits; the job must still run.
+    rizomuv = StandInRizomUV(crashes={"crashy.fbx": 2}, durations={"crashy.fbx": 0.1})
+    pool = WorkerPool(rizomuv.link, "rizomuv", 2, max_attempts=3, max_restarts=0)
+    jobs = _run(pool, _jobs(tmp_path, ["quick", "crashy"]))
+    _assert_unwrapped(jobs)
+    assert jobs[1].attempts == 3
+    assert jobs[1].port == jobs[0].port
+    assert pool.stats()["retired"] == 1
+
+
+def test_job_fails_after_its_attempts(tmp_path):
+    rizomuv = StandInRizomUV(crashes={"broken.fbx": 10})
+    pool = WorkerPool(rizomuv.link, "rizomuv", 2, max_attempts=2)
+    jobs = _run(pool, _jobs(tmp_path, ["broken", "fine"]))
+    assert not jobs[0].succeeded and jobs[0].attempts == 2
+    assert "crashed" in str(jobs[0].error)
+    _assert_unwrapped(jobs[1:])
+
+
+def test_jobs_fail_when_every_worker_retired(tmp_path):
+    # The first crash relaunches RizomUV, the second one retires the only
+    # worker while a job is still waiting in its queue.
+    rizomuv = StandInRizomUV(crashes={"broken.fbx": 10, "also_broken.fbx": 10})
+    pool = WorkerPool(rizomuv.link, "rizomuv", 1, max_attempts=5, max_restarts=0)
+    jobs = _run(pool, _jobs(tmp_path, ["broken", "also_broken", "waiting"]))
+    assert pool.stats()["retired"] == 1
+    assert not any(job.succeeded for job in jobs)
+    assert "crashed" in str(jobs[0].error) and "crashed" in str(jobs[1].error)
+    assert jobs[2].attempts == 0 and "No RizomUV worker" in str(jobs[2].error)
+
+    more = _run(pool, _jobs(tmp_path, ["later"]))
+    assert "No RizomUV worker" in str(more[0].error)
+
+
+@pytest.mark.parametrize("size", [1, 4])
+def test_many_jobs_with_random_crashes(tmp_path, size):
+    names = [f"mesh{index}" for index in range(40)]
+    rizomuv = StandInRizomUV(crashes={f"mesh{index}.fbx": 1 for index in range(0, 40, 7)})
+    pool = WorkerPool(rizomuv.link, "rizomuv", size, max_attempts=2, max_restarts=10)
+    jobs = _run(pool, _jobs(tmp_path, names))
+    _assert_unwrapped(jobs)
+
+
+def test_release_quits_the_instances_the_pool_launched(tmp_path):
+    rizomuv = StandInRizomUV(crashes={"crashy.fbx": 1})
+    pool = WorkerPool(rizomuv.link, "rizomuv", 2)
+    _run(pool, _jobs(tmp_path, ["crashy", "fine", "more"]))
+    assert len(rizomuv.instances) == 3
+
+    # The crashed instance is gone already; the two running ones are closed.
+    assert pool.release() == 2
+    assert not any(instance.alive for instance in rizomuv.instances.values())
+    assert pool.release() == 0
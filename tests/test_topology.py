@@ -0,0 +1,47 @@
+"""Loop remapping and position matching between meshes."""
+
+import numpy as np
+
+from dks_ruv_bridge.dks_ruv_topology import loop_samples, match_loops_by_position, remap_loops
+
+from grids import quad_grid
+
+
+def test_remap_loops_recovers_polygon_and_corner_order():
+    _positions, sizes, loop_vertices = quad_grid(6, bend=0.2)
+    rng = np.random.default_rng(0)
+    polygons = loop_vertices.reshape(-1, 4)
+    shuffled = np.stack([np.roll(polygon, int(rng.integers(4))) for polygon in polygons[rng.permutation(len(polygons))]])
+    order = remap_loops(sizes, shuffled.reshape(-1), sizes, loop_vertices)
+    assert order is not None
+    np.testing.assert_array_equal(shuffled.reshape(-1)[order], loop_vertices)
+
+
+def test_match_identical_meshes_in_different_order():
+    positions, sizes, loop_vertices = quad_grid(12, bend=0.2)
+    points, normals = loop_samples(positions, sizes, loop_vertices)
+    permutation = np.random.default_rng(1).permutation(len(points))
+    order = match_loops_by_position(points[permutation], normals[permutation], points, normals)
+    np.testing.assert_array_equal(permutation[order], np.arange(len(points)))
+
+
+def test_match_subdivided_mesh():
+    source = loop_samples(*quad_grid(16, bend=0.2))
+    target = loop_samples(*quad_grid(48, bend=0.2))
+    order = match_loops_by_position(*source, *target)
+    assert np.mean(order < 0) < 0.01
+    matched = order >= 0
+    distances = np.linalg.norm(target[0][matched] - source[0][order[matched]], axis=1)
+    assert distances.max() < 1.5 / 16
+
+
+def test_match_keeps_sides_of_thin_shells_apart():
+    positions, sizes, loop_vertices = quad_grid(8, bend=0.2)
+    # A second sheet just above the first, facing the other way.
+    flipped = loop_vertices.reshape(-1, 4)[:, ::-1].reshape(-1) + len(positions) // 3
+    shell_positions = np.concatenate([positions, positions + np.tile([0.0, 0.0, 1e-3], len(positions) // 3)])
+    shell_sizes = np.concatenate([sizes, sizes])
+    shell_loops = np.concatenate([loop_vertices, flipped])
+    points, normals = loop_samples(shell_positions, shell_sizes, shell_loops)
+    order = match_loops_by_position(points, normals, points[::-1].copy(), normals[::-1].copy())
+    np.testing.assert_array_equal(order, np.arange(len(points))[::-1])